@@ -0,0 +1,74 @@
+"""
+Compare decoding a 1000 item data asset search results page with dataclasses_json's
+from_dict and with codeocean.models.decoder, eagerly and lazily (reading the id,
+name and state of every result).
+
+Usage: python benchmarks/decode.py [--items N] [--repeat N]
+"""
+import argparse
+import timeit
+
+from codeocean.models.data_asset import DataAssetSearchResults
+from codeocean.models.decoder import decode
+
+
+def make_page(items: int) -> dict:
+    return {
+        "has_more": True,
+        "next_token": "token",
+        "results": [
+            {
+                "id": f"da-{i}",
+                "created": 1700000000 + i,
+                "name": f"Data asset {i}",
+                "mount": f"data-{i}",
+                "state": "ready",
+                "type": "result" if i % 2 else "dataset",
+                "last_used": 0,
+                "owner": "user-1",
+                "description": "Benchmark data asset",
+                "tags": ["benchmark", "decode"],
+                "size": 1024 * i,
+                "provenance": {
+                    "commit": "abc123",
+                    "run_script": "code/run",
+                    "docker_image": "registry/image:latest",
+                    "capsule": "capsule-1",
+                    "data_assets": ["da-a", "da-b"],
+                    "computation": f"computation-{i}",
+                },
+                "source_bucket": {"origin": "aws", "bucket": "bucket", "prefix": f"prefix/{i}"},
+                "contained_data_assets": [{"id": "da-a", "mount": "a", "size": 1}],
+                "app_parameters": [{"name": "param", "value": str(i)}],
+                "custom_metadata": {"project": "benchmark"},
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = make_page(args.items)
+    assert decode(DataAssetSearchResults, page) == DataAssetSearchResults.from_dict(page)
+
+    from_dict = min(timeit.repeat(lambda: DataAssetSearchResults.from_dict(page), number=1, repeat=args.repeat))
+    decoder = min(timeit.repeat(lambda: decode(DataAssetSearchResults, page), number=1, repeat=args.repeat))
+    lazy = min(timeit.repeat(lambda: read_summary(page), number=1, repeat=args.repeat))
+
+    print(f"from_dict:    {from_dict * 1000:8.2f} ms/page")
+    print(f"decoder:      {decoder * 1000:8.2f} ms/page ({from_dict / decoder:.1f}x)")
+    print(f"lazy decoder: {lazy * 1000:8.2f} ms/page ({from_dict / lazy:.1f}x)")
+
+
+def read_summary(page: dict) -> list:
+    results = decode(DataAssetSearchResults, page, lazy=True).results
+    return [(r.id, r.name, r.state) for r in results]
+
+
+if __name__ == "__main__":
+    main()
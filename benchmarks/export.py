@@ -0,0 +1,46 @@
+"""
+Compare building a pandas DataFrame of data asset search results row by row from
+to_dict with codeocean.export.to_pandas, and their memory use.
+
+Usage: python benchmarks/export.py [--items N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+from codeocean.export import to_pandas
+from codeocean.models.data_asset import DataAsset
+from codeocean.models.decoder import decode
+
+sys.path.insert(0, os.path.dirname(__file__))
+from decode import make_page  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data_assets = decode(list[DataAsset], make_page(args.items)["results"])
+
+    def by_rows():
+        return pd.DataFrame([da.to_dict() for da in data_assets])
+
+    def export():
+        return to_pandas(data_assets, dictionary_fields=["owner"])
+
+    rows_time = min(timeit.repeat(by_rows, number=1, repeat=args.repeat))
+    export_time = min(timeit.repeat(export, number=1, repeat=args.repeat))
+    rows_memory = by_rows().memory_usage(deep=True).sum()
+    export_memory = export().memory_usage(deep=True).sum()
+
+    print(f"row by row: {rows_time * 1000:8.1f} ms {rows_memory / 2**20:8.1f} MiB")
+    print(f"to_pandas:  {export_time * 1000:8.1f} ms {export_memory / 2**20:8.1f} MiB ({rows_time / export_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compare the JSON backends on realistic payloads: a data asset search results page
+and a large folder listing (decoding response bytes), and a search request body
+(encoding).
+
+Usage: python benchmarks/json_backends.py [--items N] [--repeat N]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+from codeocean.json_backend import JSON_BACKENDS, get_json_backend
+
+sys.path.insert(0, os.path.dirname(__file__))
+from decode import make_page  # noqa: E402
+
+
+def make_folder(items: int) -> dict:
+    return {
+        "items": [
+            {"name": f"file-{i}.csv", "path": f"results/output/file-{i}.csv", "type": "file", "size": 4096 * i}
+            for i in range(items)
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        "search page": json.dumps(make_page(args.items)).encode(),
+        "folder listing": json.dumps(make_folder(args.items * 10)).encode(),
+    }
+    request_body = {"query": "name:result", "limit": 1000, "filters": [{"key": "tags", "values": ["a", "b"]}]}
+
+    backends = []
+    for name in JSON_BACKENDS:
+        try:
+            backends.append(get_json_backend(name))
+        except ImportError:
+            print(f"{name}: not installed")
+
+    for label, payload in payloads.items():
+        print(f"decode {label} ({len(payload) / 1024:.0f} KiB)")
+        for backend in backends:
+            seconds = min(timeit.repeat(lambda: backend.loads(payload), number=1, repeat=args.repeat))
+            print(f"  {backend.name:8} {seconds * 1000:8.2f} ms")
+
+    print("encode search request body")
+    for backend in backends:
+        seconds = min(timeit.repeat(lambda: backend.dumps(request_body), number=10000, repeat=5)) / 10000
+        print(f"  {backend.name:8} {seconds * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
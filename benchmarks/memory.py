@@ -0,0 +1,64 @@
+"""
+Measure the memory held per DataAsset object with the slotted models, compared to
+the same frozen dataclass without __slots__ (how the models were defined before).
+
+Both kinds of objects share the same field values, so the difference is the
+per-instance overhead alone.
+
+Usage: python benchmarks/memory.py [--count N]
+"""
+import argparse
+import dataclasses
+import gc
+import os
+import sys
+import tracemalloc
+
+from codeocean.models.data_asset import DataAsset, DataAssetSearchResults
+from codeocean.models.decoder import decode
+
+sys.path.insert(0, os.path.dirname(__file__))
+from decode import make_page  # noqa: E402
+
+
+def unslotted(cls):
+    """Recreate a model as a regular frozen dataclass with a per-instance __dict__."""
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        [(f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+         for f in dataclasses.fields(cls)],
+        frozen=True,
+    )
+
+
+def bytes_per_object(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    assets = decode(DataAssetSearchResults, make_page(1000)).results
+    values = [{f.name: getattr(asset, f.name) for f in dataclasses.fields(asset)} for asset in assets]
+    Unslotted = unslotted(DataAsset)
+
+    before = bytes_per_object(lambda i: Unslotted(**values[i % len(values)]), args.count)
+    after = bytes_per_object(lambda i: DataAsset(**values[i % len(values)]), args.count)
+
+    print(f"{args.count} DataAsset objects")
+    print(f"without __slots__: {before:7.0f} bytes/object")
+    print(f"with __slots__:    {after:7.0f} bytes/object")
+    print(f"saved:             {before - after:7.0f} bytes/object ({1 - after / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import asyncio
+import os
+
+from codeocean.aio import AsyncCodeOcean
+from codeocean.computation import RunParams
+
+
+async def main():
+    # Create the async client using your domain and API token.
+
+    async with AsyncCodeOcean(domain=os.environ["CODEOCEAN_URL"], token=os.environ["API_TOKEN"]) as client:
+
+        # Run several capsules concurrently over the shared connection pool.
+
+        capsule_ids = os.environ["CAPSULE_IDS"].split(",")
+
+        computations = await asyncio.gather(
+            *(client.computations.run_capsule(RunParams(capsule_id=capsule_id)) for capsule_id in capsule_ids)
+        )
+
+        # Wait for all computations to finish.
+
+        computations = await asyncio.gather(
+            *(client.computations.wait_until_completed(c) for c in computations)
+        )
+
+        for computation in computations:
+            print(computation.id, computation.state)
+
+
+asyncio.run(main())
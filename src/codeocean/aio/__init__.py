@@ -0,0 +1 @@
+from codeocean.aio.client import AsyncCodeOcean  # noqa: F401
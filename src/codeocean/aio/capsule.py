@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+import httpx
+
+from codeocean.aio.pagination import iterate_pages, iterate_results
+from codeocean.aio.streaming import iter_json_array
+from codeocean.models.capsule import (
+    Capsule,
+    CapsuleSearchParams,
+    CapsuleSearchResults,
+    AppPanel,
+    GitSyncResults,
+)
+from codeocean.models.components import Permissions
+from codeocean.models.computation import Computation
+from codeocean.models.data_asset import DataAssetAttachParams, DataAssetAttachResults
+from codeocean.models.decoder import decode, decode_response
+from codeocean.pagination import validate_prefetch
+from codeocean.streaming import STREAM_CHUNK_SIZE
+
+
+@dataclass
+class AsyncCapsules:
+    """Asynchronous client for interacting with Code Ocean capsule APIs."""
+
+    client: httpx.AsyncClient
+    _route: str = "capsules"
+
+    async def get_capsule(self, capsule_id: str, raw: bool = False) -> Capsule:
+        """Retrieve metadata for a specific capsule by its ID."""
+        res = await self.client.get(f"{self._route}/{capsule_id}")
+
+        return res.json() if raw else decode_response(Capsule, res)
+
+    async def delete_capsule(self, capsule_id: str):
+        """Delete a capsule permanently."""
+        await self.client.delete(f"{self._route}/{capsule_id}")
+
+    async def get_capsule_app_panel(
+        self,
+        capsule_id: str,
+        version: Optional[int] = None,
+        raw: bool = False,
+    ) -> AppPanel:
+        """Retrieve app panel information for a specific capsule by its ID."""
+        res = await self.client.get(
+            f"{self._route}/{capsule_id}/app_panel",
+            params={"version": version} if version else None,
+        )
+
+        return res.json() if raw else decode_response(AppPanel, res)
+
+    async def list_computations(self, capsule_id: str, raw: bool = False) -> list[Computation]:
+        """Get all computations associated with a specific capsule."""
+        res = await self.client.get(f"{self._route}/{capsule_id}/computations")
+
+        return res.json() if raw else decode_response(list[Computation], res)
+
+    async def list_computations_iterator(self, capsule_id: str, raw: bool = False) -> AsyncIterator[Computation]:
+        """
+        Iterate through all computations associated with a specific capsule.
+
+        The response is streamed and parsed incrementally, so memory use stays bounded
+        however many computations the capsule has.
+        """
+        async with self.client.stream("GET", f"{self._route}/{capsule_id}/computations") as res:
+            async for item in iter_json_array(res.aiter_bytes(STREAM_CHUNK_SIZE), None, self.client.json_backend):
+                yield item if raw else decode(Computation, item)
+
+    async def get_permissions(self, capsule_id: str, raw: bool = False) -> Permissions:
+        """Get permissions for a specific capsule."""
+        res = await self.client.get(f"{self._route}/{capsule_id}/permissions")
+
+        return res.json() if raw else decode_response(Permissions, res)
+
+    async def update_permissions(self, capsule_id: str, permissions: Permissions):
+        """Update permissions for a capsule."""
+        await self.client.post(
+            f"{self._route}/{capsule_id}/permissions",
+            json=permissions.to_dict(),
+        )
+
+    async def attach_data_assets(
+        self,
+        capsule_id: str,
+        attach_params: list[DataAssetAttachParams],
+        raw: bool = False,
+    ) -> list[DataAssetAttachResults]:
+        """Attach one or more data assets to a capsule with optional mount paths."""
+        res = await self.client.post(
+            f"{self._route}/{capsule_id}/data_assets",
+            json=[j.to_dict() for j in attach_params],
+        )
+
+        return res.json() if raw else decode_response(list[DataAssetAttachResults], res)
+
+    async def detach_data_assets(self, capsule_id: str, data_assets: list[str]):
+        """Detach one or more data assets from a capsule by their IDs."""
+        await self.client.request(
+            "DELETE",
+            f"{self._route}/{capsule_id}/data_assets/",
+            json=data_assets,
+        )
+
+    async def sync_capsule(self, capsule_id: str, raw: bool = False) -> GitSyncResults:
+        """Sync a capsule with its linked external Git repository."""
+        res = await self.client.post(f"{self._route}/{capsule_id}/sync")
+
+        return res.json() if raw else decode_response(GitSyncResults, res)
+
+    async def archive_capsule(self, capsule_id: str, archive: bool):
+        """Archive or unarchive a capsule to control its visibility and accessibility."""
+        await self.client.patch(
+            f"{self._route}/{capsule_id}/archive",
+            params={"archive": archive},
+        )
+
+    async def search_capsules(
+        self,
+        search_params: CapsuleSearchParams,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> CapsuleSearchResults:
+        """Search for capsules with filtering, sorting, and pagination
+        options."""
+        res = await self.client.post(f"{self._route}/search", json=search_params.to_dict())
+
+        return res.json() if raw else decode_response(CapsuleSearchResults, res, lazy)
+
+    def search_capsules_iterator(
+        self,
+        search_params: CapsuleSearchParams,
+        prefetch: int = 0,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> AsyncIterator[Capsule]:
+        """
+        Iterate through all capsules matching search criteria with automatic pagination.
+
+        Set prefetch to request up to that many pages ahead on a background task
+        while the current page is being consumed.
+        """
+        validate_prefetch(prefetch)
+        pages = iterate_pages(
+            lambda params: self.search_capsules(search_params=CapsuleSearchParams(**params), raw=raw, lazy=lazy),
+            search_params.to_dict(),
+            prefetch,
+        )
+        return iterate_results(pages, raw)
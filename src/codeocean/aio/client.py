@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import count
+from typing import Optional
+import asyncio
+import httpx
+
+from codeocean.aio.capsule import AsyncCapsules
+from codeocean.aio.computation import AsyncComputations
+from codeocean.aio.custom_metadata import AsyncCustomMetadataSchema
+from codeocean.aio.data_asset import AsyncDataAssets
+from codeocean.aio.pipeline import AsyncPipelines
+from codeocean.cache import ResponseCache, get_cache, validators
+from codeocean.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from codeocean.client import CodeOcean
+from codeocean.coalesce import RequestCoalescer, get_coalescer
+from codeocean.deadline import DeadlineExceeded, capped_sleep, capped_timeout, exceeded, remaining
+from codeocean.error import Error
+from codeocean.hedge import Hedger, get_hedger
+from codeocean.json_backend import JSONBackend, get_json_backend
+from codeocean.rate_limit import RateLimiter, get_rate_limiter
+from codeocean.retry import RetryPolicy, get_retry_policy
+from codeocean.session import DEFAULT_TIMEOUT
+
+
+@dataclass
+class AsyncCodeOcean:
+    """
+    Asynchronous Code Ocean API client.
+
+    Mirrors CodeOcean with awaitable methods on every resource client. All resource
+    clients share a single httpx.AsyncClient, so many requests can be in flight
+    concurrently over one connection pool. Close the client with aclose() or use it
+    as an async context manager.
+
+    Fields:
+        domain: The Code Ocean domain URL (e.g., 'https://codeocean.acme.com')
+        token: Code Ocean API access token
+        retries: Optional number of retries for failed connection attempts.
+                Defaults to 0 (no retries)
+        agent_id: Optional agent identifier for tracking AI agent API usage on behalf of users
+        json_backend: JSON library used for request and response bodies, see CodeOcean
+        cache: Cache GET responses of read-mostly endpoints in memory, see CodeOcean
+        coalesce: Share one request between concurrent identical GET requests, see CodeOcean
+        rate_limit: Pace requests and adapt their concurrency to the server's load, see CodeOcean
+        retry: Retry failed requests when it is safe for their endpoint, see CodeOcean
+        timeout: Seconds to wait for a connection and for each response, or a (connect,
+                read) tuple, or None to wait forever. Defaults to (10, 60), like CodeOcean
+        circuit_breaker: Fail requests fast while the server is unavailable, see CodeOcean
+        hedge: Send a second request for slow GET requests and use the first response,
+                cancelling the other, see CodeOcean
+    """
+
+    domain: str
+    token: str
+    retries: Optional[int] = 0
+    agent_id: Optional[str] = None
+    json_backend: str | JSONBackend = "auto"
+    cache: bool | ResponseCache = False
+    coalesce: bool | RequestCoalescer = False
+    rate_limit: bool | RateLimiter = False
+    retry: bool | RetryPolicy = False
+    timeout: Optional[float | tuple[float, float]] = DEFAULT_TIMEOUT
+    circuit_breaker: bool | CircuitBreaker = False
+    hedge: bool | Hedger = False
+
+    def __post_init__(self):
+        headers = {
+            "Content-Type": "application/json",
+            "Min-Server-Version": CodeOcean.MIN_SERVER_VERSION,
+        }
+        if self.agent_id:
+            headers["Agent-Id"] = self.agent_id
+        self.session = _AsyncClient(
+            json_backend=get_json_backend(self.json_backend),
+            cache=get_cache(self.cache),
+            coalescer=get_coalescer(self.coalesce),
+            rate_limiter=get_rate_limiter(self.rate_limit),
+            retry_policy=get_retry_policy(self.retry),
+            circuit_breaker=get_circuit_breaker(self.circuit_breaker),
+            hedger=get_hedger(self.hedge),
+            base_url=f"{self.domain}/api/v1/",
+            auth=(self.token, ""),
+            headers=headers,
+            event_hooks={"response": [self._error_handler]},
+            timeout=_timeout(self.timeout),
+            transport=httpx.AsyncHTTPTransport(retries=self.retries or 0),
+        )
+
+        self.capsules = AsyncCapsules(client=self.session)
+        self.computations = AsyncComputations(client=self.session)
+        self.custom_metadata = AsyncCustomMetadataSchema(client=self.session)
+        self.data_assets = AsyncDataAssets(client=self.session)
+        self.pipelines = AsyncPipelines(client=self.session)
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> AsyncCodeOcean:
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def _error_handler(self, response: httpx.Response):
+        loads = self.session.json_backend.loads
+        response.json = lambda **kwargs: loads(response.content)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            # Answer to a conditional request revalidating a cached response
+            return
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as err:
+            await response.aread()
+            raise Error(err) from err
+
+
+class _AsyncClient(httpx.AsyncClient):
+    """
+    httpx.AsyncClient that encodes `json=` request bodies with a JSON backend, answers
+    GET requests from an optional response cache and shares one request between
+    concurrent identical GET requests with an optional request coalescer, paces the
+    requests it sends with an optional rate limiter, retries failed requests with an
+    optional retry policy, hedges slow GET requests with an optional hedger and fails
+    requests fast with an optional circuit breaker, see Session.
+    """
+
+    def __init__(
+        self,
+        json_backend: JSONBackend,
+        cache: Optional[ResponseCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[Hedger] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.json_backend = json_backend
+        self.cache = cache
+        self.coalescer = coalescer
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.hedger = hedger
+
+    async def request(self, method, url, **kwargs) -> httpx.Response:
+        if self.coalescer is None:
+            return await self._request(method, url, **kwargs)
+        key = self.coalescer.key(method, str(url), kwargs.get("params"), kwargs.get("headers"))
+        if key is None:
+            return await self._request(method, url, **kwargs)
+        return await self.coalescer.acall(key, lambda: self._request(method, url, **kwargs))
+
+    async def _request(self, method, url, **kwargs) -> httpx.Response:
+        if self.cache is None:
+            return await self._send(method, url, **kwargs)
+
+        key = self.cache.key(method, str(url), kwargs.get("params"))
+        if key is None:
+            try:
+                return await self._send(method, url, **kwargs)
+            finally:
+                self.cache.invalidate(method, str(url))
+
+        response = self.cache.get(key)
+        if response is not None:
+            return response
+        headers = kwargs.get("headers")
+        conditional = self.cache.revalidation_headers(key)
+        if conditional is not None:
+            kwargs["headers"] = {**(headers or {}), **conditional}
+        response = await self._send(method, url, **kwargs)
+        if response.status_code == 304 and conditional is not None:
+            cached = self.cache.revalidated(key)
+            if cached is not None:
+                return cached
+            # Dropped while revalidating: fetch it again
+            kwargs["headers"] = headers
+            response = await self._send(method, url, **kwargs)
+        if response.status_code == 200:
+            response_validators = validators(response)
+            if response_validators is None:
+                self.cache.put(key, response)
+            else:
+                self.cache.put_validated(key, response, response_validators)
+        return response
+
+    async def _send(self, method, url, **kwargs) -> httpx.Response:
+        if self.retry_policy is None:
+            return await self._hedge(method, url, **kwargs)
+        idempotent = self.retry_policy.idempotent(method, str(url))
+        idempotency_headers = self.retry_policy.idempotency_headers(method, str(url))
+        if idempotency_headers is not None:
+            # The same key is sent by every retry
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **idempotency_headers}
+            idempotent = True
+        for attempt in count():
+            try:
+                return await self._hedge(method, url, **kwargs)
+            except Error as err:
+                delay = self.retry_policy.delay(attempt, idempotent, response=err.http_err.response)
+                if delay is None:
+                    raise
+            except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as err:
+                sent = not isinstance(err, (httpx.ConnectError, httpx.ConnectTimeout))
+                delay = self.retry_policy.delay(attempt, idempotent, sent=sent)
+                if delay is None:
+                    raise
+            await asyncio.sleep(capped_sleep(delay))
+
+    async def _hedge(self, method, url, **kwargs) -> httpx.Response:
+        if self.hedger is None or not self.hedger.hedged(method, str(url)):
+            return await self._attempt(method, url, **kwargs)
+        return await self.hedger.acall(lambda: self._attempt(method, url, **kwargs))
+
+    async def _attempt(self, method, url, **kwargs) -> httpx.Response:
+        if self.rate_limiter is None:
+            return await self._send_once(method, url, **kwargs)
+        for attempt in count():
+            sent = await self.rate_limiter.acquire_async()
+            try:
+                response = await self._send_once(method, url, **kwargs)
+            except Error as err:
+                self.rate_limiter.release(sent, err.http_err.response)
+                # With a retry policy, it retries throttled requests instead, so retries don't multiply
+                retry = self.retry_policy is None and self.rate_limiter.should_retry(err.http_err.response, attempt)
+                if retry:
+                    continue
+                raise
+            except BaseException:
+                self.rate_limiter.release(sent)
+                raise
+            self.rate_limiter.release(sent, response)
+            return response
+
+    async def _send_once(self, method, url, **kwargs) -> httpx.Response:
+        if remaining() is not None:
+            timeout = kwargs.get("timeout", httpx.USE_CLIENT_DEFAULT)
+            timeout = self.timeout if timeout is httpx.USE_CLIENT_DEFAULT else httpx.Timeout(timeout)
+            timeouts = capped_timeout((timeout.connect, timeout.read, timeout.write, timeout.pool))
+            kwargs["timeout"] = httpx.Timeout(timeouts)
+        probe = self.circuit_breaker.acquire() if self.circuit_breaker is not None else False
+        healthy = None
+        try:
+            response = await super().request(method, url, **kwargs)
+            healthy = response.status_code < 500
+            return response
+        except Error as err:
+            healthy = err.status_code < 500
+            raise
+        except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as err:
+            if isinstance(err, httpx.TimeoutException) and exceeded():
+                raise DeadlineExceeded("Deadline exceeded while waiting for the response") from err
+            healthy = False
+            raise
+        finally:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release(probe, healthy)
+
+    def build_request(self, method, url, *, content=None, json=None, **kwargs) -> httpx.Request:
+        if json is not None and content is None:
+            content = self.json_backend.dumps(json)
+        return super().build_request(method, url, content=content, **kwargs)
+
+
+def _timeout(timeout: Optional[float | tuple[float, float]]) -> httpx.Timeout:
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from asyncio import sleep
+from dataclasses import dataclass
+from time import time
+from typing import AsyncIterator, Iterable, Optional
+import httpx
+
+from codeocean.aio.polling import poll_many
+from codeocean.aio.streaming import iter_json_array
+from codeocean.aio.walk import walk_folder
+from codeocean.models.computation import Computation, ComputationState, RunParams
+from codeocean.models.data_asset import DataAssetAttachParams, DataAssetAttachResults
+from codeocean.models.decoder import decode, decode_response
+from codeocean.models.folder import FileURLs, Folder, FolderItem
+from codeocean.polling import FixedInterval, PollingStrategy, capped_delay, validate_polling, validate_request_rate
+from codeocean.streaming import STREAM_CHUNK_SIZE
+
+
+@dataclass
+class AsyncComputations:
+    """Asynchronous client for interacting with Code Ocean computation APIs."""
+
+    client: httpx.AsyncClient
+
+    async def get_computation(self, computation_id: str, raw: bool = False) -> Computation:
+        """Retrieve metadata and status information for a specific computation by its ID."""
+        res = await self.client.get(f"computations/{computation_id}")
+
+        return res.json() if raw else decode_response(Computation, res)
+
+    async def run_capsule(self, run_params: RunParams, raw: bool = False) -> Computation:
+        """
+        Execute a capsule or pipeline with specified parameters and data assets.
+
+        See Computations.run_capsule for details on capsule and pipeline execution.
+        """
+        res = await self.client.post("computations", json=run_params.to_dict())
+
+        return res.json() if raw else decode_response(Computation, res)
+
+    # Alias for run_capsule
+    run_pipeline = run_capsule
+
+    async def wait_until_completed(
+        self,
+        computation: Computation,
+        polling_interval: float = 5,
+        timeout: Optional[float] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> Computation:
+        """
+        Poll a computation until it reaches 'Completed' or 'Failed' state with configurable timing.
+
+        Args:
+            computation: The computation object to monitor
+            polling_interval: Time between status checks in seconds (minimum 5 seconds)
+            timeout: Maximum time to wait in seconds, or None for no timeout
+            polling_strategy: Optional strategy deciding the delay between status checks
+                (e.g. ExponentialBackoff, DecorrelatedJitter or ExpectedRunTime). Overrides
+                polling_interval when set
+
+        Returns:
+            Updated computation object once completed or failed
+
+        Raises:
+            ValueError: If polling_interval < 5 without a polling_strategy or timeout constraints are violated
+            TimeoutError: If computation doesn't complete within the timeout period
+        """
+        validate_polling(polling_interval, timeout, polling_strategy)
+        delays = (polling_strategy or FixedInterval(polling_interval)).delays(computation.created)
+        t0 = time()
+        while True:
+            comp = await self.get_computation(computation.id)
+
+            if comp.state in [ComputationState.Completed, ComputationState.Failed]:
+                return comp
+
+            if timeout is not None and (time() - t0) >= timeout:
+                raise TimeoutError(
+                    f"Computation {computation.id} did not complete within {timeout} seconds"
+                )
+
+            await sleep(capped_delay(next(delays), t0, timeout))
+
+    def as_completed(
+        self,
+        computations: Iterable[Computation],
+        polling_interval: float = 5,
+        timeout: Optional[float] = None,
+        max_requests_per_second: float = 2,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> AsyncIterator[Computation]:
+        """
+        Poll many computations from a single loop and yield each one as soon as it
+        reaches 'Completed' or 'Failed' state.
+
+        Args:
+            computations: The computation objects to monitor
+            polling_interval: Time between status checks of each computation in seconds
+                (minimum 5 seconds)
+            timeout: Maximum time to wait for all computations in seconds, or None for no timeout
+            max_requests_per_second: Request rate budget shared by all status checks
+            polling_strategy: Optional strategy deciding the delay between status checks of
+                each computation. Overrides polling_interval when set
+
+        Returns:
+            Iterator of updated computation objects in completion order
+
+        Raises:
+            ValueError: If polling_interval < 5 without a polling_strategy, timeout constraints are
+                violated or max_requests_per_second <= 0
+            TimeoutError: If some computations don't complete within the timeout period
+        """
+        validate_polling(polling_interval, timeout, polling_strategy)
+        validate_request_rate(max_requests_per_second)
+        computations = list({c.id: c for c in computations}.values())
+        return poll_many(
+            [c.id for c in computations],
+            self.get_computation,
+            lambda c: c.state in [ComputationState.Completed, ComputationState.Failed],
+            polling_strategy or FixedInterval(polling_interval),
+            max_requests_per_second=max_requests_per_second,
+            timeout=timeout,
+            label="Computations",
+            started=[c.created for c in computations],
+        )
+
+    async def wait_many(
+        self,
+        computations: Iterable[Computation],
+        polling_interval: float = 5,
+        timeout: Optional[float] = None,
+        max_requests_per_second: float = 2,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> list[Computation]:
+        """
+        Poll many computations from a single loop until all reach 'Completed' or 'Failed'
+        state. See as_completed for the arguments.
+
+        Returns:
+            Updated computation objects in the same order as the input
+        """
+        computations = list(computations)
+        completed = {
+            c.id: c
+            async for c in self.as_completed(
+                computations, polling_interval, timeout, max_requests_per_second, polling_strategy,
+            )
+        }
+        return [completed[c.id] for c in computations]
+
+    async def attach_data_assets(
+        self,
+        computation_id: str,
+        attach_params: list[DataAssetAttachParams],
+        raw: bool = False,
+    ) -> list[DataAssetAttachResults]:
+        """Attach one or more data assets to a cloud workstation session computation."""
+        res = await self.client.post(
+            f"computations/{computation_id}/data_assets",
+            json=[j.to_dict() for j in attach_params],
+        )
+        return res.json() if raw else decode_response(list[DataAssetAttachResults], res)
+
+    async def detach_data_assets(self, computation_id: str, data_assets: list[str]):
+        """Detach one or more data assets from a cloud workstation session computation by their IDs."""
+        await self.client.request(
+            "DELETE",
+            f"computations/{computation_id}/data_assets/",
+            json=data_assets,
+        )
+
+    async def list_computation_results(self, computation_id: str, path: str = "", raw: bool = False) -> Folder:
+        """List result files and folders generated by a computation
+        at the specified path. Empty path retrieves the /results root folder."""
+        data = {
+            "path": path,
+        }
+
+        res = await self.client.post(f"computations/{computation_id}/results", json=data)
+
+        return res.json() if raw else decode_response(Folder, res)
+
+    async def list_computation_results_iterator(
+        self,
+        computation_id: str,
+        path: str = "",
+        raw: bool = False,
+    ) -> AsyncIterator[FolderItem]:
+        """
+        Iterate through the result files and folders generated by a computation at the
+        specified path. Empty path retrieves the /results root folder.
+
+        The response is streamed and parsed incrementally, so memory use stays bounded
+        however large the folder is.
+        """
+        data = {
+            "path": path,
+        }
+
+        async with self.client.stream("POST", f"computations/{computation_id}/results", json=data) as res:
+            async for item in iter_json_array(res.aiter_bytes(STREAM_CHUNK_SIZE), "items", self.client.json_backend):
+                yield item if raw else decode(FolderItem, item)
+
+    def walk_computation_results(
+        self,
+        computation_id: str,
+        path: str = "",
+        max_workers: int = 8,
+        max_depth: Optional[int] = None,
+        pattern: Optional[str] = None,
+    ) -> AsyncIterator[FolderItem]:
+        """
+        Recursively list result files and folders of a computation, expanding
+        subfolders concurrently and yielding items as their folder listings arrive.
+
+        Args:
+            computation_id: ID of the computation
+            path: Folder to start from; empty string for the /results root folder
+            max_workers: Maximum number of concurrent folder listings
+            max_depth: Number of subfolder levels below path to expand, or None for no limit
+            pattern: Optional glob pattern that yielded items' paths must match
+        """
+        return walk_folder(
+            lambda p: self.list_computation_results(computation_id, p),
+            path,
+            max_workers=max_workers,
+            max_depth=max_depth,
+            pattern=pattern,
+        )
+
+    async def get_result_file_urls(self, computation_id: str, path: str, raw: bool = False) -> FileURLs:
+        """Generate view and download URLs for a specific result file from a computation."""
+        res = await self.client.get(
+            f"computations/{computation_id}/results/urls",
+            params={"path": path},
+        )
+
+        return res.json() if raw else decode_response(FileURLs, res)
+
+    async def delete_computation(self, computation_id: str):
+        """Delete a computation and stop it if currently running."""
+        await self.client.delete(f"computations/{computation_id}")
+
+    async def rename_computation(self, computation_id: str, name: str):
+        """Rename an existing computation with a new display name."""
+        await self.client.patch(f"computations/{computation_id}", params={"name": name})
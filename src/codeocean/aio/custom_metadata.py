@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import httpx
+
+from codeocean.custom_metadata import CustomMetadata
+from codeocean.models.decoder import decode_response
+
+
+@dataclass
+class AsyncCustomMetadataSchema:
+    """Asynchronous client for getting the Code Ocean custom metadata schema."""
+
+    client: httpx.AsyncClient
+
+    async def get_custom_metadata(self, raw: bool = False) -> CustomMetadata:
+        """Retrieve the Code Ocean deployment's custom metadata schema."""
+        res = await self.client.get("custom_metadata")
+
+        return res.json() if raw else decode_response(CustomMetadata, res)
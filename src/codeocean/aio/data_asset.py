@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+from asyncio import sleep
+from dataclasses import dataclass
+from time import time
+from typing import AsyncIterator, Iterable
+import httpx
+
+from codeocean.aio.pagination import iterate_pages, iterate_results
+from codeocean.aio.polling import poll_many
+from codeocean.aio.streaming import iter_json_array
+from codeocean.aio.walk import walk_folder
+from codeocean.models.components import Permissions
+from codeocean.models.data_asset import (
+    DataAsset,
+    DataAssetState,
+    DataAssetUpdateParams,
+    DataAssetParams,
+    DataAssetSearchParams,
+    DataAssetSearchResults,
+    TransferDataParams,
+)
+from codeocean.models.decoder import decode, decode_response
+from codeocean.models.folder import FileURLs, Folder, FolderItem
+from codeocean.pagination import validate_prefetch
+from codeocean.polling import FixedInterval, PollingStrategy, capped_delay, validate_polling, validate_request_rate
+from codeocean.streaming import STREAM_CHUNK_SIZE
+
+
+@dataclass
+class AsyncDataAssets:
+    """Asynchronous client for interacting with Code Ocean data asset APIs."""
+
+    client: httpx.AsyncClient
+
+    async def get_data_asset(self, data_asset_id: str, raw: bool = False) -> DataAsset:
+        """Retrieve metadata for a specific data asset by its ID."""
+        res = await self.client.get(f"data_assets/{data_asset_id}")
+
+        return res.json() if raw else decode_response(DataAsset, res)
+
+    async def update_metadata(
+        self,
+        data_asset_id: str,
+        update_params: DataAssetUpdateParams,
+        raw: bool = False,
+    ) -> DataAsset:
+        """
+        Update metadata for a data asset including name, description, tags, mount,
+        and custom metadata.
+
+        See DataAssets.update_metadata for details on the supported metadata types.
+        """
+        res = await self.client.put(
+            f"data_assets/{data_asset_id}",
+            json=update_params.to_dict(),
+        )
+
+        return res.json() if raw else decode_response(DataAsset, res)
+
+    async def create_data_asset(self, data_asset_params: DataAssetParams, raw: bool = False) -> DataAsset:
+        """
+        Create a new data asset from various sources including S3 buckets,
+        computation results, or combined assets.
+
+        Returns confirmation of creation request validity, not success, as creation
+        takes time. Use wait_until_ready() to monitor creation progress.
+        """
+        res = await self.client.post("data_assets", json=data_asset_params.to_dict())
+
+        return res.json() if raw else decode_response(DataAsset, res)
+
+    async def wait_until_ready(
+        self,
+        data_asset: DataAsset,
+        polling_interval: float = 5,
+        timeout: float | None = None,
+        polling_strategy: PollingStrategy | None = None,
+    ) -> DataAsset:
+        """
+        Poll a data asset until it reaches 'Ready' or 'Failed' state with configurable
+        timing.
+
+        Args:
+            data_asset: The data asset object to monitor
+            polling_interval: Time between status checks in seconds
+                (minimum 5 seconds)
+            timeout: Maximum time to wait in seconds, or None for no timeout
+            polling_strategy: Optional strategy deciding the delay between status checks
+                (e.g. ExponentialBackoff, DecorrelatedJitter or ExpectedRunTime). Overrides
+                polling_interval when set
+
+        Returns:
+            Updated data asset object once ready or failed
+
+        Raises:
+            ValueError: If polling_interval < 5 without a polling_strategy or timeout constraints are violated
+            TimeoutError: If data asset doesn't become ready within timeout period
+        """
+        validate_polling(polling_interval, timeout, polling_strategy)
+        delays = (polling_strategy or FixedInterval(polling_interval)).delays(data_asset.created)
+        t0 = time()
+        while True:
+            da = await self.get_data_asset(data_asset.id)
+
+            if da.state in [DataAssetState.Ready, DataAssetState.Failed]:
+                return da
+
+            if timeout is not None and (time() - t0) >= timeout:
+                raise TimeoutError(
+                    f"Data asset {data_asset.id} was not ready within {timeout} seconds"
+                )
+
+            await sleep(capped_delay(next(delays), t0, timeout))
+
+    def as_completed(
+        self,
+        data_assets: Iterable[DataAsset],
+        polling_interval: float = 5,
+        timeout: float | None = None,
+        max_requests_per_second: float = 2,
+        polling_strategy: PollingStrategy | None = None,
+    ) -> AsyncIterator[DataAsset]:
+        """
+        Poll many data assets from a single loop and yield each one as soon as it
+        reaches 'Ready' or 'Failed' state.
+
+        Args:
+            data_assets: The data asset objects to monitor
+            polling_interval: Time between status checks of each data asset in seconds
+                (minimum 5 seconds)
+            timeout: Maximum time to wait for all data assets in seconds, or None for no timeout
+            max_requests_per_second: Request rate budget shared by all status checks
+            polling_strategy: Optional strategy deciding the delay between status checks of
+                each data asset. Overrides polling_interval when set
+
+        Returns:
+            Iterator of updated data asset objects in the order they become ready or failed
+
+        Raises:
+            ValueError: If polling_interval < 5 without a polling_strategy, timeout constraints are
+                violated or max_requests_per_second <= 0
+            TimeoutError: If some data assets don't become ready within the timeout period
+        """
+        validate_polling(polling_interval, timeout, polling_strategy)
+        validate_request_rate(max_requests_per_second)
+        data_assets = list({da.id: da for da in data_assets}.values())
+        return poll_many(
+            [da.id for da in data_assets],
+            self.get_data_asset,
+            lambda da: da.state in [DataAssetState.Ready, DataAssetState.Failed],
+            polling_strategy or FixedInterval(polling_interval),
+            max_requests_per_second=max_requests_per_second,
+            timeout=timeout,
+            label="Data assets",
+            started=[da.created for da in data_assets],
+        )
+
+    async def wait_many(
+        self,
+        data_assets: Iterable[DataAsset],
+        polling_interval: float = 5,
+        timeout: float | None = None,
+        max_requests_per_second: float = 2,
+        polling_strategy: PollingStrategy | None = None,
+    ) -> list[DataAsset]:
+        """
+        Poll many data assets from a single loop until all reach 'Ready' or 'Failed'
+        state. See as_completed for the arguments.
+
+        Returns:
+            Updated data asset objects in the same order as the input
+        """
+        data_assets = list(data_assets)
+        ready = {
+            da.id: da
+            async for da in self.as_completed(
+                data_assets, polling_interval, timeout, max_requests_per_second, polling_strategy,
+            )
+        }
+        return [ready[da.id] for da in data_assets]
+
+    async def delete_data_asset(self, data_asset_id: str):
+        """Delete a data asset permanently."""
+        await self.client.delete(f"data_assets/{data_asset_id}")
+
+    async def update_permissions(self, data_asset_id: str, permissions: Permissions):
+        """Update permissions for a data asset to control user and group access."""
+        await self.client.post(
+            f"data_assets/{data_asset_id}/permissions",
+            json=permissions.to_dict(),
+        )
+
+    async def archive_data_asset(self, data_asset_id: str, archive: bool):
+        """Archive or unarchive a data asset to control its visibility and accessibility."""
+        await self.client.patch(
+            f"data_assets/{data_asset_id}/archive",
+            params={"archive": archive},
+        )
+
+    async def search_data_assets(
+        self,
+        search_params: DataAssetSearchParams,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> DataAssetSearchResults:
+        """Search for data assets with filtering, sorting, and pagination options."""
+        res = await self.client.post("data_assets/search", json=search_params.to_dict())
+
+        return res.json() if raw else decode_response(DataAssetSearchResults, res, lazy)
+
+    def search_data_assets_iterator(
+        self,
+        search_params: DataAssetSearchParams,
+        prefetch: int = 0,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> AsyncIterator[DataAsset]:
+        """
+        Iterate through all data assets matching search criteria with
+        automatic pagination.
+
+        Set prefetch to request up to that many pages ahead on a background task
+        while the current page is being consumed.
+        """
+        validate_prefetch(prefetch)
+        pages = iterate_pages(
+            lambda params: self.search_data_assets(search_params=DataAssetSearchParams(**params), raw=raw, lazy=lazy),
+            search_params.to_dict(),
+            prefetch,
+        )
+        return iterate_results(pages, raw)
+
+    async def get_permissions(self, data_asset_id: str, raw: bool = False) -> Permissions:
+        """Get permissions for a specific data asset."""
+        res = await self.client.get(f"data_assets/{data_asset_id}/permissions")
+
+        return res.json() if raw else decode_response(Permissions, res)
+
+    async def list_data_asset_files(self, data_asset_id: str, path: str = "", raw: bool = False) -> Folder:
+        """
+        List files and folders within an internal data asset at the specified path.
+        Empty path retrieves root level contents.
+        """
+        data = {
+            "path": path,
+        }
+
+        res = await self.client.post(f"data_assets/{data_asset_id}/files", json=data)
+
+        return res.json() if raw else decode_response(Folder, res)
+
+    async def list_data_asset_files_iterator(
+        self,
+        data_asset_id: str,
+        path: str = "",
+        raw: bool = False,
+    ) -> AsyncIterator[FolderItem]:
+        """
+        Iterate through the files and folders within an internal data asset at the
+        specified path. Empty path retrieves root level contents.
+
+        The response is streamed and parsed incrementally, so memory use stays bounded
+        however large the folder is.
+        """
+        data = {
+            "path": path,
+        }
+
+        async with self.client.stream("POST", f"data_assets/{data_asset_id}/files", json=data) as res:
+            async for item in iter_json_array(res.aiter_bytes(STREAM_CHUNK_SIZE), "items", self.client.json_backend):
+                yield item if raw else decode(FolderItem, item)
+
+    def walk_data_asset_files(
+        self,
+        data_asset_id: str,
+        path: str = "",
+        max_workers: int = 8,
+        max_depth: int | None = None,
+        pattern: str | None = None,
+    ) -> AsyncIterator[FolderItem]:
+        """
+        Recursively list files and folders of an internal data asset, expanding
+        subfolders concurrently and yielding items as their folder listings arrive.
+
+        Args:
+            data_asset_id: ID of the data asset
+            path: Folder to start from; empty string for the root folder
+            max_workers: Maximum number of concurrent folder listings
+            max_depth: Number of subfolder levels below path to expand, or None for no limit
+            pattern: Optional glob pattern that yielded items' paths must match
+        """
+        return walk_folder(
+            lambda p: self.list_data_asset_files(data_asset_id, p),
+            path,
+            max_workers=max_workers,
+            max_depth=max_depth,
+            pattern=pattern,
+        )
+
+    async def get_data_asset_file_urls(self, data_asset_id: str, path: str, raw: bool = False) -> FileURLs:
+        """Generate view and download URLs for a specific file from an internal data asset."""
+        res = await self.client.get(
+            f"data_assets/{data_asset_id}/files/urls",
+            params={"path": path},
+        )
+
+        return res.json() if raw else decode_response(FileURLs, res)
+
+    async def transfer_data_asset(self, data_asset_id: str, transfer_params: TransferDataParams):
+        """
+        Transfer a data asset's files to a different S3 storage location (Admin only).
+
+        See DataAssets.transfer_data_asset for details.
+        """
+        await self.client.post(
+            f"data_assets/{data_asset_id}/transfer",
+            json=transfer_params.to_dict(),
+        )
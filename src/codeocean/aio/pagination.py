@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from asyncio import Queue, Semaphore, create_task
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from codeocean.pagination import _DONE, _Failure, page_field, validate_prefetch
+
+Page = TypeVar("Page")
+
+
+async def iterate_pages(
+    search: Callable[[dict], Awaitable[Page]],
+    params: dict,
+    prefetch: int = 0,
+) -> AsyncIterator[Page]:
+    """
+    Iterate through search result pages by following next_token.
+
+    Args:
+        search: Coroutine function performing one search request for the given
+            parameters, returning a result page with has_more and next_token fields
+        params: Search parameters of the first page
+        prefetch: Number of pages to request ahead on a background task while the
+            current page is being consumed. 0 fetches each page only when needed
+
+    Raises:
+        ValueError: If prefetch < 0
+    """
+    validate_prefetch(prefetch)
+
+    if prefetch == 0:
+        params = dict(params)
+        while True:
+            page = await search(params)
+            yield page
+            if not page_field(page, "has_more"):
+                return
+            params["next_token"] = page_field(page, "next_token")
+
+    # Each fetched page holds a slot until the consumer takes it, so at most
+    # `prefetch` pages are in flight or buffered ahead of the consumer.
+    pages: Queue[Any] = Queue()
+    slots = Semaphore(prefetch)
+
+    async def produce():
+        next_params = dict(params)
+        try:
+            while True:
+                await slots.acquire()
+                page = await search(next_params)
+                pages.put_nowait(page)
+                if not page_field(page, "has_more"):
+                    break
+                next_params["next_token"] = page_field(page, "next_token")
+        except Exception as err:
+            pages.put_nowait(_Failure(err))
+            return
+        pages.put_nowait(_DONE)
+
+    task = create_task(produce())
+    try:
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        task.cancel()
+
+
+async def iterate_results(pages: AsyncIterator[Page], raw: bool) -> AsyncIterator[Any]:
+    """Iterate through the results of search result pages, either results models or raw JSON dicts."""
+    async for page in pages:
+        for result in page["results"] if raw else page.results:
+            yield result
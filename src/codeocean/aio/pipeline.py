@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+import httpx
+
+from codeocean.aio.capsule import AsyncCapsules
+from codeocean.models.capsule import (
+    Capsule,
+    CapsuleSearchParams,
+    CapsuleSearchResults,
+    AppPanel,
+    GitSyncResults,
+)
+from codeocean.models.components import Permissions
+from codeocean.models.computation import Computation
+from codeocean.models.data_asset import DataAssetAttachParams, DataAssetAttachResults
+
+
+@dataclass
+class AsyncPipelines:
+    """Asynchronous client for interacting with Code Ocean pipeline APIs."""
+
+    client: httpx.AsyncClient
+    _capsules: AsyncCapsules = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._capsules = AsyncCapsules(client=self.client, _route="pipelines")
+
+    async def get_pipeline(self, pipeline_id: str, raw: bool = False) -> Capsule:
+        """Retrieve metadata for a specific pipeline by its ID."""
+        return await self._capsules.get_capsule(pipeline_id, raw=raw)
+
+    async def delete_pipeline(self, pipeline_id: str):
+        """Delete a pipeline permanently."""
+        return await self._capsules.delete_capsule(pipeline_id)
+
+    async def get_pipeline_app_panel(self, pipeline_id: str, version: int | None = None, raw: bool = False) -> AppPanel:
+        """Retrieve app panel information for a specific pipeline by its ID."""
+        return await self._capsules.get_capsule_app_panel(pipeline_id, version, raw=raw)
+
+    async def list_computations(self, pipeline_id: str, raw: bool = False) -> list[Computation]:
+        """Get all computations associated with a specific pipeline."""
+        return await self._capsules.list_computations(pipeline_id, raw=raw)
+
+    def list_computations_iterator(self, pipeline_id: str, raw: bool = False) -> AsyncIterator[Computation]:
+        """Iterate through all computations associated with a specific pipeline, streaming the response."""
+        return self._capsules.list_computations_iterator(pipeline_id, raw=raw)
+
+    async def get_permissions(self, pipeline_id: str, raw: bool = False) -> Permissions:
+        """Get permissions for a specific pipeline."""
+        return await self._capsules.get_permissions(pipeline_id, raw=raw)
+
+    async def update_permissions(self, pipeline_id: str, permissions: Permissions):
+        """Update permissions for a pipeline."""
+        return await self._capsules.update_permissions(pipeline_id, permissions)
+
+    async def attach_data_assets(
+        self,
+        pipeline_id: str,
+        attach_params: list[DataAssetAttachParams],
+        raw: bool = False,
+    ) -> list[DataAssetAttachResults]:
+        """Attach one or more data assets to a pipeline with optional mount paths."""
+        return await self._capsules.attach_data_assets(pipeline_id, attach_params, raw=raw)
+
+    async def detach_data_assets(self, pipeline_id: str, data_assets: list[str]):
+        """Detach one or more data assets from a pipeline by their IDs."""
+        return await self._capsules.detach_data_assets(pipeline_id, data_assets)
+
+    async def sync_pipeline(self, pipeline_id: str, raw: bool = False) -> GitSyncResults:
+        """Sync a pipeline with its linked external Git repository."""
+        return await self._capsules.sync_capsule(pipeline_id, raw=raw)
+
+    async def archive_pipeline(self, pipeline_id: str, archive: bool):
+        """Archive or unarchive a pipeline to control its visibility and accessibility."""
+        return await self._capsules.archive_capsule(pipeline_id, archive)
+
+    async def search_pipelines(
+        self,
+        search_params: CapsuleSearchParams,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> CapsuleSearchResults:
+        """Search for pipelines with filtering, sorting, and pagination options."""
+        return await self._capsules.search_capsules(search_params, raw=raw, lazy=lazy)
+
+    def search_pipelines_iterator(
+        self,
+        search_params: CapsuleSearchParams,
+        prefetch: int = 0,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> AsyncIterator[Capsule]:
+        """Iterate through all pipelines matching search criteria with automatic pagination."""
+        return self._capsules.search_capsules_iterator(search_params, prefetch, raw=raw, lazy=lazy)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from asyncio import sleep
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from codeocean.deadline import capped_sleep
+from codeocean.polling import PollingStrategy, PollSchedule
+
+T = TypeVar("T")
+
+
+async def poll_many(
+    ids: Iterable[str],
+    get: Callable[[str], Awaitable[T]],
+    is_done: Callable[[T], bool],
+    polling_strategy: PollingStrategy,
+    max_requests_per_second: float,
+    timeout: Optional[float] = None,
+    label: str = "Resources",
+    started: Optional[Iterable[Optional[float]]] = None,
+) -> AsyncIterator[T]:
+    """Poll many resources from a single task, yielding each one as soon as it's done."""
+    schedule = PollSchedule(ids, polling_strategy, max_requests_per_second, timeout, label, started)
+    while schedule:
+        delay, index, id = schedule.next()
+        if delay:
+            await sleep(capped_sleep(delay))
+        item = await get(id)
+        if is_done(item):
+            yield item
+        else:
+            schedule.reschedule(index, id)
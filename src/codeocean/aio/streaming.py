@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterable, AsyncIterator, Optional
+
+from codeocean.json_backend import JSONBackend
+from codeocean.streaming import JSONArrayParser
+
+
+async def iter_json_array(
+    chunks: AsyncIterable[bytes],
+    key: Optional[str] = None,
+    json_backend: Optional[JSONBackend] = None,
+) -> AsyncIterator[Any]:
+    """Yield the elements of a JSON array from a document read in chunks, see JSONArrayParser."""
+    parser = JSONArrayParser(key, json_backend)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.done:
+            return
+    for item in parser.close():
+        yield item
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from asyncio import FIRST_COMPLETED, Semaphore, Task, create_task, wait
+from fnmatch import fnmatchcase
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from codeocean.models.folder import Folder, FolderItem
+
+
+async def walk_folder(
+    list_folder: Callable[[str], Awaitable[Folder]],
+    path: str = "",
+    max_workers: int = 8,
+    max_depth: Optional[int] = None,
+    pattern: Optional[str] = None,
+) -> AsyncIterator[FolderItem]:
+    """
+    Recursively list a folder tree, expanding subfolders concurrently.
+
+    See codeocean.walk.walk_folder for the arguments.
+    """
+    if max_workers < 1:
+        raise ValueError(f"Max workers {max_workers} should be greater than or equal to 1")
+    if max_depth is not None and max_depth < 0:
+        raise ValueError(f"Max depth {max_depth} should be greater than or equal to 0, or None")
+
+    slots = Semaphore(max_workers)
+
+    async def list_with_slot(path: str) -> Folder:
+        async with slots:
+            return await list_folder(path)
+
+    pending: dict[Task, int] = {create_task(list_with_slot(path)): 0}
+    try:
+        while pending:
+            done, _ = await wait(pending, return_when=FIRST_COMPLETED)
+            for task in done:
+                depth = pending.pop(task)
+                for item in task.result().items:
+                    if item.type == "folder" and (max_depth is None or depth < max_depth):
+                        pending[create_task(list_with_slot(item.path))] = depth + 1
+                    if pattern is None or fnmatchcase(item.path, pattern):
+                        yield item
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,268 @@
+"""
+In-memory cache of GET responses for read-mostly endpoints.
+
+The cache sits in the client's HTTP session: responses to GET requests whose path
+matches one of the configured endpoint patterns are kept for the pattern's TTL, and
+requests for the same URL are answered from memory. Mutations made through the same
+client (PUT, PATCH, DELETE and POST requests other than searches and listings)
+invalidate the cached responses of the object they change.
+
+Responses stored with validators (from their ETag or Last-Modified header) are kept
+after they expire and revalidated with a conditional request (If-None-Match /
+If-Modified-Since). When the server answers 304 Not Modified the stored response is
+served again, and the models decoded from its body, kept in the cache entry, are
+reused instead of being parsed and decoded anew.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from threading import RLock
+from time import monotonic
+from typing import Any, Callable, Mapping, Optional
+from urllib.parse import urlencode
+
+from codeocean.models.decoder import DecodedBody
+
+# Seconds responses are cached per endpoint; '*' matches a single path segment
+DEFAULT_TTLS: Mapping[str, float] = {
+    "capsules/*": 60,
+    "capsules/*/app_panel": 300,
+    "capsules/*/permissions": 60,
+    "pipelines/*": 60,
+    "pipelines/*/app_panel": 300,
+    "pipelines/*/permissions": 60,
+    "data_assets/*/permissions": 60,
+    "custom_metadata": 600,
+}
+
+# POST endpoints that don't change anything
+READ_ONLY_POSTS = (
+    "*/search",
+    "data_assets/*/files",
+    "computations/*/results",
+)
+
+CacheKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a response cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    revalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable requests answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entry:
+    __slots__ = ("expires", "response", "validators", "decoded")
+
+    def __init__(self, expires: float, response: Any, validators: Optional[dict[str, str]]):
+        self.expires = expires
+        self.response = response
+        self.validators = validators
+        # Models decoded from the body of a revalidated response, shared by its callers
+        self.decoded: Optional[DecodedBody] = None
+
+
+class ResponseCache:
+    """
+    TTL and size-bounded LRU cache of GET responses, keyed by path and query string.
+
+    Only endpoints matching a pattern in ttls are cached. Responses of endpoints that
+    are polled for state changes, such as data_assets/* and computations/* used by
+    wait_until_ready, are best left out or given short TTLs. With a TTL of 0, responses
+    carrying validators are stored but revalidated on every request: unchanged objects
+    aren't transferred and decoded again, and their current state is always returned.
+
+    Args:
+        ttls: Seconds to cache responses for, per endpoint path pattern. '*' matches
+            a single path segment, e.g. 'capsules/*/app_panel'. Defaults to DEFAULT_TTLS
+        maxsize: Maximum number of cached responses; the least recently used ones are
+            evicted first
+        clock: Time source, in seconds
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError(f"Max size {maxsize} should be greater than or equal to 1")
+        self.ttls = {_segments(pattern): ttl for pattern, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()}
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._lock = RLock()
+        self._hits = self._misses = self._evictions = self._invalidations = self._revalidations = 0
+
+    def ttl(self, path: str) -> Optional[float]:
+        """Seconds responses of a path are cached for, or None if they aren't cached."""
+        segments = _segments(path)
+        for pattern, ttl in self.ttls.items():
+            if _match(segments, pattern):
+                return ttl
+        return None
+
+    def key(self, method: str, url: str, params: Any = None) -> Optional[CacheKey]:
+        """Cache key of a request, or None if its response isn't cached."""
+        if method.upper() != "GET" or "://" in url or self.ttl(url) is None:
+            return None
+        if isinstance(params, Mapping):
+            params = {k: v for k, v in params.items() if v is not None}
+        return url.strip("/"), urlencode(params, doseq=True) if params else ""
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Get a cached response, or None if it isn't cached or has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= self.clock():
+                # Expired responses with validators are kept for revalidation
+                if entry.validators is None:
+                    self._entries.pop(key, None)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.response
+
+    def put(self, key: CacheKey, response: Any):
+        """Cache a response for its endpoint's TTL, evicting the least recently used ones if full."""
+        ttl = self.ttl(key[0])
+        if not ttl:
+            return
+        self._store(key, _Entry(self.clock() + ttl, response, None))
+
+    def put_validated(self, key: CacheKey, response: Any, validators: dict[str, str]):
+        """
+        Cache a response with the conditional request headers revalidating it (see
+        validators()). It is kept after its TTL expires, until it's evicted or
+        invalidated, and served again when the server reports it as not modified.
+        """
+        ttl = self.ttl(key[0])
+        if ttl is None:
+            return
+        self._store(key, _Entry(self.clock() + ttl, response, validators))
+
+    def revalidation_headers(self, key: CacheKey) -> Optional[dict[str, str]]:
+        """Conditional request headers revalidating an expired response, or None if there isn't one."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.validators if entry is not None else None
+
+    def revalidated(self, key: CacheKey) -> Optional[Any]:
+        """
+        Renew the TTL of an expired response the server reported as not modified and
+        return it, or None if it was dropped meanwhile. The models decoded from it with
+        decode_response() are kept in the cache entry from now on and reused: treat
+        them as read-only. Its json() still parses a new copy of the body.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.decoded is None:
+                entry.decoded = entry.response.decoded_body = DecodedBody(entry.response.json())
+            entry.expires = self.clock() + (self.ttl(key[0]) or 0)
+            self._entries.move_to_end(key)
+            self._revalidations += 1
+            return entry.response
+
+    def _store(self, key: CacheKey, entry: _Entry):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, method: str, url: str):
+        """
+        Drop the cached responses a request may change: for mutations of an object,
+        e.g. PUT data_assets/{id} or POST capsules/{id}/permissions, those of all
+        paths under the object (capsules/{id}, capsules/{id}/app_panel, ...).
+        """
+        method = method.upper()
+        if method in ("GET", "HEAD", "OPTIONS") or "://" in url:
+            return
+        segments = _segments(url)
+        if method == "POST" and any(_match(segments, _segments(p)) for p in READ_ONLY_POSTS):
+            return
+        if len(segments) < 2:
+            # Creating an object (e.g. POST data_assets) doesn't change cached ones
+            return
+        prefix = segments[:2]
+        with self._lock:
+            stale = [key for key in self._entries if _segments(key[0])[:len(prefix)] == prefix]
+            for key in stale:
+                self._entries.pop(key, None)
+            self._invalidations += len(stale)
+
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                revalidations=self._revalidations,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def validators(response: Any) -> Optional[dict[str, str]]:
+    """Conditional request headers revalidating a response, from its ETag and Last-Modified headers."""
+    headers = {}
+    etag = response.headers.get("ETag")
+    if etag:
+        headers["If-None-Match"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers or None
+
+
+def get_cache(cache: bool | ResponseCache) -> Optional[ResponseCache]:
+    """Get the response cache for a client's cache setting: True, False or a ResponseCache."""
+    if isinstance(cache, ResponseCache):
+        return cache
+    return ResponseCache() if cache else None
+
+
+def path_matches(path: str, pattern: str) -> bool:
+    """Whether a request path matches an endpoint pattern, where '*' matches a single path segment."""
+    return _match(_segments(path), _segments(pattern))
+
+
+def _segments(path: str) -> tuple[str, ...]:
+    return tuple(path.strip("/").split("/"))
+
+
+def _match(segments: tuple[str, ...], pattern: tuple[str, ...]) -> bool:
+    return len(segments) == len(pattern) and all(fnmatchcase(s, p) for s, p in zip(segments, pattern))
@@ -28,6 +28,9 @@ from codeocean.models.capsule import (  # noqa: F401
 from codeocean.models.components import Permissions
 from codeocean.models.computation import Computation
 from codeocean.models.data_asset import DataAssetAttachParams, DataAssetAttachResults
+from codeocean.models.decoder import decode, decode_response
+from codeocean.pagination import iterate_pages, iterate_results, validate_prefetch
+from codeocean.streaming import STREAM_CHUNK_SIZE, iter_json_array
 
 
 @dataclass
@@ -37,33 +40,44 @@ class Capsules:
     client: BaseUrlSession
     _route: str = "capsules"
 
-    def get_capsule(self, capsule_id: str) -> Capsule:
+    def get_capsule(self, capsule_id: str, raw: bool = False) -> Capsule:
         """Retrieve metadata for a specific capsule by its ID."""
         res = self.client.get(f"{self._route}/{capsule_id}")
 
-        return Capsule.from_dict(res.json())
+        return res.json() if raw else decode_response(Capsule, res)
 
     def delete_capsule(self, capsule_id: str):
         """Delete a capsule permanently."""
         self.client.delete(f"{self._route}/{capsule_id}")
 
-    def get_capsule_app_panel(self, capsule_id: str, version: Optional[int] = None) -> AppPanel:
+    def get_capsule_app_panel(self, capsule_id: str, version: Optional[int] = None, raw: bool = False) -> AppPanel:
         """Retrieve app panel information for a specific capsule by its ID."""
         res = self.client.get(f"{self._route}/{capsule_id}/app_panel", params={"version": version} if version else None)
 
-        return AppPanel.from_dict(res.json())
+        return res.json() if raw else decode_response(AppPanel, res)
 
-    def list_computations(self, capsule_id: str) -> list[Computation]:
+    def list_computations(self, capsule_id: str, raw: bool = False) -> list[Computation]:
         """Get all computations associated with a specific capsule."""
         res = self.client.get(f"{self._route}/{capsule_id}/computations")
 
-        return [Computation.from_dict(c) for c in res.json()]
+        return res.json() if raw else decode_response(list[Computation], res)
 
-    def get_permissions(self, capsule_id: str) -> Permissions:
+    def list_computations_iterator(self, capsule_id: str, raw: bool = False) -> Iterator[Computation]:
+        """
+        Iterate through all computations associated with a specific capsule.
+
+        The response is streamed and parsed incrementally, so memory use stays bounded
+        however many computations the capsule has.
+        """
+        with self.client.get(f"{self._route}/{capsule_id}/computations", stream=True) as res:
+            for item in iter_json_array(res.iter_content(STREAM_CHUNK_SIZE), None, self.client.json_backend):
+                yield item if raw else decode(Computation, item)
+
+    def get_permissions(self, capsule_id: str, raw: bool = False) -> Permissions:
         """Get permissions for a specific capsule."""
         res = self.client.get(f"{self._route}/{capsule_id}/permissions")
 
-        return Permissions.from_dict(res.json())
+        return res.json() if raw else decode_response(Permissions, res)
 
     def update_permissions(self, capsule_id: str, permissions: Permissions):
         """Update permissions for a capsule."""
@@ -76,6 +90,7 @@ class Capsules:
         self,
         capsule_id: str,
         attach_params: list[DataAssetAttachParams],
+        raw: bool = False,
     ) -> list[DataAssetAttachResults]:
         """Attach one or more data assets to a capsule with optional mount paths."""
         res = self.client.post(
@@ -83,7 +98,7 @@ class Capsules:
             json=[j.to_dict() for j in attach_params],
         )
 
-        return [DataAssetAttachResults.from_dict(c) for c in res.json()]
+        return res.json() if raw else decode_response(list[DataAssetAttachResults], res)
 
     def detach_data_assets(self, capsule_id: str, data_assets: list[str]):
         """Detach one or more data assets from a capsule by their IDs."""
@@ -92,11 +107,11 @@ class Capsules:
             json=data_assets,
         )
 
-    def sync_capsule(self, capsule_id: str) -> GitSyncResults:
+    def sync_capsule(self, capsule_id: str, raw: bool = False) -> GitSyncResults:
         """Sync a capsule with its linked external Git repository."""
         res = self.client.post(f"{self._route}/{capsule_id}/sync")
 
-        return GitSyncResults.from_dict(res.json())
+        return res.json() if raw else decode_response(GitSyncResults, res)
 
     def archive_capsule(self, capsule_id: str, archive: bool):
         """Archive or unarchive a capsule to control its visibility and accessibility."""
@@ -105,23 +120,35 @@ class Capsules:
             params={"archive": archive},
         )
 
-    def search_capsules(self, search_params: CapsuleSearchParams) -> CapsuleSearchResults:
+    def search_capsules(
+        self,
+        search_params: CapsuleSearchParams,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> CapsuleSearchResults:
         """Search for capsules with filtering, sorting, and pagination
         options."""
         res = self.client.post(f"{self._route}/search", json=search_params.to_dict())
 
-        return CapsuleSearchResults.from_dict(res.json())
-
-    def search_capsules_iterator(self, search_params: CapsuleSearchParams) -> Iterator[Capsule]:
-        """Iterate through all capsules matching search criteria with automatic pagination."""
-        params = search_params.to_dict()
-        while True:
-            response = self.search_capsules(search_params=CapsuleSearchParams(**params))
+        return res.json() if raw else decode_response(CapsuleSearchResults, res, lazy)
 
-            for result in response.results:
-                yield result
-
-            if not response.has_more:
-                return
-
-            params["next_token"] = response.next_token
+    def search_capsules_iterator(
+        self,
+        search_params: CapsuleSearchParams,
+        prefetch: int = 0,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> Iterator[Capsule]:
+        """
+        Iterate through all capsules matching search criteria with automatic pagination.
+
+        Set prefetch to request up to that many pages ahead on a background thread
+        while the current page is being consumed.
+        """
+        validate_prefetch(prefetch)
+        pages = iterate_pages(
+            lambda params: self.search_capsules(search_params=CapsuleSearchParams(**params), raw=raw, lazy=lazy),
+            search_params.to_dict(),
+            prefetch,
+        )
+        return iterate_results(pages, raw)
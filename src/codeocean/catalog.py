@@ -0,0 +1,397 @@
+"""
+Local SQLite mirror of capsule, pipeline and data asset metadata.
+
+Answering questions such as "which data assets have tag X and are larger than 1 TB"
+through the search APIs means scanning the whole catalog every time. A Catalog keeps
+a copy of the search results in a SQLite database, indexed on tags, owner, state,
+size and creation time, and answers such queries locally.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+from threading import RLock
+from time import monotonic, time
+from typing import Any, Iterable, Iterator, Optional
+import sqlite3
+
+from codeocean.client import CodeOcean
+from codeocean.models.capsule import Capsule, CapsuleSearchParams, CapsuleSortBy, CapsuleStatus
+from codeocean.models.components import SortOrder
+from codeocean.models.data_asset import (
+    DataAsset,
+    DataAssetSearchParams,
+    DataAssetSortBy,
+    DataAssetState,
+    DataAssetType,
+)
+from codeocean.models.decoder import decode
+
+CAPSULES = "capsules"
+PIPELINES = "pipelines"
+DATA_ASSETS = "data_assets"
+
+KINDS = (CAPSULES, PIPELINES, DATA_ASSETS)
+
+# Results per search request, the maximum the API allows
+PAGE_SIZE = 1000
+
+# Indexed columns of each kind besides id, created and name
+_COLUMNS = {
+    CAPSULES: ("owner", "status", "slug", "last_accessed"),
+    PIPELINES: ("owner", "status", "slug", "last_accessed"),
+    DATA_ASSETS: ("owner", "state", "type", "size", "last_used"),
+}
+_INDEXED = {
+    CAPSULES: ("owner", "status", "created"),
+    PIPELINES: ("owner", "status", "created"),
+    DATA_ASSETS: ("owner", "state", "type", "size", "created"),
+}
+_MODELS = {CAPSULES: Capsule, PIPELINES: Capsule, DATA_ASSETS: DataAsset}
+
+
+@dataclass(frozen=True)
+class RefreshReport:
+    """Summary of a catalog refresh."""
+
+    kind: str
+    full: bool
+    upserted: int
+    deleted: int
+    watermark: Optional[int]
+    elapsed: float
+
+
+@dataclass
+class Catalog:
+    """
+    Local SQLite mirror of the capsules, pipelines and data assets visible to a client.
+
+    Call refresh() to bring the mirror up to date, then query it with
+    query_capsules(), query_pipelines() and query_data_assets(). The first refresh of
+    each kind reads the whole catalog; later refreshes are incremental: results are
+    read newest first and reading stops at the creation time of the newest object
+    already mirrored (the watermark), so only objects created since are fetched.
+
+    Incremental refreshes don't see changes to objects already mirrored, such as a data
+    asset becoming ready, renamed or deleted. Run refresh(full=True) periodically to
+    pick those up: it rereads the whole catalog and removes objects that are gone.
+
+    A catalog can be shared between threads.
+
+    Fields:
+        client: Code Ocean API client used to read the catalog
+        path: SQLite database file, or ':memory:' (default) for an in-memory mirror
+    """
+
+    client: CodeOcean
+    path: str = ":memory:"
+    _lock: RLock = field(default_factory=RLock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks (kind TEXT PRIMARY KEY, created INTEGER, refreshed REAL)"
+            )
+            for kind in KINDS:
+                columns = "".join(f", {c}" for c in _COLUMNS[kind])
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {kind} (id TEXT PRIMARY KEY, created INTEGER, name TEXT{columns}, "
+                    "data TEXT NOT NULL)"
+                )
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {kind}_tags (tag TEXT, id TEXT, PRIMARY KEY (tag, id)) WITHOUT ROWID"
+                )
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS {kind}_tags_id ON {kind}_tags (id)")
+                for column in _INDEXED[kind]:
+                    self.connection.execute(f"CREATE INDEX IF NOT EXISTS {kind}_{column} ON {kind} ({column})")
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> Catalog:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def refresh(self, kinds: Iterable[str] = KINDS, full: bool = False) -> list[RefreshReport]:
+        """
+        Bring the mirror of the given kinds ('capsules', 'pipelines', 'data_assets') up
+        to date with the server.
+
+        Args:
+            kinds: Kinds of objects to refresh, all by default
+            full: Reread the whole catalog instead of only the objects created since
+                the last refresh, updating changed objects and removing deleted ones
+
+        Returns:
+            A report per kind
+
+        Raises:
+            ValueError: If a kind is unknown
+        """
+        kinds = list(kinds)
+        for kind in kinds:
+            if kind not in KINDS:
+                raise ValueError(f"Unknown kind '{kind}', should be one of {', '.join(KINDS)}")
+        return [self._refresh(kind, full) for kind in kinds]
+
+    def watermark(self, kind: str) -> Optional[int]:
+        """Creation time of the newest object mirrored of a kind, or None before its first refresh."""
+        with self._lock:
+            row = self.connection.execute("SELECT created FROM watermarks WHERE kind = ?", (kind,)).fetchone()
+        return row[0] if row else None
+
+    def get_capsule(self, capsule_id: str, raw: bool = False) -> Optional[Capsule]:
+        """Get a mirrored capsule by its ID, or None if it isn't mirrored."""
+        return self._get(CAPSULES, capsule_id, raw)
+
+    def get_pipeline(self, pipeline_id: str, raw: bool = False) -> Optional[Capsule]:
+        """Get a mirrored pipeline by its ID, or None if it isn't mirrored."""
+        return self._get(PIPELINES, pipeline_id, raw)
+
+    def get_data_asset(self, data_asset_id: str, raw: bool = False) -> Optional[DataAsset]:
+        """Get a mirrored data asset by its ID, or None if it isn't mirrored."""
+        return self._get(DATA_ASSETS, data_asset_id, raw)
+
+    def query_capsules(
+        self,
+        tags: Iterable[str] = (),
+        owner: Optional[str] = None,
+        status: Optional[CapsuleStatus] = None,
+        name: Optional[str] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        order_by: str = "created",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        raw: bool = False,
+    ) -> list[Capsule]:
+        """
+        Query mirrored capsules. See query_data_assets for the common arguments.
+
+        Args:
+            status: Only capsules with this status
+        """
+        return self._query(
+            CAPSULES, tags, {"owner": owner, "status": status}, {}, name,
+            created_after, created_before, order_by, descending, limit, raw,
+        )
+
+    def query_pipelines(
+        self,
+        tags: Iterable[str] = (),
+        owner: Optional[str] = None,
+        status: Optional[CapsuleStatus] = None,
+        name: Optional[str] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        order_by: str = "created",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        raw: bool = False,
+    ) -> list[Capsule]:
+        """Query mirrored pipelines. See query_capsules for the arguments."""
+        return self._query(
+            PIPELINES, tags, {"owner": owner, "status": status}, {}, name,
+            created_after, created_before, order_by, descending, limit, raw,
+        )
+
+    def query_data_assets(
+        self,
+        tags: Iterable[str] = (),
+        owner: Optional[str] = None,
+        state: Optional[DataAssetState] = None,
+        type: Optional[DataAssetType] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        name: Optional[str] = None,
+        created_after: Optional[int] = None,
+        created_before: Optional[int] = None,
+        order_by: str = "created",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        raw: bool = False,
+    ) -> list[DataAsset]:
+        """
+        Query mirrored data assets, e.g. query_data_assets(tags=["genomics"], min_size=2**40).
+
+        Args:
+            tags: Only data assets with all of these tags
+            owner: Only data assets of this owner ID
+            state: Only data assets in this state
+            type: Only data assets of this type
+            min_size: Only data assets of at least this size in bytes
+            max_size: Only data assets of at most this size in bytes
+            name: Only data assets whose name contains this text (case insensitive)
+            created_after: Only data assets created at or after this time
+            created_before: Only data assets created before this time
+            order_by: Column to sort by (created, name, owner, state, type, size or last_used)
+            descending: Sort in descending order
+            limit: Maximum number of data assets to return
+            raw: Return the parsed JSON instead of model objects
+
+        Raises:
+            ValueError: If order_by isn't a column of the mirror
+        """
+        return self._query(
+            DATA_ASSETS, tags, {"owner": owner, "state": state, "type": type},
+            {"size": (min_size, max_size)}, name, created_after, created_before, order_by, descending, limit, raw,
+        )
+
+    def _refresh(self, kind: str, full: bool) -> RefreshReport:
+        t0 = monotonic()
+        watermark = None if full else self.watermark(kind)
+        upserted = deleted = 0
+        newest = watermark
+        seen: set[str] = set()
+        # Pages are read from the server without holding the lock and written in a
+        # short transaction each, so queries aren't blocked during the crawl
+        page: list[dict] = []
+        for item in self._search(kind):
+            # Results are newest first: the rest was mirrored by earlier refreshes.
+            # Objects created at the watermark itself are read again, as some of
+            # them may have been created after the last refresh.
+            if watermark is not None and item["created"] < watermark:
+                break
+            page.append(item)
+            if len(page) >= PAGE_SIZE:
+                self._upsert(kind, page)
+                page = []
+            if full:
+                seen.add(item["id"])
+            upserted += 1
+            newest = item["created"] if newest is None else max(newest, item["created"])
+        self._upsert(kind, page)
+
+        # The watermark is only moved once all pages are written
+        with self._lock, self.connection:
+            if full:
+                self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY)")
+                self.connection.execute("DELETE FROM seen")
+                self.connection.executemany("INSERT INTO seen (id) VALUES (?)", ((id,) for id in seen))
+                deleted = self.connection.execute(
+                    f"DELETE FROM {kind} WHERE id NOT IN (SELECT id FROM seen)"
+                ).rowcount
+                self.connection.execute(f"DELETE FROM {kind}_tags WHERE id NOT IN (SELECT id FROM seen)")
+                self.connection.execute("DELETE FROM seen")
+            self.connection.execute(
+                "INSERT OR REPLACE INTO watermarks (kind, created, refreshed) VALUES (?, ?, ?)",
+                (kind, newest, time()),
+            )
+        return RefreshReport(
+            kind=kind,
+            full=full,
+            upserted=upserted,
+            deleted=deleted,
+            watermark=newest,
+            elapsed=monotonic() - t0,
+        )
+
+    def _upsert(self, kind: str, items: list[dict]):
+        if not items:
+            return
+        columns = ("id", "created", "name", *_COLUMNS[kind])
+        insert = (
+            f"INSERT OR REPLACE INTO {kind} ({', '.join(columns)}, data) "
+            f"VALUES ({', '.join('?' for _ in columns)}, ?)"
+        )
+        dumps = self.client.session.json_backend.dumps
+        rows = [[*(_column_value(item.get(c)) for c in columns), dumps(item).decode("utf-8")] for item in items]
+        ids = [(item["id"],) for item in items]
+        tags = [(tag, item["id"]) for item in items for tag in item.get("tags") or ()]
+        with self._lock, self.connection:
+            self.connection.executemany(insert, rows)
+            self.connection.executemany(f"DELETE FROM {kind}_tags WHERE id = ?", ids)
+            self.connection.executemany(f"INSERT OR IGNORE INTO {kind}_tags (tag, id) VALUES (?, ?)", tags)
+
+    def _search(self, kind: str) -> Iterator[dict]:
+        if kind == DATA_ASSETS:
+            return self.client.data_assets.search_data_assets_iterator(
+                DataAssetSearchParams(
+                    limit=PAGE_SIZE,
+                    sort_field=DataAssetSortBy.Created,
+                    sort_order=SortOrder.Descending,
+                ),
+                raw=True,
+            )
+        params = CapsuleSearchParams(
+            limit=PAGE_SIZE,
+            sort_field=CapsuleSortBy.Created,
+            sort_order=SortOrder.Descending,
+        )
+        if kind == PIPELINES:
+            return self.client.pipelines.search_pipelines_iterator(params, raw=True)
+        return self.client.capsules.search_capsules_iterator(params, raw=True)
+
+    def _get(self, kind: str, id: str, raw: bool) -> Any:
+        with self._lock:
+            row = self.connection.execute(f"SELECT data FROM {kind} WHERE id = ?", (id,)).fetchone()
+        if row is None:
+            return None
+        data = self.client.session.json_backend.loads(row[0])
+        return data if raw else decode(_MODELS[kind], data)
+
+    def _query(
+        self,
+        kind: str,
+        tags: Iterable[str],
+        equal: dict[str, Any],
+        ranges: dict[str, tuple[Optional[int], Optional[int]]],
+        name: Optional[str],
+        created_after: Optional[int],
+        created_before: Optional[int],
+        order_by: str,
+        descending: bool,
+        limit: Optional[int],
+        raw: bool,
+    ) -> list:
+        if order_by not in ("id", "created", "name", *_COLUMNS[kind]):
+            raise ValueError(f"Can't order {kind} by '{order_by}'")
+        conditions = []
+        params: list[Any] = []
+        for tag in dict.fromkeys(tags):
+            conditions.append(f"id IN (SELECT id FROM {kind}_tags WHERE tag = ?)")
+            params.append(tag)
+        for column, value in equal.items():
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(_column_value(value))
+        for column, (low, high) in ranges.items():
+            if low is not None:
+                conditions.append(f"{column} >= ?")
+                params.append(low)
+            if high is not None:
+                conditions.append(f"{column} <= ?")
+                params.append(high)
+        if created_after is not None:
+            conditions.append("created >= ?")
+            params.append(created_after)
+        if created_before is not None:
+            conditions.append("created < ?")
+            params.append(created_before)
+        if name is not None:
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+
+        sql = f"SELECT data FROM {kind}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self.connection.execute(sql, params).fetchall()
+        loads = self.client.session.json_backend.loads
+        model = _MODELS[kind]
+        return [loads(data) if raw else decode(model, loads(data)) for data, in rows]
+
+
+def _column_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
@@ -0,0 +1,190 @@
+"""
+Circuit breaker failing requests fast while the Code Ocean server is unavailable.
+
+The breaker tracks the outcome of a client's recent requests. When too many of them
+fail with server errors (5xx), connection errors or timeouts, e.g. during a
+maintenance window, it opens: requests fail immediately with CircuitOpenError instead
+of waiting on the server, which can then recover without the load of retrying
+clients. After reset_timeout it lets probe requests through (half-open) and closes
+again when they succeed, or reopens when one fails.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Callable, Optional
+
+from codeocean.enum import StrEnum
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    Closed = "closed"
+    Open = "open"
+    HalfOpen = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit breaker is open.
+
+    Attributes:
+        retry_after (float): Seconds until the breaker lets probe requests through
+    """
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"Circuit breaker is open, the next request will be let through in {retry_after:.1f} seconds")
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """State and counters of a circuit breaker."""
+
+    state: CircuitState
+    failure_rate: float
+    trips: int
+    rejected: int
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by the resource clients of a client.
+
+    Client errors (4xx) count as successes: the server is up and answering.
+
+    Args:
+        failure_rate: Fraction of failed requests among the last window requests that
+            opens the breaker
+        window: Number of recent requests the failure rate is computed over
+        min_requests: Minimum number of requests in the window before the breaker can open
+        reset_timeout: Seconds the breaker stays open before letting probe requests through
+        half_open_probes: Number of probe requests let through while half-open, all
+            of which must succeed to close the breaker
+        clock: Time source, in seconds
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        reset_timeout: float = 30,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if not 0 < failure_rate <= 1:
+            raise ValueError(f"Failure rate {failure_rate} should be between 0 and 1")
+        if not 1 <= min_requests <= window:
+            raise ValueError(f"Min requests {min_requests} should be between 1 and window {window}")
+        if half_open_probes < 1:
+            raise ValueError(f"Half open probes {half_open_probes} should be greater than or equal to 1")
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.clock = clock
+        self._lock = Lock()
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.Closed
+        self._opened = 0.0
+        self._probes = self._probe_successes = 0
+        self._trips = self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, for health checks."""
+        with self._lock:
+            return self._current_state()
+
+    def acquire(self) -> bool:
+        """
+        Check that a request can be sent, taking a probe slot while half-open. Report
+        its outcome with release().
+
+        Returns:
+            Whether the request is a probe of a half-open breaker
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all probes in flight
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.Closed:
+                return False
+            if state == CircuitState.HalfOpen and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+            self._rejected += 1
+            retry_after = max(0.0, self._opened + self.reset_timeout - self.clock())
+        raise CircuitOpenError(retry_after)
+
+    def release(self, probe: bool, healthy: Optional[bool]):
+        """
+        Report the outcome of a request let through by acquire(): healthy is True if
+        the server answered it, False if it failed with a server error, connection
+        error or timeout, or None if it didn't get an outcome (e.g. it wasn't sent).
+        """
+        with self._lock:
+            if probe:
+                if self._state != CircuitState.HalfOpen:
+                    return
+                # A probe of an earlier half-open period may be released after it ended
+                self._probes = max(0, self._probes - 1)
+                if healthy is False:
+                    self._open()
+                elif healthy:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_probes:
+                        self._state = CircuitState.Closed
+                        self._outcomes.clear()
+                return
+            # Outcomes of requests sent before the breaker opened are ignored
+            if healthy is None or self._state != CircuitState.Closed:
+                return
+            self._outcomes.append(healthy)
+            if len(self._outcomes) >= self.min_requests and self._failure_rate() >= self.failure_rate:
+                self._open()
+                self._trips += 1
+
+    def reset(self):
+        """Close the breaker and forget the recorded outcomes."""
+        with self._lock:
+            self._state = CircuitState.Closed
+            self._outcomes.clear()
+            self._probes = self._probe_successes = 0
+
+    @property
+    def stats(self) -> CircuitBreakerStats:
+        """Snapshot of the circuit breaker state and counters."""
+        with self._lock:
+            return CircuitBreakerStats(
+                state=self._current_state(),
+                failure_rate=self._failure_rate(),
+                trips=self._trips,
+                rejected=self._rejected,
+            )
+
+    def _current_state(self) -> CircuitState:
+        if self._state == CircuitState.Open and self.clock() >= self._opened + self.reset_timeout:
+            self._state = CircuitState.HalfOpen
+            self._probes = self._probe_successes = 0
+        return self._state
+
+    def _open(self):
+        self._state = CircuitState.Open
+        self._opened = self.clock()
+        self._outcomes.clear()
+
+    def _failure_rate(self) -> float:
+        return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+
+
+def get_circuit_breaker(circuit_breaker: bool | CircuitBreaker) -> Optional[CircuitBreaker]:
+    """Get the circuit breaker for a client's circuit_breaker setting: True, False or a CircuitBreaker."""
+    if isinstance(circuit_breaker, CircuitBreaker):
+        return circuit_breaker
+    return CircuitBreaker() if circuit_breaker else None
@@ -2,17 +2,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from requests_toolbelt.adapters.socket_options import TCPKeepAliveAdapter
-from requests_toolbelt.sessions import BaseUrlSession
 from typing import Optional
 from urllib3.util import Retry
 import requests
 
+from codeocean.cache import ResponseCache, get_cache
 from codeocean.capsule import Capsules
+from codeocean.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from codeocean.coalesce import RequestCoalescer, get_coalescer
 from codeocean.computation import Computations
 from codeocean.custom_metadata import CustomMetadataSchema
 from codeocean.data_asset import DataAssets
 from codeocean.error import Error
+from codeocean.hedge import Hedger, get_hedger
+from codeocean.json_backend import JSONBackend, get_json_backend
 from codeocean.pipeline import Pipelines
+from codeocean.rate_limit import RateLimiter, get_rate_limiter
+from codeocean.retry import RetryPolicy, get_retry_policy
+from codeocean.session import DEFAULT_TIMEOUT, Session
 
 
 @dataclass
@@ -23,6 +30,17 @@ class CodeOcean:
     This class provides a unified interface to access Code Ocean's API endpoints
     for managing capsules, pipelines, computations, and data assets.
 
+    A single client instance can be shared across threads: all resource clients use
+    one HTTP session whose connection pool is thread-safe. When sharing a client between
+    N worker threads, set pool_maxsize to at least N so that connections are reused
+    instead of being discarded when the pool is full.
+
+    Resource client methods that return API objects, including the search iterators,
+    accept raw=True to return the parsed JSON (dicts and lists) instead of model
+    objects. This skips model construction when only a few fields are needed, e.g.
+    for bulk exports. The search methods and iterators also accept lazy=True to return
+    models whose nested fields are only decoded when first accessed.
+
     Fields:
         domain: The Code Ocean domain URL (e.g., 'https://codeocean.acme.com')
         token: Code Ocean API access token
@@ -30,18 +48,95 @@ class CodeOcean:
                 (number of retries) or a urllib3.util.Retry object for advanced
                 retry configuration. Defaults to 0 (no retries)
         agent_id: Optional agent identifier for tracking AI agent API usage on behalf of users
+        pool_maxsize: Maximum number of connections kept open to the Code Ocean server.
+                Defaults to 10
+        pool_block: Whether threads should block waiting for a free connection when all
+                pool_maxsize connections are in use, instead of opening a new connection
+                that is discarded afterwards. Defaults to False
+        keep_alive_idle: Seconds a connection is idle before TCP keep-alive probes are sent
+        keep_alive_interval: Seconds between TCP keep-alive probes
+        keep_alive_count: Number of failed TCP keep-alive probes before dropping the connection
+        json_backend: JSON library used for request and response bodies: 'auto' (default, the
+                fastest installed of orjson and msgspec, else the stdlib json module), 'orjson',
+                'msgspec', 'json' or a JSONBackend instance
+        cache: Cache GET responses of read-mostly endpoints (capsules, app panels,
+                permissions and custom metadata) in memory: True for a ResponseCache with
+                the default TTLs, or a ResponseCache instance. Mutations made through this
+                client invalidate the affected responses. Statistics are available from
+                session.cache.stats. Defaults to False (no caching)
+        coalesce: Share one HTTP request between concurrent identical GET requests, e.g.
+                simultaneous get_data_asset(id) calls from many threads, so that bursts of
+                reads of a popular object don't flood the server: True for a
+                RequestCoalescer, or a RequestCoalescer instance. Statistics are available
+                from session.coalescer.stats. Defaults to False
+        rate_limit: Pace the requests of all resource clients with a token bucket and adapt
+                the number of requests in flight to the load the server accepts (AIMD on
+                429, 5xx and slow responses). Throttled (429) requests are retried after
+                their Retry-After delay, by the retry policy instead when retry is set.
+                True for a RateLimiter with the default settings,
+                or a RateLimiter instance. Statistics are available from
+                session.rate_limiter.stats. Defaults to False
+        retry: Retry requests failing with transient errors (connection errors, timeouts,
+                429 and 5xx responses) with exponential backoff, where it is safe for their
+                endpoint: reads, including searches, are retried, while creates such as
+                run_capsule and create_data_asset are only retried when they certainly
+                weren't processed. True for a RetryPolicy with the default settings, or a
+                RetryPolicy instance, e.g. to send idempotency keys. Unlike retries, which
+                configures connection level retries, this applies per endpoint. Defaults
+                to False
+        timeout: Seconds to wait for the server to accept a connection and between bytes
+                of its responses, or a (connect, read) tuple, so that stalled connections
+                don't hang callers, or None to wait forever. Defaults to (10, 60). To
+                bound the total time of calls, including those sending many requests such
+                as iterators and wait_until_* loops, use codeocean.deadline.deadline()
+        circuit_breaker: Fail requests fast with CircuitOpenError while the server is
+                unavailable: after too many recent requests failed with 5xx, connection
+                errors or timeouts, requests aren't sent until probe requests succeed
+                again. True for a CircuitBreaker with the default settings, or a
+                CircuitBreaker instance. Its state, for health checks, is available from
+                session.circuit_breaker.state. Defaults to False
+        hedge: Cut the tail latency of reads such as get_computation and get_data_asset:
+                when a GET request of an object isn't answered within a percentile of
+                the recent latencies, send a second one and use whichever response
+                arrives first. Hedges are limited to a fraction of the requests. True for
+                a Hedger with the default settings, or a Hedger instance, e.g. to hedge
+                other endpoints. Statistics, including how often hedges are sent and win, are
+                available from session.hedger.stats. Defaults to False
     """
 
     domain: str
     token: str
     retries: Optional[Retry | int] = 0
     agent_id: Optional[str] = None
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive_idle: int = 60
+    keep_alive_interval: int = 20
+    keep_alive_count: int = 5
+    json_backend: str | JSONBackend = "auto"
+    cache: bool | ResponseCache = False
+    coalesce: bool | RequestCoalescer = False
+    rate_limit: bool | RateLimiter = False
+    retry: bool | RetryPolicy = False
+    timeout: Optional[float | tuple[float, float]] = DEFAULT_TIMEOUT
+    circuit_breaker: bool | CircuitBreaker = False
+    hedge: bool | Hedger = False
 
     # Minimum server version required by this SDK
     MIN_SERVER_VERSION = "4.6.0"
 
     def __post_init__(self):
-        self.session = BaseUrlSession(base_url=f"{self.domain}/api/v1/")
+        self.session = Session(
+            base_url=f"{self.domain}/api/v1/",
+            json_backend=get_json_backend(self.json_backend),
+            cache=get_cache(self.cache),
+            coalescer=get_coalescer(self.coalesce),
+            rate_limiter=get_rate_limiter(self.rate_limit),
+            retry_policy=get_retry_policy(self.retry),
+            timeout=self.timeout,
+            circuit_breaker=get_circuit_breaker(self.circuit_breaker),
+            hedger=get_hedger(self.hedge),
+        )
         self.session.auth = (self.token, "")
         self.session.headers.update({
             "Content-Type": "application/json",
@@ -49,8 +144,15 @@ class CodeOcean:
         })
         if self.agent_id:
             self.session.headers.update({"Agent-Id": self.agent_id})
-        self.session.hooks["response"] = [self._error_handler]
-        self.session.mount(self.domain, TCPKeepAliveAdapter(max_retries=self.retries))
+        self.session.hooks["response"].append(self._error_handler)
+        self.session.mount(self.domain, TCPKeepAliveAdapter(
+            max_retries=self.retries,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            idle=self.keep_alive_idle,
+            interval=self.keep_alive_interval,
+            count=self.keep_alive_count,
+        ))
 
         self.capsules = Capsules(client=self.session)
         self.computations = Computations(client=self.session)
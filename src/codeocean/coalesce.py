@@ -0,0 +1,149 @@
+"""
+Coalescing of concurrent identical GET requests.
+
+When many threads or tasks read the same object at once, e.g. a burst of
+get_data_asset(id) calls for a popular data asset, a RequestCoalescer sends a single
+HTTP request: the first caller sends it and the callers arriving while it is in
+flight wait for it and get the same response (or error). Each caller still decodes
+the response into its own model objects.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Mapping, Optional
+from urllib.parse import urlencode
+import asyncio
+
+from codeocean.deadline import DeadlineExceeded, capped_wait
+
+CoalesceKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(frozen=True)
+class CoalescerStats:
+    """Counters of a request coalescer."""
+
+    requests: int
+    coalesced: int
+
+    @property
+    def coalesced_rate(self) -> float:
+        """Fraction of calls that shared another call's request."""
+        total = self.requests + self.coalesced
+        return self.coalesced / total if total else 0.0
+
+
+class _Call:
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = Event()
+        self.response = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Shares one in-flight request between concurrent identical GET requests.
+
+    Requests are identical when they have the same path, query parameters and extra
+    headers. Only relative GET requests whose response isn't streamed are coalesced;
+    the response is shared between the callers, so treat it as read-only.
+    """
+
+    def __init__(self):
+        self._calls: dict[CoalesceKey, _Call] = {}
+        self._tasks: dict[CoalesceKey, asyncio.Future] = {}
+        self._lock = Lock()
+        self._requests = self._coalesced = 0
+
+    def key(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[CoalesceKey]:
+        """Coalescing key of a request, or None if it isn't coalesced."""
+        if method.upper() != "GET" or "://" in url:
+            return None
+        if isinstance(params, Mapping):
+            params = {k: v for k, v in params.items() if v is not None}
+        return (
+            url.strip("/"),
+            urlencode(params, doseq=True) if params else "",
+            tuple(sorted((k.lower(), v) for k, v in headers.items())) if headers else (),
+        )
+
+    def call(self, key: CoalesceKey, send: Callable[[], Any]) -> Any:
+        """
+        Send a request, or wait for the identical one in flight and return its response.
+
+        Raises:
+            DeadlineExceeded: If the current deadline passes while waiting for the request in flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._requests += 1
+            else:
+                self._coalesced += 1
+        if not leader:
+            if not call.done.wait(capped_wait(None)):
+                raise DeadlineExceeded("Deadline exceeded while waiting for an identical request in flight")
+            if call.error is not None:
+                raise call.error
+            return call.response
+
+        try:
+            call.response = send()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.response
+
+    async def acall(self, key: CoalesceKey, send: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Asynchronous version of call(). The request runs in its own task, so that it
+        isn't cancelled while other callers wait for it.
+        """
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(send())
+                task.add_done_callback(lambda task: self._done(key, task))
+                self._requests += 1
+            else:
+                self._coalesced += 1
+        # Waiting doesn't cancel the task when the caller is cancelled or its deadline passes
+        done, _ = await asyncio.wait((task,), timeout=capped_wait(None))
+        if not done:
+            raise DeadlineExceeded("Deadline exceeded while waiting for an identical request in flight")
+        return task.result()
+
+    def _done(self, key: CoalesceKey, task: asyncio.Future):
+        with self._lock:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Retrieve the error in case all callers were cancelled
+            task.exception()
+
+    @property
+    def stats(self) -> CoalescerStats:
+        """Snapshot of the coalescer counters."""
+        with self._lock:
+            return CoalescerStats(requests=self._requests, coalesced=self._coalesced)
+
+
+def get_coalescer(coalesce: bool | RequestCoalescer) -> Optional[RequestCoalescer]:
+    """Get the request coalescer for a client's coalesce setting: True, False or a RequestCoalescer."""
+    if isinstance(coalesce, RequestCoalescer):
+        return coalesce
+    return RequestCoalescer() if coalesce else None
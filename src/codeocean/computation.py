@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from requests_toolbelt.sessions import BaseUrlSession
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from time import sleep, time
 from warnings import warn
 
+from codeocean.download import DEFAULT_CHUNK_SIZE, download_file
 from codeocean.models.computation import Computation, ComputationState, RunParams
 # Re-exports for backward compatibility
 from codeocean.models.computation import (  # noqa: F401
@@ -18,7 +19,19 @@ from codeocean.models.computation import (  # noqa: F401
     PipelineProcessParams,
 )
 from codeocean.models.data_asset import DataAssetAttachParams, DataAssetAttachResults
-from codeocean.models.folder import FileURLs, Folder, DownloadFileURL
+from codeocean.models.decoder import decode, decode_response
+from codeocean.models.folder import FileURLs, Folder, DownloadFileURL, FolderItem
+from codeocean.polling import (
+    FixedInterval,
+    PollingStrategy,
+    capped_delay,
+    poll_many,
+    validate_polling,
+    validate_request_rate,
+)
+from codeocean.streaming import STREAM_CHUNK_SIZE, iter_json_array
+from codeocean.sync import SyncReport, sync_folder
+from codeocean.walk import walk_folder
 
 
 @dataclass
@@ -27,13 +40,13 @@ class Computations:
 
     client: BaseUrlSession
 
-    def get_computation(self, computation_id: str) -> Computation:
+    def get_computation(self, computation_id: str, raw: bool = False) -> Computation:
         """Retrieve metadata and status information for a specific computation by its ID."""
         res = self.client.get(f"computations/{computation_id}")
 
-        return Computation.from_dict(res.json())
+        return res.json() if raw else decode_response(Computation, res)
 
-    def run_capsule(self, run_params: RunParams) -> Computation:
+    def run_capsule(self, run_params: RunParams, raw: bool = False) -> Computation:
         """
         Execute a capsule or pipeline with specified parameters and data assets.
 
@@ -46,7 +59,7 @@ class Computations:
         """
         res = self.client.post("computations", json=run_params.to_dict())
 
-        return Computation.from_dict(res.json())
+        return res.json() if raw else decode_response(Computation, res)
 
     # Alias for run_capsule
     run_pipeline = run_capsule
@@ -56,6 +69,7 @@ class Computations:
         computation: Computation,
         polling_interval: float = 5,
         timeout: Optional[float] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
     ) -> Computation:
         """
         Poll a computation until it reaches 'Completed' or 'Failed' state with configurable timing.
@@ -64,26 +78,19 @@ class Computations:
             computation: The computation object to monitor
             polling_interval: Time between status checks in seconds (minimum 5 seconds)
             timeout: Maximum time to wait in seconds, or None for no timeout
+            polling_strategy: Optional strategy deciding the delay between status checks
+                (e.g. ExponentialBackoff, DecorrelatedJitter or ExpectedRunTime). Overrides
+                polling_interval when set
 
         Returns:
             Updated computation object once completed or failed
 
         Raises:
-            ValueError: If polling_interval < 5 or timeout constraints are violated
+            ValueError: If polling_interval < 5 without a polling_strategy or timeout constraints are violated
             TimeoutError: If computation doesn't complete within the timeout period
         """
-        if polling_interval < 5:
-            raise ValueError(
-                f"Polling interval {polling_interval} should be greater than or equal to 5"
-            )
-        if timeout is not None and timeout < polling_interval:
-            raise ValueError(
-                f"Timeout {timeout} should be greater than or equal to polling interval {polling_interval}"
-            )
-        if timeout is not None and timeout < 0:
-            raise ValueError(
-                f"Timeout {timeout} should be greater than or equal to 0 (seconds), or None"
-            )
+        validate_polling(polling_interval, timeout, polling_strategy)
+        delays = (polling_strategy or FixedInterval(polling_interval)).delays(computation.created)
         t0 = time()
         while True:
             comp = self.get_computation(computation.id)
@@ -91,24 +98,92 @@ class Computations:
             if comp.state in [ComputationState.Completed, ComputationState.Failed]:
                 return comp
 
-            if timeout is not None and (time() - t0) > timeout:
+            if timeout is not None and (time() - t0) >= timeout:
                 raise TimeoutError(
                     f"Computation {computation.id} did not complete within {timeout} seconds"
                 )
 
-            sleep(polling_interval)
+            sleep(capped_delay(next(delays), t0, timeout))
+
+    def as_completed(
+        self,
+        computations: Iterable[Computation],
+        polling_interval: float = 5,
+        timeout: Optional[float] = None,
+        max_requests_per_second: float = 2,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> Iterator[Computation]:
+        """
+        Poll many computations from a single loop and yield each one as soon as it
+        reaches 'Completed' or 'Failed' state.
+
+        Args:
+            computations: The computation objects to monitor
+            polling_interval: Time between status checks of each computation in seconds
+                (minimum 5 seconds)
+            timeout: Maximum time to wait for all computations in seconds, or None for no timeout
+            max_requests_per_second: Request rate budget shared by all status checks
+            polling_strategy: Optional strategy deciding the delay between status checks of
+                each computation. Overrides polling_interval when set
+
+        Returns:
+            Iterator of updated computation objects in completion order
+
+        Raises:
+            ValueError: If polling_interval < 5 without a polling_strategy, timeout constraints are
+                violated or max_requests_per_second <= 0
+            TimeoutError: If some computations don't complete within the timeout period
+        """
+        validate_polling(polling_interval, timeout, polling_strategy)
+        validate_request_rate(max_requests_per_second)
+        computations = list({c.id: c for c in computations}.values())
+        return poll_many(
+            [c.id for c in computations],
+            self.get_computation,
+            lambda c: c.state in [ComputationState.Completed, ComputationState.Failed],
+            polling_strategy or FixedInterval(polling_interval),
+            max_requests_per_second=max_requests_per_second,
+            timeout=timeout,
+            label="Computations",
+            started=[c.created for c in computations],
+        )
+
+    def wait_many(
+        self,
+        computations: Iterable[Computation],
+        polling_interval: float = 5,
+        timeout: Optional[float] = None,
+        max_requests_per_second: float = 2,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> list[Computation]:
+        """
+        Poll many computations from a single loop until all reach 'Completed' or 'Failed'
+        state. See as_completed for the arguments.
+
+        Returns:
+            Updated computation objects in the same order as the input
+        """
+        computations = list(computations)
+        completed = {
+            c.id: c
+            for c in self.as_completed(
+                computations, polling_interval, timeout, max_requests_per_second, polling_strategy,
+            )
+        }
+        return [completed[c.id] for c in computations]
 
     def attach_data_assets(
         self,
         computation_id: str,
         attach_params: list[DataAssetAttachParams],
+        raw: bool = False,
     ) -> list[DataAssetAttachResults]:
         """Attach one or more data assets to a cloud workstation session computation."""
         res = self.client.post(
             f"computations/{computation_id}/data_assets",
             json=[j.to_dict() for j in attach_params],
         )
-        return [DataAssetAttachResults.from_dict(c) for c in res.json()]
+        return res.json() if raw else decode_response(list[DataAssetAttachResults], res)
 
     def detach_data_assets(self, computation_id: str, data_assets: list[str]):
         """Detach one or more data assets from a cloud workstation session computation by their IDs."""
@@ -117,7 +192,7 @@ class Computations:
             json=data_assets,
         )
 
-    def list_computation_results(self, computation_id: str, path: str = "") -> Folder:
+    def list_computation_results(self, computation_id: str, path: str = "", raw: bool = False) -> Folder:
         """List result files and folders generated by a computation
         at the specified path. Empty path retrieves the /results root folder."""
         data = {
@@ -126,9 +201,57 @@ class Computations:
 
         res = self.client.post(f"computations/{computation_id}/results", json=data)
 
-        return Folder.from_dict(res.json())
+        return res.json() if raw else decode_response(Folder, res)
+
+    def list_computation_results_iterator(
+        self,
+        computation_id: str,
+        path: str = "",
+        raw: bool = False,
+    ) -> Iterator[FolderItem]:
+        """
+        Iterate through the result files and folders generated by a computation at the
+        specified path. Empty path retrieves the /results root folder.
 
-    def get_result_file_download_url(self, computation_id: str, path: str) -> DownloadFileURL:
+        The response is streamed and parsed incrementally, so memory use stays bounded
+        however large the folder is.
+        """
+        data = {
+            "path": path,
+        }
+
+        with self.client.post(f"computations/{computation_id}/results", json=data, stream=True) as res:
+            for item in iter_json_array(res.iter_content(STREAM_CHUNK_SIZE), "items", self.client.json_backend):
+                yield item if raw else decode(FolderItem, item)
+
+    def walk_computation_results(
+        self,
+        computation_id: str,
+        path: str = "",
+        max_workers: int = 8,
+        max_depth: Optional[int] = None,
+        pattern: Optional[str] = None,
+    ) -> Iterator[FolderItem]:
+        """
+        Recursively list result files and folders of a computation, expanding
+        subfolders concurrently and yielding items as their folder listings arrive.
+
+        Args:
+            computation_id: ID of the computation
+            path: Folder to start from; empty string for the /results root folder
+            max_workers: Maximum number of concurrent folder listings
+            max_depth: Number of subfolder levels below path to expand, or None for no limit
+            pattern: Optional glob pattern that yielded items' paths must match
+        """
+        return walk_folder(
+            lambda p: self.list_computation_results(computation_id, p),
+            path,
+            max_workers=max_workers,
+            max_depth=max_depth,
+            pattern=pattern,
+        )
+
+    def get_result_file_download_url(self, computation_id: str, path: str, raw: bool = False) -> DownloadFileURL:
         """[DEPRECATED] Generate a download URL for a specific result file from a computation.
 
         Deprecated: Use get_result_file_urls instead.
@@ -144,16 +267,83 @@ class Computations:
             params={"path": path},
         )
 
-        return DownloadFileURL.from_dict(res.json())
+        return res.json() if raw else decode_response(DownloadFileURL, res)
 
-    def get_result_file_urls(self, computation_id: str, path: str) -> FileURLs:
+    def get_result_file_urls(self, computation_id: str, path: str, raw: bool = False) -> FileURLs:
         """Generate view and download URLs for a specific result file from a computation."""
         res = self.client.get(
             f"computations/{computation_id}/results/urls",
             params={"path": path},
         )
 
-        return FileURLs.from_dict(res.json())
+        return res.json() if raw else decode_response(FileURLs, res)
+
+    def download_result_file(
+        self,
+        computation_id: str,
+        path: str,
+        destination: str,
+        max_workers: int = 8,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> str:
+        """
+        Download a result file from a computation to a local file using concurrent
+        HTTP Range requests.
+
+        Interrupted downloads resume from the chunks already written when called again
+        with the same destination, and expired signed URLs are regenerated automatically.
+
+        Args:
+            computation_id: ID of the computation
+            path: Path of the file within the computation's results folder
+            destination: Local file path to write to
+            max_workers: Maximum number of concurrent Range requests
+            chunk_size: Size of each Range request in bytes
+
+        Returns:
+            The destination path
+        """
+        return download_file(
+            lambda: self.get_result_file_urls(computation_id, path).download_url,
+            destination,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+        )
+
+    def sync_results(
+        self,
+        computation_id: str,
+        local_dir: str,
+        path: str = "",
+        max_workers: int = 8,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> SyncReport:
+        """
+        Mirror a computation's result folder to a local directory.
+
+        Only files that are missing locally or whose local size differs from the
+        result file size are downloaded, so repeated syncs skip unchanged files.
+        Files are downloaded in parallel while the result tree is still being listed.
+
+        Args:
+            computation_id: ID of the computation
+            local_dir: Local directory to mirror the results into
+            path: Result folder to sync; empty string for the whole /results folder
+            max_workers: Maximum number of concurrent folder listings and file downloads
+            chunk_size: Size of each Range request in bytes
+
+        Returns:
+            Counts of downloaded and skipped files, bytes downloaded, elapsed time
+            and throughput
+        """
+        return sync_folder(
+            self.walk_computation_results(computation_id, path, max_workers=max_workers),
+            lambda p: self.get_result_file_urls(computation_id, p).download_url,
+            local_dir,
+            path,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+        )
 
     def delete_computation(self, computation_id: str):
         """Delete a computation and stop it if currently running."""
@@ -6,6 +6,7 @@ from typing import Optional, Union
 from requests_toolbelt.sessions import BaseUrlSession
 
 from codeocean.enum import StrEnum
+from codeocean.models.decoder import decode_response
 
 
 class CustomMetadataFieldType(StrEnum):
@@ -89,8 +90,8 @@ class CustomMetadataSchema:
 
     client: BaseUrlSession
 
-    def get_custom_metadata(self) -> CustomMetadata:
+    def get_custom_metadata(self, raw: bool = False) -> CustomMetadata:
         """Retrieve the Code Ocean deployment's custom metadata schema."""
         res = self.client.get("custom_metadata")
 
-        return CustomMetadata.from_dict(res.json())
+        return res.json() if raw else decode_response(CustomMetadata, res)
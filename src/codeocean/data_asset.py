@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from requests_toolbelt.sessions import BaseUrlSession
 from time import sleep, time
-from typing import Iterator
+from typing import Iterable, Iterator
 from warnings import warn
 
+from codeocean.download import DEFAULT_CHUNK_SIZE, download_file
 from codeocean.models.components import Permissions
 from codeocean.models.data_asset import (
     DataAsset,
@@ -37,7 +38,20 @@ from codeocean.models.data_asset import (  # noqa: F401
     DataAssetSearchOrigin,
     ContainedDataAsset,
 )
-from codeocean.models.folder import FileURLs, Folder, DownloadFileURL
+from codeocean.models.decoder import decode, decode_response
+from codeocean.models.folder import FileURLs, Folder, DownloadFileURL, FolderItem
+from codeocean.pagination import iterate_pages, iterate_results, validate_prefetch
+from codeocean.polling import (
+    FixedInterval,
+    PollingStrategy,
+    capped_delay,
+    poll_many,
+    validate_polling,
+    validate_request_rate,
+)
+from codeocean.streaming import STREAM_CHUNK_SIZE, iter_json_array
+from codeocean.sync import SyncReport, sync_folder
+from codeocean.walk import walk_folder
 
 
 @dataclass
@@ -46,13 +60,13 @@ class DataAssets:
 
     client: BaseUrlSession
 
-    def get_data_asset(self, data_asset_id: str) -> DataAsset:
+    def get_data_asset(self, data_asset_id: str, raw: bool = False) -> DataAsset:
         """Retrieve metadata for a specific data asset by its ID."""
         res = self.client.get(f"data_assets/{data_asset_id}")
 
-        return DataAsset.from_dict(res.json())
+        return res.json() if raw else decode_response(DataAsset, res)
 
-    def update_metadata(self, data_asset_id: str, update_params: DataAssetUpdateParams) -> DataAsset:
+    def update_metadata(self, data_asset_id: str, update_params: DataAssetUpdateParams, raw: bool = False) -> DataAsset:
         """
         Update metadata for a data asset including name, description, tags, mount,
         and custom metadata.
@@ -69,9 +83,9 @@ class DataAssets:
             json=update_params.to_dict(),
         )
 
-        return DataAsset.from_dict(res.json())
+        return res.json() if raw else decode_response(DataAsset, res)
 
-    def create_data_asset(self, data_asset_params: DataAssetParams) -> DataAsset:
+    def create_data_asset(self, data_asset_params: DataAssetParams, raw: bool = False) -> DataAsset:
         """
         Create a new data asset from various sources including S3 buckets,
         computation results, or combined assets.
@@ -89,13 +103,14 @@ class DataAssets:
         """
         res = self.client.post("data_assets", json=data_asset_params.to_dict())
 
-        return DataAsset.from_dict(res.json())
+        return res.json() if raw else decode_response(DataAsset, res)
 
     def wait_until_ready(
         self,
         data_asset: DataAsset,
         polling_interval: float = 5,
         timeout: float | None = None,
+        polling_strategy: PollingStrategy | None = None,
     ) -> DataAsset:
         """
         Poll a data asset until it reaches 'Ready' or 'Failed' state with configurable
@@ -106,26 +121,19 @@ class DataAssets:
             polling_interval: Time between status checks in seconds
                 (minimum 5 seconds)
             timeout: Maximum time to wait in seconds, or None for no timeout
+            polling_strategy: Optional strategy deciding the delay between status checks
+                (e.g. ExponentialBackoff, DecorrelatedJitter or ExpectedRunTime). Overrides
+                polling_interval when set
 
         Returns:
             Updated data asset object once ready or failed
 
         Raises:
-            ValueError: If polling_interval < 5 or timeout constraints are violated
+            ValueError: If polling_interval < 5 without a polling_strategy or timeout constraints are violated
             TimeoutError: If data asset doesn't become ready within timeout period
         """
-        if polling_interval < 5:
-            raise ValueError(
-                f"Polling interval {polling_interval} should be greater than or equal to 5"
-            )
-        if timeout is not None and timeout < polling_interval:
-            raise ValueError(
-                f"Timeout {timeout} should be greater than or equal to polling interval {polling_interval}"
-            )
-        if timeout is not None and timeout < 0:
-            raise ValueError(
-                f"Timeout {timeout} should be greater than or equal to 0 (seconds), or None"
-            )
+        validate_polling(polling_interval, timeout, polling_strategy)
+        delays = (polling_strategy or FixedInterval(polling_interval)).delays(data_asset.created)
         t0 = time()
         while True:
             da = self.get_data_asset(data_asset.id)
@@ -133,12 +141,79 @@ class DataAssets:
             if da.state in [DataAssetState.Ready, DataAssetState.Failed]:
                 return da
 
-            if timeout is not None and (time() - t0) > timeout:
+            if timeout is not None and (time() - t0) >= timeout:
                 raise TimeoutError(
                     f"Data asset {data_asset.id} was not ready within {timeout} seconds"
                 )
 
-            sleep(polling_interval)
+            sleep(capped_delay(next(delays), t0, timeout))
+
+    def as_completed(
+        self,
+        data_assets: Iterable[DataAsset],
+        polling_interval: float = 5,
+        timeout: float | None = None,
+        max_requests_per_second: float = 2,
+        polling_strategy: PollingStrategy | None = None,
+    ) -> Iterator[DataAsset]:
+        """
+        Poll many data assets from a single loop and yield each one as soon as it
+        reaches 'Ready' or 'Failed' state.
+
+        Args:
+            data_assets: The data asset objects to monitor
+            polling_interval: Time between status checks of each data asset in seconds
+                (minimum 5 seconds)
+            timeout: Maximum time to wait for all data assets in seconds, or None for no timeout
+            max_requests_per_second: Request rate budget shared by all status checks
+            polling_strategy: Optional strategy deciding the delay between status checks of
+                each data asset. Overrides polling_interval when set
+
+        Returns:
+            Iterator of updated data asset objects in the order they become ready or failed
+
+        Raises:
+            ValueError: If polling_interval < 5 without a polling_strategy, timeout constraints are
+                violated or max_requests_per_second <= 0
+            TimeoutError: If some data assets don't become ready within the timeout period
+        """
+        validate_polling(polling_interval, timeout, polling_strategy)
+        validate_request_rate(max_requests_per_second)
+        data_assets = list({da.id: da for da in data_assets}.values())
+        return poll_many(
+            [da.id for da in data_assets],
+            self.get_data_asset,
+            lambda da: da.state in [DataAssetState.Ready, DataAssetState.Failed],
+            polling_strategy or FixedInterval(polling_interval),
+            max_requests_per_second=max_requests_per_second,
+            timeout=timeout,
+            label="Data assets",
+            started=[da.created for da in data_assets],
+        )
+
+    def wait_many(
+        self,
+        data_assets: Iterable[DataAsset],
+        polling_interval: float = 5,
+        timeout: float | None = None,
+        max_requests_per_second: float = 2,
+        polling_strategy: PollingStrategy | None = None,
+    ) -> list[DataAsset]:
+        """
+        Poll many data assets from a single loop until all reach 'Ready' or 'Failed'
+        state. See as_completed for the arguments.
+
+        Returns:
+            Updated data asset objects in the same order as the input
+        """
+        data_assets = list(data_assets)
+        ready = {
+            da.id: da
+            for da in self.as_completed(
+                data_assets, polling_interval, timeout, max_requests_per_second, polling_strategy,
+            )
+        }
+        return [ready[da.id] for da in data_assets]
 
     def delete_data_asset(self, data_asset_id: str):
         """Delete a data asset permanently."""
@@ -158,38 +233,46 @@ class DataAssets:
             params={"archive": archive},
         )
 
-    def search_data_assets(self, search_params: DataAssetSearchParams) -> DataAssetSearchResults:
+    def search_data_assets(
+        self,
+        search_params: DataAssetSearchParams,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> DataAssetSearchResults:
         """Search for data assets with filtering, sorting, and pagination options."""
         res = self.client.post("data_assets/search", json=search_params.to_dict())
 
-        return DataAssetSearchResults.from_dict(res.json())
+        return res.json() if raw else decode_response(DataAssetSearchResults, res, lazy)
 
-    def search_data_assets_iterator(self, search_params: DataAssetSearchParams) -> Iterator[DataAsset]:
+    def search_data_assets_iterator(
+        self,
+        search_params: DataAssetSearchParams,
+        prefetch: int = 0,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> Iterator[DataAsset]:
         """
         Iterate through all data assets matching search criteria with
         automatic pagination.
-        """
-        params = search_params.to_dict()
-        while True:
-            response = self.search_data_assets(
-                search_params=DataAssetSearchParams(**params),
-            )
 
-            for result in response.results:
-                yield result
-
-            if not response.has_more:
-                return
-
-            params["next_token"] = response.next_token
+        Set prefetch to request up to that many pages ahead on a background thread
+        while the current page is being consumed.
+        """
+        validate_prefetch(prefetch)
+        pages = iterate_pages(
+            lambda params: self.search_data_assets(search_params=DataAssetSearchParams(**params), raw=raw, lazy=lazy),
+            search_params.to_dict(),
+            prefetch,
+        )
+        return iterate_results(pages, raw)
 
-    def get_permissions(self, data_asset_id: str) -> Permissions:
+    def get_permissions(self, data_asset_id: str, raw: bool = False) -> Permissions:
         """Get permissions for a specific data asset."""
         res = self.client.get(f"data_assets/{data_asset_id}/permissions")
 
-        return Permissions.from_dict(res.json())
+        return res.json() if raw else decode_response(Permissions, res)
 
-    def list_data_asset_files(self, data_asset_id: str, path: str = "") -> Folder:
+    def list_data_asset_files(self, data_asset_id: str, path: str = "", raw: bool = False) -> Folder:
         """
         List files and folders within an internal data asset at the specified path.
         Empty path retrieves root level contents.
@@ -200,9 +283,57 @@ class DataAssets:
 
         res = self.client.post(f"data_assets/{data_asset_id}/files", json=data)
 
-        return Folder.from_dict(res.json())
+        return res.json() if raw else decode_response(Folder, res)
 
-    def get_data_asset_file_download_url(self, data_asset_id: str, path: str) -> DownloadFileURL:
+    def list_data_asset_files_iterator(
+        self,
+        data_asset_id: str,
+        path: str = "",
+        raw: bool = False,
+    ) -> Iterator[FolderItem]:
+        """
+        Iterate through the files and folders within an internal data asset at the
+        specified path. Empty path retrieves root level contents.
+
+        The response is streamed and parsed incrementally, so memory use stays bounded
+        however large the folder is.
+        """
+        data = {
+            "path": path,
+        }
+
+        with self.client.post(f"data_assets/{data_asset_id}/files", json=data, stream=True) as res:
+            for item in iter_json_array(res.iter_content(STREAM_CHUNK_SIZE), "items", self.client.json_backend):
+                yield item if raw else decode(FolderItem, item)
+
+    def walk_data_asset_files(
+        self,
+        data_asset_id: str,
+        path: str = "",
+        max_workers: int = 8,
+        max_depth: int | None = None,
+        pattern: str | None = None,
+    ) -> Iterator[FolderItem]:
+        """
+        Recursively list files and folders of an internal data asset, expanding
+        subfolders concurrently and yielding items as their folder listings arrive.
+
+        Args:
+            data_asset_id: ID of the data asset
+            path: Folder to start from; empty string for the root folder
+            max_workers: Maximum number of concurrent folder listings
+            max_depth: Number of subfolder levels below path to expand, or None for no limit
+            pattern: Optional glob pattern that yielded items' paths must match
+        """
+        return walk_folder(
+            lambda p: self.list_data_asset_files(data_asset_id, p),
+            path,
+            max_workers=max_workers,
+            max_depth=max_depth,
+            pattern=pattern,
+        )
+
+    def get_data_asset_file_download_url(self, data_asset_id: str, path: str, raw: bool = False) -> DownloadFileURL:
         """(Deprecated) Generate a download URL for a specific file from an internal data asset.
 
         Deprecated: Use get_data_asset_file_urls instead.
@@ -218,16 +349,83 @@ class DataAssets:
             params={"path": path},
         )
 
-        return DownloadFileURL.from_dict(res.json())
+        return res.json() if raw else decode_response(DownloadFileURL, res)
 
-    def get_data_asset_file_urls(self, data_asset_id: str, path: str) -> FileURLs:
+    def get_data_asset_file_urls(self, data_asset_id: str, path: str, raw: bool = False) -> FileURLs:
         """Generate view and download URLs for a specific file from an internal data asset."""
         res = self.client.get(
             f"data_assets/{data_asset_id}/files/urls",
             params={"path": path},
         )
 
-        return FileURLs.from_dict(res.json())
+        return res.json() if raw else decode_response(FileURLs, res)
+
+    def download_data_asset_file(
+        self,
+        data_asset_id: str,
+        path: str,
+        destination: str,
+        max_workers: int = 8,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> str:
+        """
+        Download a file from an internal data asset to a local file using concurrent
+        HTTP Range requests.
+
+        Interrupted downloads resume from the chunks already written when called again
+        with the same destination, and expired signed URLs are regenerated automatically.
+
+        Args:
+            data_asset_id: ID of the data asset
+            path: Path of the file within the data asset
+            destination: Local file path to write to
+            max_workers: Maximum number of concurrent Range requests
+            chunk_size: Size of each Range request in bytes
+
+        Returns:
+            The destination path
+        """
+        return download_file(
+            lambda: self.get_data_asset_file_urls(data_asset_id, path).download_url,
+            destination,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+        )
+
+    def sync_data_asset_files(
+        self,
+        data_asset_id: str,
+        local_dir: str,
+        path: str = "",
+        max_workers: int = 8,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> SyncReport:
+        """
+        Mirror the files of an internal data asset to a local directory.
+
+        Only files that are missing locally or whose local size differs from the
+        data asset file size are downloaded, so repeated syncs skip unchanged files.
+        Files are downloaded in parallel while the file tree is still being listed.
+
+        Args:
+            data_asset_id: ID of the data asset
+            local_dir: Local directory to mirror the files into
+            path: Folder to sync; empty string for the whole data asset
+            max_workers: Maximum number of concurrent folder listings and file downloads
+            chunk_size: Size of each Range request in bytes
+
+        Returns:
+            Counts of downloaded and skipped files, bytes downloaded, elapsed time
+            and throughput
+        """
+        return sync_folder(
+            self.walk_data_asset_files(data_asset_id, path, max_workers=max_workers),
+            lambda p: self.get_data_asset_file_urls(data_asset_id, p).download_url,
+            local_dir,
+            path,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+        )
 
     def transfer_data_asset(self, data_asset_id: str, transfer_params: TransferDataParams):
         """
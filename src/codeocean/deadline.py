@@ -0,0 +1,101 @@
+"""
+Deadlines bounding the total time of client calls.
+
+Client timeouts bound each wait on a connection. A deadline bounds the time of all the
+client calls made within a `with deadline(seconds):` block, including the calls sending
+many requests: search iterators, wait_until_* loops and folder walks. Each request's
+timeouts are capped at the time left, waits between requests (and for rate limit slots
+or identical requests in flight) end at the deadline, and requests that would start
+after it raise DeadlineExceeded, e.g.:
+
+    with deadline(30):
+        computation = client.computations.wait_until_completed(computation)
+
+Deadlines are tracked per thread and asyncio task (in a context variable): the
+background threads of search prefetching and folder walks inherit the deadline of the
+call that started them, as do asyncio tasks.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Iterator, Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar("codeocean_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request would start, or times out, after the deadline of the calls it belongs to."""
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound the time of the client calls made within the block to seconds. Nested
+    deadlines can only shorten the enclosing one.
+
+    Raises:
+        ValueError: If seconds < 0
+    """
+    if seconds < 0:
+        raise ValueError(f"Deadline {seconds} should be greater than or equal to 0 (seconds)")
+    at = monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(at if current is None else min(at, current))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None outside of a deadline block."""
+    at = _deadline.get()
+    return None if at is None else at - monotonic()
+
+
+def exceeded() -> bool:
+    """Whether the current deadline has passed."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def capped_timeout(timeout: Optional[float | tuple]) -> Optional[float | tuple]:
+    """
+    Cap a request timeout (seconds, a tuple of seconds such as (connect, read), or None
+    for no timeout) at the time left before the current deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Deadline exceeded before sending the request")
+    if isinstance(timeout, tuple):
+        return tuple(left if t is None else min(t, left) for t in timeout)
+    return left if timeout is None else min(timeout, left)
+
+
+def capped_wait(wait: Optional[float]) -> Optional[float]:
+    """
+    Cap a wait for a request to be sent or answered (seconds, or None to wait
+    indefinitely) at the time left before the current deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    left = remaining()
+    if left is None:
+        return wait
+    if left <= 0:
+        raise DeadlineExceeded("Deadline exceeded while waiting for the request")
+    return left if wait is None else min(wait, left)
+
+
+def capped_sleep(delay: float) -> float:
+    """Cap a delay between requests at the time left before the current deadline."""
+    left = remaining()
+    return delay if left is None else max(0.0, min(delay, left))
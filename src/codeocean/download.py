@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from requests.adapters import HTTPAdapter
+from threading import Lock
+from typing import Callable, Optional
+import json
+import os
+import re
+import requests
+
+from codeocean.deadline import capped_timeout
+from codeocean.error import Error
+
+# Size of each ranged request in bytes
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Seconds to wait for the object store to accept a connection and between bytes of its responses
+DEFAULT_TIMEOUT = (10, 60)
+
+# Size of the blocks written to disk while streaming a response in bytes
+_BLOCK_SIZE = 1024 * 1024
+
+# Status codes returned by object stores for expired or otherwise invalid signed URLs
+_EXPIRED_URL_STATUS_CODES = (400, 401, 403)
+
+_CONTENT_RANGE = re.compile(r"bytes \d+-\d+/(\d+)")
+
+
+@dataclass
+class _DownloadState:
+    """Progress of a partial download, persisted next to the partial file."""
+
+    size: int
+    chunk_size: int
+    completed: set[int] = field(default_factory=set)
+
+    @classmethod
+    def load(cls, path: str) -> Optional[_DownloadState]:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            return cls(size=data["size"], chunk_size=data["chunk_size"], completed=set(data["completed"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: str):
+        data = asdict(self)
+        data["completed"] = sorted(self.completed)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+class SignedURL:
+    """
+    A signed URL that is regenerated when it expires, shared by concurrent requests.
+
+    Args:
+        get_url: Function generating a new signed URL, e.g. calling the API's download URL endpoint
+    """
+
+    def __init__(self, get_url: Callable[[], str]):
+        self._get_url = get_url
+        self._lock = Lock()
+        self.url = get_url()
+        self.version = 0
+
+    def current(self) -> tuple[str, int]:
+        with self._lock:
+            return self.url, self.version
+
+    def refresh(self, version: int):
+        """Regenerate the URL unless another request already did since `version`."""
+        with self._lock:
+            if self.version == version:
+                self.url = self._get_url()
+                self.version += 1
+
+
+def download_file(
+    get_url: Callable[[], str],
+    destination: str,
+    max_workers: int = 8,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    retries: int = 3,
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float | tuple[float, float]] = DEFAULT_TIMEOUT,
+) -> str:
+    """
+    Download a file from a signed URL using concurrent HTTP Range requests.
+
+    The file is written into a preallocated '<destination>.part' file and renamed
+    to destination once complete. Progress is recorded in '<destination>.part.state',
+    so calling download_file again after a failure only fetches the missing chunks.
+    Expired signed URLs are regenerated by calling get_url again. Servers that don't
+    support Range requests are downloaded in a single stream.
+
+    Args:
+        get_url: Function generating a fresh signed download URL
+        destination: Local file path to write to
+        max_workers: Maximum number of concurrent Range requests
+        chunk_size: Size of each Range request in bytes
+        retries: Number of retries of each chunk after connection errors or expired URLs
+        session: Optional requests session to download with (without Code Ocean credentials)
+        timeout: Seconds to wait for the object store to accept a connection and
+            between bytes of its responses, or a (connect, read) tuple
+
+    Returns:
+        The destination path
+
+    Raises:
+        Error: If the signed URL returns an HTTP error
+        ValueError: If a partial response doesn't have the requested size, or its total
+            size can't be read
+    """
+    if max_workers < 1:
+        raise ValueError(f"Max workers {max_workers} should be greater than or equal to 1")
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size {chunk_size} should be greater than or equal to 1")
+
+    if session is not None:
+        return _download(get_url, destination, max_workers, chunk_size, retries, session, timeout)
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return _download(get_url, destination, max_workers, chunk_size, retries, session, timeout)
+
+
+def _download(
+    get_url: Callable[[], str],
+    destination: str,
+    max_workers: int,
+    chunk_size: int,
+    retries: int,
+    session: requests.Session,
+    timeout: Optional[float | tuple[float, float]],
+) -> str:
+    part_path = f"{destination}.part"
+    state_path = f"{part_path}.state"
+    signed_url = SignedURL(get_url)
+
+    res = signed_get(session, signed_url, retries, timeout, headers={"Range": "bytes=0-0"}, stream=True)
+    if res.status_code == 416:
+        # Range requests of empty files aren't satisfiable
+        res.close()
+        size = 0
+    elif res.status_code == 206:
+        res.close()
+        content_range = _CONTENT_RANGE.match(res.headers.get("Content-Range", ""))
+        if content_range is None:
+            raise ValueError(f"Can't read the file size from Content-Range {res.headers.get('Content-Range')!r}")
+        size = int(content_range.group(1))
+    else:
+        # No Range support, stream the whole response
+        with res, open(part_path, "wb") as f:
+            for block in res.iter_content(_BLOCK_SIZE):
+                f.write(block)
+        os.replace(part_path, destination)
+        return destination
+
+    state = _DownloadState.load(state_path)
+    if (
+        state is None
+        or state.size != size
+        or state.chunk_size != chunk_size
+        or not os.path.exists(part_path)
+        or os.path.getsize(part_path) != size
+    ):
+        state = _DownloadState(size=size, chunk_size=chunk_size)
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+        state.save(state_path)
+
+    chunks = [i for i in range((size + chunk_size - 1) // chunk_size) if i not in state.completed]
+    state_lock = Lock()
+
+    def fetch(index: int):
+        start = index * chunk_size
+        end = min(start + chunk_size, size) - 1
+        headers = {"Range": f"bytes={start}-{end}"}
+        with signed_get(session, signed_url, retries, timeout, headers=headers, stream=True) as res:
+            if res.status_code != 206:
+                raise ValueError(f"Expected a partial response for bytes {start}-{end}, got {res.status_code}")
+            written = 0
+            with open(part_path, "r+b") as f:
+                f.seek(start)
+                for block in res.iter_content(_BLOCK_SIZE):
+                    written += f.write(block)
+        # A short body leaves the chunk missing for the next attempt
+        if written != end - start + 1:
+            raise ValueError(f"Expected {end - start + 1} bytes for bytes {start}-{end}, got {written}")
+        with state_lock:
+            state.completed.add(index)
+            state.save(state_path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fetch, i) for i in chunks]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    os.replace(part_path, destination)
+    os.remove(state_path)
+    return destination
+
+
+def signed_get(
+    session: requests.Session,
+    signed_url: SignedURL,
+    retries: int,
+    timeout: Optional[float | tuple[float, float]] = DEFAULT_TIMEOUT,
+    **kwargs,
+) -> requests.Response:
+    """
+    GET a signed URL, regenerating it when expired and retrying connection errors.
+
+    Args:
+        session: HTTP session to send the requests with
+        signed_url: Signed URL to get
+        retries: Number of retries of failed requests
+        timeout: Seconds to wait for a connection and between bytes of the response,
+            or a (connect, read) tuple; capped at the time left before the current deadline
+        **kwargs: Arguments passed to session.get, e.g. headers or stream
+
+    Returns:
+        The response, which may be 416 (Range Not Satisfiable)
+
+    Raises:
+        Error: If the signed URL returns another HTTP error
+        DeadlineExceeded: If the current deadline has passed
+    """
+    for attempt in range(retries + 1):
+        url, version = signed_url.current()
+        try:
+            res = session.get(url, timeout=capped_timeout(timeout), **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+            continue
+        if res.status_code in _EXPIRED_URL_STATUS_CODES and attempt < retries:
+            res.close()
+            signed_url.refresh(version)
+            continue
+        if res.status_code != 416:
+            try:
+                res.raise_for_status()
+            except requests.HTTPError as err:
+                raise Error(err) from err
+        return res
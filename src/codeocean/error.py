@@ -9,7 +9,7 @@ class Error(Exception):
     Represents an HTTP error with additional context extracted from the response.
 
     Attributes:
-        http_err (requests.HTTPError): The HTTP error object.
+        http_err (requests.HTTPError): The HTTP error object (httpx.HTTPStatusError for the async client).
         status_code (int): The HTTP status code of the error response.
         message (str): A message describing the error, extracted from the response body.
         data (Any): If the response body is json, this attribute contains the json object; otherwise, it is None.
@@ -0,0 +1,194 @@
+"""
+Columnar export of API objects to Arrow tables and pandas DataFrames.
+
+Requires pyarrow, and pandas for to_pandas (pip install codeocean[arrow]).
+"""
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from itertools import islice
+from threading import RLock
+from typing import Any, Callable, Iterable, Iterator, Optional, Union, get_args, get_origin
+import json
+
+import pyarrow as pa
+
+from codeocean.models.decoder import UnionType, type_hints
+
+DEFAULT_BATCH_SIZE = 10_000
+
+# Enum values are stored once per batch and referenced by index
+DICTIONARY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+Converter = Optional[Callable[[Any], Any]]
+
+_columns: dict[type, list[tuple[str, pa.DataType, Converter]]] = {}
+_lock = RLock()
+
+
+def arrow_schema(model: type, dictionary_fields: Iterable[str] = ()) -> pa.Schema:
+    """
+    Get the Arrow schema of a model (e.g. DataAsset, Capsule, Computation or FolderItem).
+
+    StrEnum fields are dictionary-encoded, as are string fields named in
+    dictionary_fields. Nested models become struct columns, dict fields JSON strings.
+    """
+    dictionary_fields = set(dictionary_fields)
+    return pa.schema([
+        (name, DICTIONARY_TYPE if name in dictionary_fields and arrow_type == pa.string() else arrow_type)
+        for name, arrow_type, _ in _model_columns(model)
+    ])
+
+
+def iter_record_batches(
+    items: Iterable[Any],
+    model: Optional[type] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dictionary_fields: Iterable[str] = (),
+) -> Iterator[pa.RecordBatch]:
+    """
+    Convert model objects, or their raw JSON dicts, to Arrow record batches of up to
+    batch_size rows, consuming the items lazily (e.g. from search_data_assets_iterator).
+
+    Args:
+        items: Objects of a single model, or raw JSON dicts of that model
+        model: The model class. Inferred from the first item when not set; required
+            for raw dicts
+        batch_size: Maximum number of rows per record batch
+        dictionary_fields: Names of string fields to dictionary-encode in addition to
+            the StrEnum fields, e.g. ["owner"] for grouping by owner
+
+    Raises:
+        ValueError: If the model can't be inferred or batch_size < 1
+    """
+    if batch_size < 1:
+        raise ValueError(f"Batch size {batch_size} should be greater than or equal to 1")
+
+    items = iter(items)
+    batch = list(islice(items, batch_size))
+    if model is None:
+        if not batch or isinstance(batch[0], dict):
+            raise ValueError("The model can't be inferred from raw dicts or empty items, set model")
+        model = _model_of(batch[0])
+    schema = arrow_schema(model, dictionary_fields)
+    columns = _model_columns(model)
+
+    while batch:
+        arrays = []
+        for (name, _, convert), arrow_field in zip(columns, schema):
+            values = _field_values(batch, name)
+            if convert is not None:
+                values = [None if v is None else convert(v) for v in values]
+            arrays.append(pa.array(values, type=arrow_field.type))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+        batch = list(islice(items, batch_size))
+
+
+def to_arrow(
+    items: Iterable[Any],
+    model: Optional[type] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dictionary_fields: Iterable[str] = (),
+) -> pa.Table:
+    """
+    Convert model objects, or their raw JSON dicts, to an Arrow table.
+    See iter_record_batches for the arguments.
+    """
+    batches = list(iter_record_batches(items, model, batch_size, dictionary_fields))
+    if batches:
+        return pa.Table.from_batches(batches).unify_dictionaries()
+    return arrow_schema(model, dictionary_fields).empty_table()
+
+
+def to_pandas(
+    items: Iterable[Any],
+    model: Optional[type] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dictionary_fields: Iterable[str] = (),
+):
+    """
+    Convert model objects, or their raw JSON dicts, to a pandas DataFrame. Dictionary
+    encoded fields (StrEnum fields and dictionary_fields) become categorical columns.
+    See iter_record_batches for the arguments.
+    """
+    return to_arrow(items, model, batch_size, dictionary_fields).to_pandas()
+
+
+def _model_of(item: Any) -> type:
+    # Lazily decoded models are subclasses of the model they were decoded as
+    return next(cls for cls in type(item).__mro__ if "__dataclass_fields__" in cls.__dict__)
+
+
+def _field_values(batch: list, name: str) -> list:
+    if isinstance(batch[0], dict):
+        return [item.get(name) for item in batch]
+    return [getattr(item, name) for item in batch]
+
+
+def _model_columns(model: type) -> list[tuple[str, pa.DataType, Converter]]:
+    try:
+        return _columns[model]
+    except KeyError:
+        pass
+    if not is_dataclass(model):
+        raise TypeError(f"{model!r} isn't a model class")
+    with _lock:
+        if model not in _columns:
+            hints = type_hints(model)
+            _columns[model] = [(f.name, *_arrow_type(hints.get(f.name, Any))) for f in fields(model)]
+        return _columns[model]
+
+
+def _arrow_type(tp: Any) -> tuple[pa.DataType, Converter]:
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is Union or origin is UnionType:
+        options = [a for a in args if a is not type(None)]
+        if len(options) == 1:
+            return _arrow_type(options[0])
+    elif tp is bool:
+        return pa.bool_(), None
+    elif tp is int:
+        return pa.int64(), None
+    elif tp is float:
+        return pa.float64(), None
+    elif tp is str:
+        return pa.string(), None
+    elif isinstance(tp, type) and issubclass(tp, Enum):
+        return DICTIONARY_TYPE, None
+    elif origin is list and args and args[0] is not dict:
+        item_type, convert_item = _arrow_type(args[0])
+        item_type = _undictionary(item_type)
+        if convert_item is None:
+            return pa.list_(item_type), None
+        return pa.list_(item_type), lambda values: [None if v is None else convert_item(v) for v in values]
+    elif is_dataclass(tp):
+        columns = _model_columns(tp)
+        struct_type = pa.struct([(name, _undictionary(arrow_type)) for name, arrow_type, _ in columns])
+
+        def convert(value):
+            get = value.get if isinstance(value, dict) else lambda name: getattr(value, name)
+            row = {}
+            for name, _, convert_field in columns:
+                field_value = get(name)
+                if convert_field is not None and field_value is not None:
+                    field_value = convert_field(field_value)
+                row[name] = field_value
+            return row
+
+        return struct_type, convert
+    # Free-form values (dicts, lists of dicts, unions) are stored as JSON
+    return pa.string(), _to_json
+
+
+def _undictionary(arrow_type: pa.DataType) -> pa.DataType:
+    # Only top-level columns are dictionary-encoded: pyarrow can't convert nested
+    # dictionaries of all-null structs to pandas
+    return pa.string() if arrow_type == DICTIONARY_TYPE else arrow_type
+
+
+def _to_json(value: Any) -> str:
+    if is_dataclass(value):
+        value = value.to_dict()
+    return json.dumps(value)
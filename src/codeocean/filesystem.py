@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from fsspec.spec import AbstractBufferedFile, AbstractFileSystem
+from requests.adapters import HTTPAdapter
+from typing import Optional
+import requests
+
+from codeocean.client import CodeOcean
+from codeocean.download import DEFAULT_TIMEOUT, SignedURL, signed_get
+from codeocean.models.folder import Folder, FileURLs
+
+# Top level folders of the file system and the resources they contain
+COMPUTATIONS = "computations"
+DATA_ASSETS = "data_assets"
+
+
+class CodeOceanFileSystem(AbstractFileSystem):
+    """
+    Read-only fsspec file system over computation results and internal data asset files.
+
+    Paths have the form 'computations/<computation_id>/<path>' or
+    'data_assets/<data_asset_id>/<path>', optionally prefixed with 'codeocean://'.
+    Listings come from list_computation_results / list_data_asset_files, and files are
+    streamed from their signed URLs with HTTP Range requests, so readers such as pandas,
+    xarray or zarr only fetch the byte ranges they need. Opened files use fsspec's
+    read-ahead cache by default; pass cache_type="blockcache" to open() for random access.
+
+    Signed URLs point to the object store rather than to the Code Ocean server, so files
+    are read with a session of their own, without the client's credentials, sized like
+    the client's connection pool. Call close() to release its connections.
+
+    Args:
+        client: Code Ocean API client to use; alternatively pass domain and token
+        domain: The Code Ocean domain URL, used when client is not given
+        token: Code Ocean API access token, used when client is not given
+        retries: Number of retries of each Range request after connection errors
+            or expired signed URLs
+        timeout: Seconds to wait for the object store to accept a connection and
+            between bytes of its responses, or a (connect, read) tuple
+    """
+
+    protocol = "codeocean"
+
+    def __init__(
+        self,
+        client: Optional[CodeOcean] = None,
+        domain: Optional[str] = None,
+        token: Optional[str] = None,
+        retries: int = 3,
+        timeout: Optional[float | tuple[float, float]] = DEFAULT_TIMEOUT,
+        **storage_options,
+    ):
+        super().__init__(**storage_options)
+        if client is None:
+            if domain is None or token is None:
+                raise ValueError("Either client or both domain and token should be provided")
+            client = CodeOcean(domain=domain, token=token)
+        self.client = client
+        self.retries = retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=client.pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Close the connections used to read files."""
+        self.session.close()
+
+    def _split(self, path: str) -> tuple[str, str, str]:
+        parts = self._strip_protocol(path).split("/", 2)
+        if len(parts) < 2 or parts[0] not in (COMPUTATIONS, DATA_ASSETS) or not parts[1]:
+            raise FileNotFoundError(
+                f"Path {path} should start with {COMPUTATIONS}/<computation_id> or {DATA_ASSETS}/<data_asset_id>"
+            )
+        return parts[0], parts[1], parts[2] if len(parts) == 3 else ""
+
+    def _list_folder(self, kind: str, id: str, path: str) -> Folder:
+        if kind == COMPUTATIONS:
+            return self.client.computations.list_computation_results(id, path)
+        return self.client.data_assets.list_data_asset_files(id, path)
+
+    def _file_urls(self, path: str) -> FileURLs:
+        kind, id, file_path = self._split(path)
+        if kind == COMPUTATIONS:
+            return self.client.computations.get_result_file_urls(id, file_path)
+        return self.client.data_assets.get_data_asset_file_urls(id, file_path)
+
+    def ls(self, path, detail=True, refresh=False, **kwargs):
+        path = self._strip_protocol(path)
+        kind, id, folder_path = self._split(path)
+        entries = None if refresh else self.dircache.get(path)
+        if entries is None:
+            entries = [
+                {
+                    "name": f"{kind}/{id}/{item.path}",
+                    "size": item.size or 0,
+                    "type": "directory" if item.type == "folder" else "file",
+                }
+                for item in self._list_folder(kind, id, folder_path).items
+            ]
+            self.dircache[path] = entries
+        return entries if detail else [e["name"] for e in entries]
+
+    def info(self, path, **kwargs):
+        path = self._strip_protocol(path)
+        _, _, item_path = self._split(path)
+        if not item_path:
+            return {"name": path, "size": 0, "type": "directory"}
+        return super().info(path, **kwargs)
+
+    def _open(
+        self,
+        path,
+        mode="rb",
+        block_size=None,
+        autocommit=True,
+        cache_options=None,
+        cache_type="readahead",
+        **kwargs,
+    ):
+        if mode != "rb":
+            raise NotImplementedError("CodeOceanFileSystem is read-only")
+        return CodeOceanFile(
+            self,
+            path,
+            mode=mode,
+            block_size=block_size or "default",
+            cache_type=cache_type,
+            cache_options=cache_options,
+            **kwargs,
+        )
+
+
+class CodeOceanFile(AbstractBufferedFile):
+    """A read-only file streamed from its signed URL with HTTP Range requests."""
+
+    def __init__(self, fs: CodeOceanFileSystem, path: str, **kwargs):
+        super().__init__(fs, path, **kwargs)
+        self._signed_url: Optional[SignedURL] = None
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        if start >= end:
+            return b""
+        if self._signed_url is None:
+            self._signed_url = SignedURL(lambda: self.fs._file_urls(self.path).download_url)
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+        res = signed_get(self.fs.session, self._signed_url, self.fs.retries, self.fs.timeout, headers=headers)
+        if res.status_code == 416:
+            return b""
+        if res.status_code != 206:
+            # The server ignored the Range header and sent the whole file
+            return res.content[start:end]
+        return res.content
@@ -0,0 +1,260 @@
+"""
+Hedged requests cutting the tail latency of reads.
+
+Occasional slow responses, e.g. from a busy server instance or a lost packet, dominate
+the tail latency of interactive reads such as get_computation or get_data_asset. A
+Hedger sends a second, identical request when the first one hasn't been answered
+within a delay derived from the recent latencies (by default their 95th percentile),
+uses whichever response arrives first and cancels the other. Only GET requests of
+interactive reads are hedged by default, as they are safe to send twice and bounded
+in size, and a budget bounds the extra load hedges put on the server.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from queue import Empty, Queue
+from threading import Lock
+from time import monotonic
+from typing import Any, Awaitable, Callable, Iterable, Optional
+import asyncio
+
+from codeocean.cache import path_matches
+
+# GET endpoints of interactive reads hedged by default; '*' matches a single path segment
+DEFAULT_HEDGED_PATHS = (
+    "capsules/*",
+    "capsules/*/app_panel",
+    "computations/*",
+    "data_assets/*",
+    "pipelines/*",
+    "pipelines/*/app_panel",
+)
+
+
+@dataclass(frozen=True)
+class HedgerStats:
+    """Counters of a hedger."""
+
+    requests: int
+    hedged: int
+    hedge_wins: int
+    delay: float
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests for which a hedge was sent."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges that answered before the request they hedged."""
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class Hedger:
+    """
+    Sends a hedge for GET requests that take longer than a percentile of the recent
+    latencies, and uses the first response.
+
+    The delay is derived from the latencies of the responses used (the winners).
+    Requests of the synchronous client are sent on the calling thread while the budget
+    doesn't allow a hedge. Otherwise, as a blocking request can't be interrupted, they
+    run on a pool of reused threads, the hedge being submitted only once the delay has
+    passed: the losing request is abandoned and its response closed when it arrives.
+    Requests of the asynchronous client run in tasks, and the losing one is cancelled.
+
+    Args:
+        percentile: Percentile of the recent latencies after which a hedge is sent,
+            between 0 and 1
+        window: Number of recent latencies the percentile is computed over
+        min_samples: Number of latencies needed before using the percentile
+        initial_delay: Seconds after which a hedge is sent until there are min_samples
+            latencies
+        min_delay: Minimum seconds before sending a hedge
+        budget: Maximum fraction of requests for which a hedge is sent
+        paths: Path patterns of the GET requests to hedge; '*' matches a single path
+            segment (e.g. 'computations/*'), or None for all GET requests. Defaults to
+            DEFAULT_HEDGED_PATHS
+        max_workers: Maximum number of threads sending the synchronous client's
+            requests that may be hedged
+        clock: Time source, in seconds
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        window: int = 100,
+        min_samples: int = 20,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        budget: float = 0.1,
+        paths: Optional[Iterable[str]] = DEFAULT_HEDGED_PATHS,
+        max_workers: int = 32,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if not 0 < percentile <= 1:
+            raise ValueError(f"Percentile {percentile} should be between 0 and 1")
+        if not 1 <= min_samples <= window:
+            raise ValueError(f"Min samples {min_samples} should be between 1 and window {window}")
+        if not 0 <= budget <= 1:
+            raise ValueError(f"Budget {budget} should be between 0 and 1")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.budget = budget
+        self.paths = tuple(paths) if paths is not None else None
+        self.clock = clock
+        self._lock = Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._requests = self._hedged = self._hedge_wins = 0
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="codeocean-hedge")
+
+    def hedged(self, method: str, url: str) -> bool:
+        """Whether a request is hedged."""
+        if method.upper() != "GET" or "://" in url:
+            return False
+        return self.paths is None or any(path_matches(url, pattern) for pattern in self.paths)
+
+    @property
+    def delay(self) -> float:
+        """Seconds after which a hedge is sent."""
+        with self._lock:
+            return self._delay()
+
+    def call(self, send: Callable[[], Any]) -> Any:
+        """Send a request, hedging it if it isn't answered within the delay, and return the first response."""
+        with self._lock:
+            self._requests += 1
+            delay = self._delay()
+            # A hedge can't be sent within the budget, so there's nothing to race
+            may_hedge = self._hedged < self.budget * self._requests
+        if not may_hedge:
+            start = self.clock()
+            response = send()
+            self._record(self.clock() - start)
+            return response
+
+        results: Queue = Queue()
+        abandoned = False
+
+        def run(hedge: bool):
+            start = self.clock()
+            try:
+                result = (hedge, send(), None, self.clock() - start)
+            except BaseException as err:
+                result = (hedge, None, err, None)
+            with self._lock:
+                if not abandoned:
+                    results.put(result)
+                    return
+            _close(result[1])
+
+        # Each request runs in a copy of the caller's context, to keep its deadline
+        self._executor.submit(copy_context().run, run, False)
+        pending = 1
+        try:
+            hedge, response, error, latency = results.get(timeout=delay)
+            pending -= 1
+        except Empty:
+            if self._take_hedge():
+                self._executor.submit(copy_context().run, run, True)
+                pending += 1
+            hedge, response, error, latency = results.get()
+            pending -= 1
+        # An attempt that failed is superseded by the other one, if it is still in flight
+        while error is not None and pending:
+            hedge, response, error, latency = results.get()
+            pending -= 1
+        with self._lock:
+            abandoned = True
+            if error is None and hedge:
+                self._hedge_wins += 1
+        # The loser's result, if it was queued before it was abandoned
+        while not results.empty():
+            _close(results.get()[1])
+        if error is not None:
+            raise error
+        self._record(latency)
+        return response
+
+    async def acall(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Asynchronous version of call(), cancelling the losing request."""
+        with self._lock:
+            self._requests += 1
+            delay = self._delay()
+
+        async def run():
+            start = self.clock()
+            response = await send()
+            return response, self.clock() - start
+
+        first = asyncio.ensure_future(run())
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            hedge = None
+            if not done and self._take_hedge():
+                hedge = asyncio.ensure_future(run())
+                pending.add(hedge)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # An attempt that failed is superseded by the other one, if it is still in flight
+                task = next((task for task in done if task.exception() is None), None)
+                if task is None and pending:
+                    continue
+                task = task or done.pop()
+                response, latency = task.result()
+                if task is hedge:
+                    with self._lock:
+                        self._hedge_wins += 1
+                self._record(latency)
+                return response
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @property
+    def stats(self) -> HedgerStats:
+        """Snapshot of the hedger counters."""
+        with self._lock:
+            return HedgerStats(
+                requests=self._requests,
+                hedged=self._hedged,
+                hedge_wins=self._hedge_wins,
+                delay=self._delay(),
+            )
+
+    def _delay(self) -> float:
+        if len(self._latencies) < self.min_samples:
+            return max(self.min_delay, self.initial_delay)
+        latencies = sorted(self._latencies)
+        return max(self.min_delay, latencies[round(self.percentile * (len(latencies) - 1))])
+
+    def _record(self, latency: float):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self._hedged >= self.budget * self._requests:
+                return False
+            self._hedged += 1
+            return True
+
+
+def _close(response: Any):
+    """Release the connection of a losing request's response."""
+    close = getattr(response, "close", None)
+    if close is not None:
+        close()
+
+
+def get_hedger(hedge: bool | Hedger) -> Optional[Hedger]:
+    """Get the hedger for a client's hedge setting: True, False or a Hedger."""
+    if isinstance(hedge, Hedger):
+        return hedge
+    return Hedger() if hedge else None
@@ -0,0 +1,111 @@
+"""
+JSON encoding and decoding of request and response bodies.
+
+The stdlib json module is used unless a faster library is installed: with the
+default "auto" backend orjson is preferred, then msgspec. Both parse response
+bytes directly, without decoding them to a str first.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONBackend(ABC):
+    """Encodes request bodies to and decodes response bodies from JSON bytes."""
+
+    name: str
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode a JSON document."""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as a UTF-8 JSON document."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJSON(JSONBackend):
+    """JSON backend using the json module of the standard library."""
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+class OrjsonJSON(JSONBackend):
+    """JSON backend using orjson (pip install codeocean[orjson])."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson JSON backend requires orjson: pip install codeocean[orjson]")
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+class MsgspecJSON(JSONBackend):
+    """JSON backend using msgspec (pip install codeocean[msgspec])."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("The msgspec JSON backend requires msgspec: pip install codeocean[msgspec]")
+
+    def loads(self, data: bytes) -> Any:
+        return msgspec.json.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgspec.json.encode(obj)
+
+
+JSON_BACKENDS: dict[str, type[JSONBackend]] = {
+    OrjsonJSON.name: OrjsonJSON,
+    MsgspecJSON.name: MsgspecJSON,
+    StdlibJSON.name: StdlibJSON,
+}
+
+
+def get_json_backend(backend: str | JSONBackend = "auto") -> JSONBackend:
+    """
+    Get a JSON backend by name.
+
+    "auto" selects the fastest installed library, falling back to the stdlib json
+    module. Naming a library that isn't installed raises ImportError. A JSONBackend
+    instance is returned as is.
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend == "auto":
+        for cls in JSON_BACKENDS.values():
+            try:
+                return cls()
+            except ImportError:
+                continue
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend {backend!r}, expected 'auto' or one of {list(JSON_BACKENDS)}")
+    return JSON_BACKENDS[backend]()
@@ -6,6 +6,7 @@ from typing import Optional
 
 from codeocean.enum import StrEnum
 from codeocean.models.components import Ownership, SortOrder, SearchFilter
+from codeocean.slots import add_slots
 
 
 class CapsuleStatus(StrEnum):
@@ -47,6 +48,7 @@ class AppPanelParameterType(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class OriginalCapsuleInfo:
     """Information about the original capsule when this capsule is duplicated from
@@ -79,6 +81,7 @@ class OriginalCapsuleInfo:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class Capsule:
     """Represents a Code Ocean capsule with its metadata and properties."""
@@ -160,6 +163,7 @@ class Capsule:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class GitSyncResults:
     """Results of syncing a capsule or pipeline with its external Git remote."""
@@ -179,6 +183,7 @@ class GitSyncResults:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class CapsuleSearchParams:
     """Parameters for searching capsules with various filters and pagination
@@ -276,6 +281,7 @@ class CapsuleSearchParams:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class CapsuleSearchResults:
     """Results from a capsule search operation with pagination support."""
@@ -293,6 +299,7 @@ class CapsuleSearchResults:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AppPanelCategories:
     """Categories for a capsule's App Panel parameters."""
@@ -314,6 +321,7 @@ class AppPanelCategories:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AppPanelParameters:
     """Parameters for a capsule's App Panel."""
@@ -375,6 +383,7 @@ class AppPanelParameters:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AppPanelGeneral:
     """General information about a capsule's App Panel."""
@@ -394,6 +403,7 @@ class AppPanelGeneral:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AppPanelDataAsset:
     """Data asset parameter for the App Panel."""
@@ -425,6 +435,7 @@ class AppPanelDataAsset:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AppPanelResult:
     """Selected result files to display once the computation is complete."""
@@ -435,6 +446,7 @@ class AppPanelResult:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AppPanelProcess:
     """Pipeline process name and its corresponding app panel (for pipelines of capsules only)"""
@@ -453,6 +465,7 @@ class AppPanelProcess:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AppPanel:
     """App Panel configuration for a capsule or pipeline, including general info, data assets,
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from codeocean.enum import StrEnum
+from codeocean.slots import add_slots
 
 
 class UserRole(StrEnum):
@@ -16,6 +17,7 @@ class UserRole(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class UserPermissions:
     """User permission configuration with email and role assignment."""
@@ -40,6 +42,7 @@ class GroupRole(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class GroupPermissions:
     """Group permission configuration with group identifier and role assignment."""
@@ -63,6 +66,7 @@ class EveryoneRole(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class Permissions:
     """Complete permission configuration for Code Ocean resources including users, groups, and public access."""
@@ -96,6 +100,7 @@ class SortOrder(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class SearchFilterRange:
     """Numeric range filter for search operations with minimum and maximum values."""
@@ -109,6 +114,7 @@ class SearchFilterRange:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class SearchFilter:
     """Search filter configuration for field-level filtering with various value types and range support."""
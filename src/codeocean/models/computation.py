@@ -5,6 +5,7 @@ from dataclasses_json import dataclass_json
 from typing import Optional
 
 from codeocean.enum import StrEnum
+from codeocean.slots import add_slots
 
 
 class ComputationState(StrEnum):
@@ -26,6 +27,7 @@ class ComputationEndStatus(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class Param:
     """Parameter information for computations with name and value."""
@@ -45,6 +47,7 @@ class Param:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class PipelineProcess:
     """Information about a process within a pipeline execution."""
@@ -70,6 +73,7 @@ class PipelineProcess:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class InputDataAsset:
     """Data asset attached to a computation with mount information."""
@@ -84,6 +88,7 @@ class InputDataAsset:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class Computation:
     """Represents a Code Ocean computation run with its metadata and execution details."""
@@ -157,6 +162,7 @@ class Computation:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DataAssetsRunParam:
     """Data asset parameter for running computations with mount specification."""
@@ -171,6 +177,7 @@ class DataAssetsRunParam:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class NamedRunParam:
     """Named parameter for running computations with explicit parameter name."""
@@ -184,6 +191,7 @@ class NamedRunParam:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class PipelineProcessParams:
     """Parameters for configuring a specific process within a pipeline execution."""
@@ -202,6 +210,7 @@ class PipelineProcessParams:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class RunParams:
     """Complete parameter set for running capsules or pipelines with data assets and configuration."""
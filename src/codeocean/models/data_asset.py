@@ -7,6 +7,7 @@ from typing import Optional
 from codeocean.enum import StrEnum
 from codeocean.models.components import Ownership, SortOrder, SearchFilter
 from codeocean.models.computation import PipelineProcess, Param
+from codeocean.slots import add_slots
 
 
 class DataAssetType(StrEnum):
@@ -27,6 +28,7 @@ class DataAssetState(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class Provenance:
     """Shows the data asset provenance information when type is result."""
@@ -68,6 +70,7 @@ class DataAssetOrigin(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class SourceBucket:
     """Information about the bucket from which the data asset was created."""
@@ -92,6 +95,7 @@ class SourceBucket:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AppParameter:
     """Name and value of app panel parameters used to generate result data assets."""
@@ -107,6 +111,7 @@ class AppParameter:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class ResultsInfo:
     """
@@ -157,6 +162,7 @@ class ResultsInfo:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DataAsset:
     """Represents a Code Ocean data asset with its metadata and properties."""
@@ -267,6 +273,7 @@ class DataAsset:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DataAssetUpdateParams:
     """Parameters for updating data asset metadata."""
@@ -294,6 +301,7 @@ class DataAssetUpdateParams:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AWSS3Source:
     """AWS S3 source configuration for creating data assets."""
@@ -337,6 +345,7 @@ class AWSS3Source:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class GCPCloudStorageSource:
     """
@@ -368,6 +377,7 @@ class GCPCloudStorageSource:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class ComputationSource:
     """Computation source configuration for creating result data assets."""
@@ -386,6 +396,7 @@ class ComputationSource:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class CloudWorkstationSource:
     """Cloud Workstation session source configuration for creating data assets."""
@@ -412,6 +423,7 @@ class CloudWorkstationSource:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class Source:
     """Source configuration for data asset creation from various origins."""
@@ -435,6 +447,7 @@ class Source:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class AWSS3Target:
     """AWS S3 target configuration for external data asset storage."""
@@ -457,6 +470,7 @@ class AWSS3Target:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class Target:
     """Target configuration for external data asset storage."""
@@ -468,6 +482,7 @@ class Target:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DataAssetParams:
     """
@@ -521,6 +536,7 @@ class DataAssetParams:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DataAssetAttachParams:
     """Parameters for attaching data assets to capsules."""
@@ -535,6 +551,7 @@ class DataAssetAttachParams:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DataAssetAttachResults:
     """Results from attaching data assets to capsules."""
@@ -581,6 +598,7 @@ class DataAssetSearchOrigin(StrEnum):
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DataAssetSearchParams:
     """
@@ -683,6 +701,7 @@ class DataAssetSearchParams:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DataAssetSearchResults:
     """Results from a data asset search operation with pagination support."""
@@ -706,6 +725,7 @@ class DataAssetSearchResults:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class ContainedDataAsset:
     """Information about data assets contained within a combined data asset."""
@@ -725,6 +745,7 @@ class ContainedDataAsset:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class TransferDataParams:
     """Parameters for transferring data asset files
@@ -0,0 +1,322 @@
+"""
+Fast decoding of API responses into model objects.
+
+dataclasses_json's from_dict resolves type hints and inspects every field's type on
+each call. The decoders here do that work once per type: for each model class a
+specialized decode function is generated that reads the known keys and only calls
+nested decoders for fields that need conversion (nested models, enums, and lists
+of them). The decoded objects are equal to the ones built by from_dict.
+
+Lazy decoding goes further for callers that only read a few fields: models are
+built as instances of a generated subclass that keeps the parsed JSON and converts
+each nested field on first access, caching the result.
+"""
+from __future__ import annotations
+
+from dataclasses import MISSING, Field, fields, is_dataclass
+from enum import Enum
+from threading import RLock
+from types import MemberDescriptorType
+from typing import Any, Callable, Optional, TypeVar, Union, get_args, get_origin, get_type_hints
+import sys
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+else:
+    UnionType = Union
+
+T = TypeVar("T")
+
+Decoder = Callable[[Any], Any]
+
+# Types whose JSON values are used as is
+_PLAIN_TYPES = (Any, str, int, float, bool, dict, list, object)
+
+_decoders: dict[Any, Optional[Decoder]] = {}
+_lazy_decoders: dict[Any, Optional[Decoder]] = {}
+_lock = RLock()
+
+
+def decode(tp: type[T], data: Any, lazy: bool = False) -> T:
+    """
+    Decode parsed JSON data into the given type, e.g. decode(Capsule, res.json())
+    or decode(list[Computation], res.json()).
+
+    With lazy=True, nested fields of models are only decoded when first accessed.
+    Lazy models are subclasses of the requested models and compare equal to, hash
+    and serialize (to_dict, pickle) like their eagerly decoded counterparts.
+    Invalid nested values, such as unknown enum values, are reported on access.
+    """
+    return _decode(tp, data, lazy)
+
+
+def decode_response(tp: type[T], response: Any, lazy: bool = False) -> T:
+    """
+    Decode the JSON body of a response into the given type, like
+    decode(tp, response.json(), lazy). Responses served again by the response cache
+    carry a DecodedBody, whose models are reused instead of being decoded anew.
+    """
+    body = getattr(response, "decoded_body", None)
+    if isinstance(body, DecodedBody):
+        return body.decode(tp, lazy)
+    return decode(tp, response.json(), lazy)
+
+
+class DecodedBody:
+    """
+    Parsed JSON body of a cached response and the models decoded from it, decoded once
+    per type and shared by the callers it is served to.
+    """
+
+    def __init__(self, data: Any):
+        self._data = data
+        self._models: dict[tuple[Any, bool], Any] = {}
+
+    def decode(self, tp: type[T], lazy: bool = False) -> T:
+        """Decode the body into the given type, or return the models decoded before."""
+        try:
+            return self._models[tp, lazy]
+        except KeyError:
+            pass
+        return self._models.setdefault((tp, lazy), _decode(tp, self._data, lazy))
+
+
+def _decode(tp: Any, data: Any, lazy: bool) -> Any:
+    decoder = get_decoder(tp, lazy)
+    return decoder(data) if decoder is not None and data is not None else data
+
+
+def get_decoder(tp: Any, lazy: bool = False) -> Optional[Decoder]:
+    """Get the decoder for a type, building it on first use. None means values are used as is."""
+    decoders = _lazy_decoders if lazy else _decoders
+    try:
+        return decoders[tp]
+    except KeyError:
+        pass
+    with _lock:
+        if tp not in decoders:
+            decoders[tp] = _build_decoder(tp, lazy)
+        return decoders[tp]
+
+
+def type_hints(cls: type) -> dict[str, Any]:
+    """
+    Resolve the field types of a dataclass, like typing.get_type_hints.
+
+    On Python versions that can't evaluate annotations such as 'str | float', fields
+    are resolved one by one and unresolvable ones are typed as Any.
+    """
+    try:
+        return get_type_hints(cls)
+    except TypeError:
+        # Annotations such as 'str | float' can't be evaluated before Python 3.10.
+        # Resolve fields one by one and use the values of unresolvable ones as is.
+        module = sys.modules[cls.__module__].__dict__
+        hints = {}
+        for f in fields(cls):
+            try:
+                hints[f.name] = eval(f.type, module) if isinstance(f.type, str) else f.type
+            except TypeError:
+                hints[f.name] = Any
+        return hints
+
+
+def _build_decoder(tp: Any, lazy: bool) -> Optional[Decoder]:
+    if tp in _PLAIN_TYPES:
+        return None
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is Union or origin is UnionType:
+        options = [a for a in args if a is not type(None)]
+        # Unions of several types are decoded as is, like dataclasses_json does
+        return get_decoder(options[0], lazy) if len(options) == 1 else None
+    if origin is list:
+        item_decoder = get_decoder(args[0], lazy) if args else None
+        if item_decoder is None:
+            return None
+        return lambda values: [item_decoder(v) for v in values]
+    if origin is not None:
+        return None
+    if is_dataclass(tp):
+        return _build_lazy_dataclass_decoder(tp) if lazy else _build_dataclass_decoder(tp)
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return _build_enum_decoder(tp)
+    return None
+
+
+def _build_enum_decoder(tp: type[Enum]) -> Decoder:
+    members = tp._value2member_map_
+
+    def decode_enum(value):
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            return tp(value)
+
+    return decode_enum
+
+
+def _build_dataclass_decoder(cls: type) -> Decoder:
+    hints = type_hints(cls)
+    namespace: dict[str, Any] = {"cls": cls}
+    body = []
+    args = []
+    for i, f in enumerate(fields(cls)):
+        if not f.init:
+            continue
+        key = repr(f.name)
+        if f.default is not MISSING:
+            namespace[f"default_{i}"] = f.default
+            value = f"get({key}, default_{i})"
+        elif f.default_factory is not MISSING:
+            namespace[f"factory_{i}"] = f.default_factory
+            value = f"(data[{key}] if {key} in data else factory_{i}())"
+        else:
+            value = f"data[{key}]"
+
+        decoder = get_decoder(hints.get(f.name, Any))
+        if decoder is None:
+            args.append(f"{f.name}={value}")
+        else:
+            namespace[f"decode_{i}"] = decoder
+            body.append(f"    v{i} = {value}")
+            args.append(f"{f.name}=None if v{i} is None else decode_{i}(v{i})")
+
+    source = "\n".join([
+        "def decode(data):",
+        "    get = data.get",
+        *body,
+        f"    return cls({', '.join(args)})",
+    ])
+    exec(source, namespace)
+    decoder = namespace["decode"]
+    decoder.__name__ = decoder.__qualname__ = f"decode_{cls.__name__}"
+    return decoder
+
+
+def _build_lazy_dataclass_decoder(cls: type) -> Decoder:
+    hints = type_hints(cls)
+    lazy_fields = {}
+    for f in fields(cls):
+        decoder = get_decoder(hints.get(f.name, Any), lazy=True)
+        if decoder is not None:
+            lazy_fields[f.name] = decoder
+    slots = {name: _find_slot(cls, name) for name in lazy_fields}
+    # Decoding values on access needs somewhere to cache them: the slots of a slotted model
+    if not lazy_fields or None in slots.values() or not all(f.init for f in fields(cls)):
+        return _build_dataclass_decoder(cls)
+
+    lazy_cls = _lazy_class(cls, {
+        name: _LazyField(name, slots[name], decoder, _default_factory(cls.__dataclass_fields__[name]))
+        for name, decoder in lazy_fields.items()
+    })
+    namespace: dict[str, Any] = {
+        "new": object.__new__,
+        "lazy_cls": lazy_cls,
+        "set_data": lazy_cls.__dict__["_data"].__set__,
+    }
+    checks = []
+    assignments = []
+    for i, f in enumerate(fields(cls)):
+        key = repr(f.name)
+        if f.name in lazy_fields:
+            if f.default is MISSING and f.default_factory is MISSING:
+                checks.append(f"    if {key} not in data: raise KeyError({key})")
+            continue
+        namespace[f"set_{i}"] = _find_slot(cls, f.name).__set__
+        if f.default is not MISSING:
+            namespace[f"default_{i}"] = f.default
+            assignments.append(f"    set_{i}(obj, get({key}, default_{i}))")
+        elif f.default_factory is not MISSING:
+            namespace[f"factory_{i}"] = f.default_factory
+            assignments.append(f"    set_{i}(obj, data[{key}] if {key} in data else factory_{i}())")
+        else:
+            assignments.append(f"    set_{i}(obj, data[{key}])")
+
+    source = "\n".join([
+        "def decode(data):",
+        "    get = data.get",
+        *checks,
+        "    obj = new(lazy_cls)",
+        "    set_data(obj, data)",
+        *assignments,
+        "    return obj",
+    ])
+    exec(source, namespace)
+    decoder = namespace["decode"]
+    decoder.__name__ = decoder.__qualname__ = f"decode_lazy_{cls.__name__}"
+    return decoder
+
+
+class _LazyField:
+    """Descriptor decoding a field from the model's parsed JSON on first access."""
+
+    __slots__ = ("name", "slot", "decoder", "default")
+
+    def __init__(self, name: str, slot: MemberDescriptorType, decoder: Decoder, default: Callable[[], Any]):
+        self.name = name
+        self.slot = slot
+        self.decoder = decoder
+        self.default = default
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, objtype)
+        except AttributeError:
+            pass
+        data = obj._data
+        if self.name not in data:
+            value = self.default()
+        elif data[self.name] is None:
+            value = None
+        else:
+            value = self.decoder(data[self.name])
+        self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        # Only reached through object.__setattr__, e.g. from __init__: the frozen
+        # model's __setattr__ rejects regular assignments
+        self.slot.__set__(obj, value)
+
+
+def _lazy_class(cls: type, lazy_fields: dict[str, _LazyField]) -> type:
+    names = tuple(f.name for f in fields(cls))
+
+    def __eq__(self, other):
+        if not isinstance(other, cls):
+            return NotImplemented
+        return tuple(getattr(self, n) for n in names) == tuple(getattr(other, n) for n in names)
+
+    def __reduce__(self):
+        # Pickle and copy as the regular model, as lazy classes can't be imported
+        return cls, tuple(getattr(self, n) for n in names)
+
+    return type(f"Lazy{cls.__name__}", (cls,), {
+        "__slots__": ("_data",),
+        "__module__": cls.__module__,
+        "__qualname__": f"Lazy{cls.__qualname__}",
+        "__eq__": __eq__,
+        "__hash__": cls.__hash__,
+        "__reduce__": __reduce__,
+        **lazy_fields,
+    })
+
+
+def _find_slot(cls: type, name: str) -> Optional[MemberDescriptorType]:
+    for klass in cls.__mro__:
+        slot = klass.__dict__.get(name)
+        if isinstance(slot, MemberDescriptorType):
+            return slot
+    return None
+
+
+def _default_factory(f: Field) -> Callable[[], Any]:
+    if f.default_factory is not MISSING:
+        return f.default_factory
+    # Missing required fields are rejected when the lazy model is built
+    default = None if f.default is MISSING else f.default
+    return lambda: default
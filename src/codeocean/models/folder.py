@@ -5,8 +5,11 @@ from dataclasses import dataclass, field
 from typing import Optional
 from warnings import warn
 
+from codeocean.slots import add_slots
+
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class FolderItem:
     """Represents a file or folder item within a folder listing."""
@@ -27,6 +30,7 @@ class FolderItem:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class Folder:
     """Represents a folder with its list of items (files and subfolders)."""
@@ -37,6 +41,7 @@ class Folder:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class ListFolderParams:
     """Parameters for listing contents of a folder."""
@@ -47,6 +52,7 @@ class ListFolderParams:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class DownloadFileURL:
     """Download URL information for retrieving a file."""
@@ -64,6 +70,7 @@ class DownloadFileURL:
 
 
 @dataclass_json
+@add_slots
 @dataclass(frozen=True)
 class FileURLs:
     """Represents a collection of file download URLs."""
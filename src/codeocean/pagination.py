@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from contextvars import copy_context
+from dataclasses import dataclass
+from queue import Queue
+from threading import Event, Semaphore, Thread
+from typing import Any, Callable, Iterator, TypeVar
+
+Page = TypeVar("Page")
+
+# Seconds between checks for consumer cancellation while the prefetch thread waits
+_STOP_CHECK_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class _Failure:
+    error: BaseException
+
+
+_DONE = object()
+
+
+def page_field(page: Any, name: str) -> Any:
+    """Get a field of a search result page, either a results model or a raw JSON dict."""
+    return page[name] if isinstance(page, dict) else getattr(page, name)
+
+
+def validate_prefetch(prefetch: int):
+    """Validate the prefetch argument of search iterators."""
+    if prefetch < 0:
+        raise ValueError(f"Prefetch {prefetch} should be greater than or equal to 0")
+
+
+def iterate_pages(
+    search: Callable[[dict], Page],
+    params: dict,
+    prefetch: int = 0,
+) -> Iterator[Page]:
+    """
+    Iterate through search result pages by following next_token.
+
+    Args:
+        search: Function performing one search request for the given parameters,
+            returning a result page with has_more and next_token fields
+        params: Search parameters of the first page
+        prefetch: Number of pages to request ahead on a background thread while the
+            current page is being consumed. 0 fetches each page only when needed
+
+    Raises:
+        ValueError: If prefetch < 0
+    """
+    validate_prefetch(prefetch)
+
+    if prefetch == 0:
+        params = dict(params)
+        while True:
+            page = search(params)
+            yield page
+            if not page_field(page, "has_more"):
+                return
+            params["next_token"] = page_field(page, "next_token")
+
+    yield from _prefetch_pages(search, params, prefetch)
+
+
+def iterate_results(pages: Iterator[Page], raw: bool) -> Iterator[Any]:
+    """Iterate through the results of search result pages, either results models or raw JSON dicts."""
+    for page in pages:
+        yield from page["results"] if raw else page.results
+
+
+def _prefetch_pages(search: Callable[[dict], Page], params: dict, prefetch: int) -> Iterator[Page]:
+    # Each fetched page holds a slot until the consumer takes it, so at most
+    # `prefetch` pages are in flight or buffered ahead of the consumer.
+    pages: Queue[Any] = Queue()
+    slots = Semaphore(prefetch)
+    stop = Event()
+
+    def produce():
+        next_params = dict(params)
+        try:
+            while True:
+                while not slots.acquire(timeout=_STOP_CHECK_INTERVAL):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                page = search(next_params)
+                pages.put(page)
+                if not page_field(page, "has_more"):
+                    break
+                next_params["next_token"] = page_field(page, "next_token")
+        except Exception as err:
+            pages.put(_Failure(err))
+            return
+        pages.put(_DONE)
+
+    # The thread runs in a copy of the consumer's context, to inherit its deadline
+    thread = Thread(target=copy_context().run, args=(produce,), name="codeocean-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        stop.set()
@@ -27,25 +27,29 @@ class Pipelines:
     def __post_init__(self):
         self._capsules = Capsules(client=self.client, _route="pipelines")
 
-    def get_pipeline(self, pipeline_id: str) -> Capsule:
+    def get_pipeline(self, pipeline_id: str, raw: bool = False) -> Capsule:
         """Retrieve metadata for a specific pipeline by its ID."""
-        return self._capsules.get_capsule(pipeline_id)
+        return self._capsules.get_capsule(pipeline_id, raw=raw)
 
     def delete_pipeline(self, pipeline_id: str):
         """Delete a pipeline permanently."""
         return self._capsules.delete_capsule(pipeline_id)
 
-    def get_pipeline_app_panel(self, pipeline_id: str, version: int | None = None) -> AppPanel:
+    def get_pipeline_app_panel(self, pipeline_id: str, version: int | None = None, raw: bool = False) -> AppPanel:
         """Retrieve app panel information for a specific pipeline by its ID."""
-        return self._capsules.get_capsule_app_panel(pipeline_id, version)
+        return self._capsules.get_capsule_app_panel(pipeline_id, version, raw=raw)
 
-    def list_computations(self, pipeline_id: str) -> list[Computation]:
+    def list_computations(self, pipeline_id: str, raw: bool = False) -> list[Computation]:
         """Get all computations associated with a specific pipeline."""
-        return self._capsules.list_computations(pipeline_id)
+        return self._capsules.list_computations(pipeline_id, raw=raw)
 
-    def get_permissions(self, pipeline_id: str) -> Permissions:
+    def list_computations_iterator(self, pipeline_id: str, raw: bool = False) -> Iterator[Computation]:
+        """Iterate through all computations associated with a specific pipeline, streaming the response."""
+        return self._capsules.list_computations_iterator(pipeline_id, raw=raw)
+
+    def get_permissions(self, pipeline_id: str, raw: bool = False) -> Permissions:
         """Get permissions for a specific pipeline."""
-        return self._capsules.get_permissions(pipeline_id)
+        return self._capsules.get_permissions(pipeline_id, raw=raw)
 
     def update_permissions(self, pipeline_id: str, permissions: Permissions):
         """Update permissions for a pipeline."""
@@ -55,26 +59,38 @@ class Pipelines:
         self,
         pipeline_id: str,
         attach_params: list[DataAssetAttachParams],
+        raw: bool = False,
     ) -> list[DataAssetAttachResults]:
         """Attach one or more data assets to a pipeline with optional mount paths."""
-        return self._capsules.attach_data_assets(pipeline_id, attach_params)
+        return self._capsules.attach_data_assets(pipeline_id, attach_params, raw=raw)
 
     def detach_data_assets(self, pipeline_id: str, data_assets: list[str]):
         """Detach one or more data assets from a pipeline by their IDs."""
         return self._capsules.detach_data_assets(pipeline_id, data_assets)
 
-    def sync_pipeline(self, pipeline_id: str) -> GitSyncResults:
+    def sync_pipeline(self, pipeline_id: str, raw: bool = False) -> GitSyncResults:
         """Sync a pipeline with its linked external Git repository."""
-        return self._capsules.sync_capsule(pipeline_id)
+        return self._capsules.sync_capsule(pipeline_id, raw=raw)
 
     def archive_pipeline(self, pipeline_id: str, archive: bool):
         """Archive or unarchive a pipeline to control its visibility and accessibility."""
         return self._capsules.archive_capsule(pipeline_id, archive)
 
-    def search_pipelines(self, search_params: CapsuleSearchParams) -> CapsuleSearchResults:
+    def search_pipelines(
+        self,
+        search_params: CapsuleSearchParams,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> CapsuleSearchResults:
         """Search for pipelines with filtering, sorting, and pagination options."""
-        return self._capsules.search_capsules(search_params)
+        return self._capsules.search_capsules(search_params, raw=raw, lazy=lazy)
 
-    def search_pipelines_iterator(self, search_params: CapsuleSearchParams) -> Iterator[Capsule]:
+    def search_pipelines_iterator(
+        self,
+        search_params: CapsuleSearchParams,
+        prefetch: int = 0,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> Iterator[Capsule]:
         """Iterate through all pipelines matching search criteria with automatic pagination."""
-        return self._capsules.search_capsules_iterator(search_params)
+        return self._capsules.search_capsules_iterator(search_params, prefetch, raw=raw, lazy=lazy)
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from random import uniform
+from statistics import median
+from time import monotonic, sleep, time
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+from codeocean.deadline import capped_sleep
+from codeocean.models.computation import Computation, ComputationEndStatus, ComputationState
+
+T = TypeVar("T")
+
+# Minimum time between status checks of the same resource in seconds
+MIN_POLLING_INTERVAL = 5
+
+# Minimum delay between status checks produced by polling strategies in seconds
+MIN_STRATEGY_INTERVAL = 1
+
+
+class PollingStrategy(ABC):
+    """Strategy deciding how long to wait between status checks of a resource."""
+
+    @abstractmethod
+    def delays(self, started: Optional[float] = None) -> Iterator[float]:
+        """
+        Generate the delays in seconds between consecutive status checks.
+
+        Args:
+            started: Unix time at which the monitored resource was created, if known
+        """
+
+
+@dataclass(frozen=True)
+class FixedInterval(PollingStrategy):
+    """Check status at a constant interval."""
+
+    interval: float = MIN_POLLING_INTERVAL
+
+    def __post_init__(self):
+        if self.interval < MIN_STRATEGY_INTERVAL:
+            raise ValueError(
+                f"Interval {self.interval} should be greater than or equal to {MIN_STRATEGY_INTERVAL}"
+            )
+
+    def delays(self, started: Optional[float] = None) -> Iterator[float]:
+        while True:
+            yield self.interval
+
+
+@dataclass(frozen=True)
+class ExponentialBackoff(PollingStrategy):
+    """Check status often at first, then multiply the delay after every check up to a cap."""
+
+    initial: float = MIN_STRATEGY_INTERVAL
+    multiplier: float = 2
+    max_interval: float = 60
+
+    def __post_init__(self):
+        if self.initial < MIN_STRATEGY_INTERVAL:
+            raise ValueError(
+                f"Initial interval {self.initial} should be greater than or equal to {MIN_STRATEGY_INTERVAL}"
+            )
+        if self.multiplier < 1:
+            raise ValueError(f"Multiplier {self.multiplier} should be greater than or equal to 1")
+        if self.max_interval < self.initial:
+            raise ValueError(
+                f"Max interval {self.max_interval} should be greater than or equal to initial interval {self.initial}"
+            )
+
+    def delays(self, started: Optional[float] = None) -> Iterator[float]:
+        delay = self.initial
+        while True:
+            yield delay
+            delay = min(delay * self.multiplier, self.max_interval)
+
+
+@dataclass(frozen=True)
+class DecorrelatedJitter(PollingStrategy):
+    """
+    Exponential backoff with decorrelated jitter: each delay is drawn uniformly between
+    base and three times the previous delay, capped at max_interval. Spreads the checks
+    of many resources started together instead of polling them in lockstep.
+    """
+
+    base: float = MIN_STRATEGY_INTERVAL
+    max_interval: float = 60
+
+    def __post_init__(self):
+        if self.base < MIN_STRATEGY_INTERVAL:
+            raise ValueError(
+                f"Base interval {self.base} should be greater than or equal to {MIN_STRATEGY_INTERVAL}"
+            )
+        if self.max_interval < self.base:
+            raise ValueError(
+                f"Max interval {self.max_interval} should be greater than or equal to base interval {self.base}"
+            )
+
+    def delays(self, started: Optional[float] = None) -> Iterator[float]:
+        delay = self.base
+        while True:
+            delay = min(self.max_interval, uniform(self.base, delay * 3))
+            yield delay
+
+
+@dataclass(frozen=True)
+class ExpectedRunTime(PollingStrategy):
+    """
+    Wait until the expected finish time of a computation, then fall back to another
+    strategy (exponential backoff by default) for the remaining checks.
+
+    Use from_computations() to derive the expected run time from the run times of
+    previous computations of the same capsule or pipeline.
+    """
+
+    expected_run_time: float
+    fallback: PollingStrategy = field(default_factory=ExponentialBackoff)
+
+    @classmethod
+    def from_computations(
+        cls,
+        computations: Iterable[Computation],
+        fallback: Optional[PollingStrategy] = None,
+    ) -> ExpectedRunTime:
+        """
+        Build a strategy expecting the median run time of the given computations
+        (e.g. from Capsules.list_computations) that completed successfully.
+        """
+        run_times = [
+            c.run_time
+            for c in computations
+            if c.state == ComputationState.Completed and c.end_status == ComputationEndStatus.Succeeded
+        ]
+        return cls(
+            expected_run_time=median(run_times) if run_times else 0,
+            fallback=fallback or ExponentialBackoff(),
+        )
+
+    def delays(self, started: Optional[float] = None) -> Iterator[float]:
+        elapsed = time() - started if started is not None else 0
+        remaining = self.expected_run_time - elapsed
+        if remaining >= MIN_STRATEGY_INTERVAL:
+            yield remaining
+        yield from self.fallback.delays(started)
+
+
+def validate_polling(
+    polling_interval: float,
+    timeout: Optional[float],
+    polling_strategy: Optional[PollingStrategy] = None,
+):
+    """Validate polling interval, timeout and strategy arguments of wait methods."""
+    if polling_strategy is None and polling_interval < MIN_POLLING_INTERVAL:
+        raise ValueError(
+            f"Polling interval {polling_interval} should be greater than or equal to {MIN_POLLING_INTERVAL}"
+        )
+    if polling_strategy is None and timeout is not None and timeout < polling_interval:
+        raise ValueError(
+            f"Timeout {timeout} should be greater than or equal to polling interval {polling_interval}"
+        )
+    if timeout is not None and timeout < 0:
+        raise ValueError(
+            f"Timeout {timeout} should be greater than or equal to 0 (seconds), or None"
+        )
+
+
+def validate_request_rate(max_requests_per_second: float):
+    """Validate the request rate budget of methods polling many resources."""
+    if max_requests_per_second <= 0:
+        raise ValueError(
+            f"Max requests per second {max_requests_per_second} should be greater than 0"
+        )
+
+
+def capped_delay(delay: float, t0: float, timeout: Optional[float]) -> float:
+    """
+    Cap the delay before the next status check of a wait loop started at t0 (time())
+    at the time left before its timeout and the current deadline, so the loop never
+    sleeps past them.
+    """
+    if timeout is not None:
+        delay = max(0.0, min(delay, t0 + timeout - time()))
+    return capped_sleep(delay)
+
+
+class PollSchedule:
+    """
+    Schedule of status checks for many resources sharing one request rate budget.
+
+    Each resource is checked according to the delays of its polling strategy, and checks
+    across all resources are spaced at least 1 / max_requests_per_second seconds apart,
+    so the total request rate stays within budget no matter how many resources are tracked.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[str],
+        polling_strategy: PollingStrategy,
+        max_requests_per_second: float,
+        timeout: Optional[float] = None,
+        label: str = "Resources",
+        started: Optional[Iterable[Optional[float]]] = None,
+    ):
+        validate_request_rate(max_requests_per_second)
+        ids = list(ids)
+        started = list(started) if started is not None else [None] * len(ids)
+        self.spacing = 1 / max_requests_per_second
+        self.label = label
+        self.timeout = timeout
+        now = monotonic()
+        self.deadline = now + timeout if timeout is not None else None
+        self._last_poll = now - self.spacing
+        self._delays = [polling_strategy.delays(s) for s in started]
+        self._queue: list[tuple[float, int, str]] = []
+        for i, id in enumerate(ids):
+            heappush(self._queue, (now, i, id))
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def next(self) -> tuple[float, int, str]:
+        """
+        Pop the next resource to check.
+
+        Returns:
+            Seconds to wait before checking, the resource's position in the
+            original ids, and the resource ID
+
+        Raises:
+            TimeoutError: If the next check would happen after the timeout
+        """
+        due, index, id = heappop(self._queue)
+        at = max(due, self._last_poll + self.spacing)
+        if self.deadline is not None and at > self.deadline:
+            pending = sorted([(index, id)] + [(i, p) for _, i, p in self._queue])
+            raise TimeoutError(
+                f"{self.label} {', '.join(p for _, p in pending)} did not finish within {self.timeout} seconds"
+            )
+        self._last_poll = at
+        return max(0.0, at - monotonic()), index, id
+
+    def reschedule(self, index: int, id: str):
+        """Schedule the next check of a resource that hasn't finished yet."""
+        heappush(self._queue, (self._last_poll + next(self._delays[index]), index, id))
+
+
+def poll_many(
+    ids: Iterable[str],
+    get: Callable[[str], T],
+    is_done: Callable[[T], bool],
+    polling_strategy: PollingStrategy,
+    max_requests_per_second: float,
+    timeout: Optional[float] = None,
+    label: str = "Resources",
+    started: Optional[Iterable[Optional[float]]] = None,
+) -> Iterator[T]:
+    """Poll many resources from a single loop, yielding each one as soon as it's done."""
+    schedule = PollSchedule(ids, polling_strategy, max_requests_per_second, timeout, label, started)
+    while schedule:
+        delay, index, id = schedule.next()
+        if delay:
+            sleep(capped_sleep(delay))
+        item = get(id)
+        if is_done(item):
+            yield item
+        else:
+            schedule.reschedule(index, id)
@@ -0,0 +1,259 @@
+"""
+Client-side rate limiting with adaptive concurrency.
+
+A RateLimiter paces the requests of a client with a token bucket and bounds the
+number of requests in flight with a limit adjusted by AIMD (additive increase,
+multiplicative decrease): every successful response raises the limit a little,
+while throttled (429) and failed (5xx) responses, or responses slower than a latency
+target, halve it. Throttled requests are retried after the delay the server asks for
+in its Retry-After header, and no request is sent before that delay is over (up to
+max_retry_after).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable, Optional
+import asyncio
+
+from codeocean.deadline import capped_wait
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Counters of a rate limiter."""
+
+    concurrency_limit: int
+    in_flight: int
+    requests: int
+    throttled: int
+    server_errors: int
+    retries: int
+    wait_time: float
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with an AIMD concurrency limit, shared by the resource
+    clients of a client.
+
+    Without a rate, requests are only bounded by the concurrency limit, which starts at
+    initial_concurrency and adapts to the load the server accepts, up to
+    max_concurrency. When the client also has a retry policy, throttled requests are
+    retried by the retry policy only, not by the rate limiter, so that their retries
+    don't multiply.
+
+    Args:
+        rate: Maximum requests per second, or None for no fixed rate
+        burst: Number of requests that can be sent at once after an idle period
+        initial_concurrency: Initial limit of requests in flight
+        max_concurrency: Maximum limit of requests in flight
+        backoff: Factor the concurrency limit is multiplied by on 429, 5xx and slow responses
+        latency_target: Seconds above which a response counts as slow, or None to ignore latency
+        retries: Number of retries of throttled (429) requests
+        retry_delay: Seconds to wait before retrying a throttled request without a Retry-After
+            header, doubled on each retry
+        max_retry_after: Maximum seconds requests are paused for after a 429 or 503
+            response, whatever its Retry-After header asks for
+        clock: Time source, in seconds
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 10,
+        initial_concurrency: int = 8,
+        max_concurrency: int = 64,
+        backoff: float = 0.5,
+        latency_target: Optional[float] = None,
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        max_retry_after: float = 60,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError(f"Rate {rate} should be greater than 0")
+        if burst < 1:
+            raise ValueError(f"Burst {burst} should be greater than or equal to 1")
+        if not 1 <= initial_concurrency <= max_concurrency:
+            raise ValueError(
+                f"Initial concurrency {initial_concurrency} should be between 1 and max concurrency {max_concurrency}"
+            )
+        if not 0 < backoff < 1:
+            raise ValueError(f"Backoff {backoff} should be between 0 and 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.backoff = backoff
+        self.latency_target = latency_target
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.max_retry_after = max_retry_after
+        self.clock = clock
+        self._condition = Condition()
+        # Futures of the tasks waiting in acquire_async(), resolved by release()
+        self._async_waiters: list[asyncio.Future] = []
+        self._limit = float(initial_concurrency)
+        self._tokens = float(burst)
+        self._refilled = clock()
+        self._paused_until = 0.0
+        self._decreased = float("-inf")
+        self._in_flight = 0
+        self._requests = self._throttled = self._server_errors = self._retries = 0
+        self._wait_time = 0.0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current limit of requests in flight."""
+        return max(1, int(self._limit))
+
+    def acquire(self) -> float:
+        """
+        Wait until a request can be sent and take its slot. Returns the time it's sent at.
+
+        Raises:
+            DeadlineExceeded: If the current deadline passes first
+        """
+        t0 = self.clock()
+        with self._condition:
+            while True:
+                wait = self._try_acquire()
+                if wait == 0:
+                    break
+                self._condition.wait(capped_wait(wait))
+            return self._sent(t0)
+
+    async def acquire_async(self) -> float:
+        """Asynchronous version of acquire()."""
+        t0 = self.clock()
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                wait = self._try_acquire()
+                if wait == 0:
+                    return self._sent(t0)
+                waiter = loop.create_future()
+                self._async_waiters.append(waiter)
+            try:
+                await asyncio.wait((waiter,), timeout=capped_wait(wait))
+            finally:
+                with self._condition:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+                waiter.cancel()
+
+    def release(self, sent: float, response: Any = None):
+        """
+        Free the slot of a request sent at `sent`, adapting the concurrency limit to its
+        response (a requests or httpx response, or None if no response was received).
+        """
+        now = self.clock()
+        status = response.status_code if response is not None else None
+        with self._condition:
+            self._in_flight -= 1
+            if status == 429:
+                self._throttled += 1
+            elif status is not None and status >= 500:
+                self._server_errors += 1
+            delay = retry_after(response) if status in (429, 503) else None
+            if delay is not None:
+                self._pause(now + delay)
+
+            slow = self.latency_target is not None and now - sent > self.latency_target
+            if status == 429 or (status is not None and status >= 500) or slow:
+                # Requests sent before the last decrease saw the old limit: decrease once per round
+                if sent >= self._decreased:
+                    self._limit = max(1.0, self._limit * self.backoff)
+                    self._decreased = now
+            elif status is not None and status < 400:
+                self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+            for waiter in self._async_waiters:
+                waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+            self._async_waiters.clear()
+
+    def should_retry(self, response: Any, attempt: int) -> bool:
+        """
+        Whether to retry a released request whose attempt-th retry (0 for the first
+        try) was throttled. Without a Retry-After header, requests are paused for
+        retry_delay, doubled on each retry.
+        """
+        if response is None or response.status_code != 429 or attempt >= self.retries:
+            return False
+        with self._condition:
+            self._retries += 1
+            if retry_after(response) is None:
+                self._pause(self.clock() + self.retry_delay * 2 ** attempt)
+        return True
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """Snapshot of the rate limiter counters."""
+        with self._condition:
+            return RateLimiterStats(
+                concurrency_limit=self.concurrency_limit,
+                in_flight=self._in_flight,
+                requests=self._requests,
+                throttled=self._throttled,
+                server_errors=self._server_errors,
+                retries=self._retries,
+                wait_time=self._wait_time,
+            )
+
+    def _try_acquire(self) -> Optional[float]:
+        # Returns 0 if a slot was taken, else the seconds to wait, or None to wait for a release
+        now = self.clock()
+        if self._paused_until > now:
+            return self._paused_until - now
+        if self._in_flight >= self.concurrency_limit:
+            return None
+        if self.rate is not None:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._refilled) * self.rate)
+            self._refilled = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+        self._in_flight += 1
+        return 0
+
+    def _pause(self, until: float):
+        self._paused_until = max(self._paused_until, min(until, self.clock() + self.max_retry_after))
+
+    def _sent(self, t0: float) -> float:
+        now = self.clock()
+        self._requests += 1
+        self._wait_time += now - t0
+        return now
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def retry_after(response: Any) -> Optional[float]:
+    """Seconds to wait before retrying, from a response's Retry-After header (seconds or HTTP date)."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_rate_limiter(rate_limit: bool | RateLimiter) -> Optional[RateLimiter]:
+    """Get the rate limiter for a client's rate_limit setting: True, False or a RateLimiter."""
+    if isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return RateLimiter() if rate_limit else None
@@ -0,0 +1,148 @@
+"""
+Endpoint-aware retries of failed requests.
+
+Reads are retried on transient failures: GET, HEAD and OPTIONS requests, PUT and
+DELETE requests, which leave the same state when repeated, and POST requests that
+don't change anything, such as searches. Other POST requests, such as running a
+capsule or creating a data asset, create a new object each time they are processed,
+so they are only retried when they certainly weren't processed: when the connection
+couldn't be established or the server throttled them (429). Servers deduplicating
+requests by an idempotency key can be sent one with each create, generated once per
+call and reused by its retries, so that creates are retried like reads.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from random import uniform
+from threading import Lock
+from typing import Any, Iterable, Optional
+from urllib3.exceptions import NewConnectionError
+from uuid import uuid4
+import requests
+
+from codeocean.cache import READ_ONLY_POSTS, path_matches
+from codeocean.rate_limit import retry_after
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+# Status codes of transient server failures
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """Counters of a retry policy."""
+
+    retries: int
+    exhausted: int
+
+
+class RetryPolicy:
+    """
+    Retry policy of a client's requests, applied per endpoint according to whether
+    repeating the request is safe (see the module documentation).
+
+    Retries wait for an exponential backoff with full jitter: a random delay of up to
+    backoff * 2**retry seconds, capped at max_backoff, or the Retry-After delay sent
+    by the server.
+
+    Args:
+        retries: Maximum number of retries of a request
+        backoff: Base delay between retries in seconds
+        max_backoff: Maximum delay between retries in seconds
+        status_codes: HTTP status codes of responses to retry
+        idempotent_posts: Path patterns of POST requests that are safe to repeat; '*'
+            matches a single path segment. Defaults to the searches and listings
+        idempotency_key: Header to send a unique key with in other POST requests (e.g.
+            'Idempotency-Key'), retrying them like reads. Only set it if the server
+            deduplicates requests by this header
+    """
+
+    def __init__(
+        self,
+        retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        status_codes: Iterable[int] = RETRY_STATUS_CODES,
+        idempotent_posts: Iterable[str] = READ_ONLY_POSTS,
+        idempotency_key: Optional[str] = None,
+    ):
+        if retries < 0:
+            raise ValueError(f"Retries {retries} should be greater than or equal to 0")
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.status_codes = frozenset(status_codes)
+        self.idempotent_posts = tuple(idempotent_posts)
+        self.idempotency_key = idempotency_key
+        self._lock = Lock()
+        self._retries = self._exhausted = 0
+
+    def idempotent(self, method: str, url: str) -> bool:
+        """Whether repeating a request leaves the same state as sending it once."""
+        method = method.upper()
+        if method in IDEMPOTENT_METHODS:
+            return True
+        return method == "POST" and any(path_matches(url, pattern) for pattern in self.idempotent_posts)
+
+    def idempotency_headers(self, method: str, url: str) -> Optional[dict[str, str]]:
+        """Headers with a new idempotency key for a request that isn't idempotent, or None."""
+        if self.idempotency_key is None or self.idempotent(method, url):
+            return None
+        return {self.idempotency_key: uuid4().hex}
+
+    def delay(
+        self,
+        attempt: int,
+        idempotent: bool,
+        response: Any = None,
+        sent: bool = True,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying a failed request, or None not to retry it.
+
+        Args:
+            attempt: Number of retries of the request so far
+            idempotent: Whether the request is safe to repeat
+            response: Error response (a requests or httpx response), or None if the
+                request failed without a response
+            sent: Whether the request may have reached the server, False for
+                connection failures
+        """
+        if response is not None:
+            status = response.status_code
+            retry = status in self.status_codes and (idempotent or status == 429)
+        else:
+            retry = idempotent or not sent
+        if not retry:
+            return None
+        with self._lock:
+            if attempt >= self.retries:
+                self._exhausted += 1
+                return None
+            self._retries += 1
+        delay = retry_after(response) if response is not None else None
+        if delay is None:
+            delay = uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        return delay
+
+    @property
+    def stats(self) -> RetryStats:
+        """Snapshot of the retry policy counters."""
+        with self._lock:
+            return RetryStats(retries=self._retries, exhausted=self._exhausted)
+
+
+def connection_failed(err: requests.RequestException) -> bool:
+    """Whether a requests exception means the connection couldn't be established, so nothing was sent."""
+    if isinstance(err, requests.ConnectTimeout):
+        return True
+    reason = getattr(err.args[0], "reason", None) if err.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def get_retry_policy(retry: bool | RetryPolicy) -> Optional[RetryPolicy]:
+    """Get the retry policy for a client's retry setting: True, False or a RetryPolicy."""
+    if isinstance(retry, RetryPolicy):
+        return retry
+    return RetryPolicy() if retry else None
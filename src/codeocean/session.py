@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from itertools import count
+from requests_toolbelt.sessions import BaseUrlSession
+from time import sleep
+from typing import Optional
+import requests
+
+from codeocean.cache import ResponseCache, validators
+from codeocean.circuit_breaker import CircuitBreaker
+from codeocean.coalesce import RequestCoalescer
+from codeocean.deadline import DeadlineExceeded, capped_sleep, capped_timeout, exceeded
+from codeocean.error import Error
+from codeocean.hedge import Hedger
+from codeocean.json_backend import JSONBackend, StdlibJSON
+from codeocean.rate_limit import RateLimiter
+from codeocean.retry import RetryPolicy, connection_failed
+
+# Seconds to wait for the server to accept a connection and between bytes of its responses
+DEFAULT_TIMEOUT = (10, 60)
+
+
+class Session(BaseUrlSession):
+    """
+    HTTP session used by the CodeOcean client.
+
+    Extends BaseUrlSession to encode `json=` request bodies and decode response bodies
+    (Response.json()) with the client's JSON backend, to answer GET requests from an
+    optional response cache, revalidating expired responses with conditional requests,
+    to share one request between concurrent identical GET requests with an optional
+    request coalescer, to pace the requests it sends with an optional rate limiter, to
+    retry failed requests with an optional retry policy, to hedge slow GET requests with
+    an optional hedger, and to fail requests fast while the server is unavailable with
+    an optional circuit breaker. Requests are sent with the session's default timeout,
+    capped at the time left before the current deadline (see codeocean.deadline).
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        json_backend: Optional[JSONBackend] = None,
+        cache: Optional[ResponseCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Optional[float | tuple[float, float]] = DEFAULT_TIMEOUT,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[Hedger] = None,
+    ):
+        super().__init__(base_url=base_url)
+        self.json_backend = json_backend or StdlibJSON()
+        self.cache = cache
+        self.coalescer = coalescer
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        self.hedger = hedger
+        self.hooks["response"].append(self._json_handler)
+
+    def request(self, method, url, *args, **kwargs):
+        if kwargs.get("json") is not None and kwargs.get("data") is None:
+            kwargs["data"] = self.json_backend.dumps(kwargs.pop("json"))
+        if self.coalescer is None or kwargs.get("stream"):
+            return self._request(method, url, *args, **kwargs)
+        key = self.coalescer.key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        if key is None:
+            return self._request(method, url, *args, **kwargs)
+        return self.coalescer.call(key, lambda: self._request(method, url, *args, **kwargs))
+
+    def _request(self, method, url, *args, **kwargs):
+        if self.cache is None:
+            return self._send(method, url, *args, **kwargs)
+
+        key = None if kwargs.get("stream") else self.cache.key(method, url, kwargs.get("params"))
+        if key is None:
+            try:
+                return self._send(method, url, *args, **kwargs)
+            finally:
+                self.cache.invalidate(method, url)
+
+        response = self.cache.get(key)
+        if response is not None:
+            return response
+        headers = kwargs.get("headers")
+        conditional = self.cache.revalidation_headers(key)
+        if conditional is not None:
+            kwargs["headers"] = {**(headers or {}), **conditional}
+        response = self._send(method, url, *args, **kwargs)
+        if response.status_code == 304 and conditional is not None:
+            cached = self.cache.revalidated(key)
+            if cached is not None:
+                return cached
+            # Dropped while revalidating: fetch it again
+            kwargs["headers"] = headers
+            response = self._send(method, url, *args, **kwargs)
+        if response.status_code == 200:
+            response_validators = validators(response)
+            if response_validators is None:
+                self.cache.put(key, response)
+            else:
+                self.cache.put_validated(key, response, response_validators)
+        return response
+
+    def _send(self, method, url, *args, **kwargs):
+        if self.retry_policy is None:
+            return self._hedge(method, url, *args, **kwargs)
+        idempotent = self.retry_policy.idempotent(method, url)
+        idempotency_headers = self.retry_policy.idempotency_headers(method, url)
+        if idempotency_headers is not None:
+            # The same key is sent by every retry
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **idempotency_headers}
+            idempotent = True
+        for attempt in count():
+            try:
+                return self._hedge(method, url, *args, **kwargs)
+            except Error as err:
+                delay = self.retry_policy.delay(attempt, idempotent, response=err.http_err.response)
+                if delay is None:
+                    raise
+            except (requests.ConnectionError, requests.Timeout) as err:
+                delay = self.retry_policy.delay(attempt, idempotent, sent=not connection_failed(err))
+                if delay is None:
+                    raise
+            sleep(capped_sleep(delay))
+
+    def _hedge(self, method, url, *args, **kwargs):
+        if self.hedger is None or kwargs.get("stream") or not self.hedger.hedged(method, url):
+            return self._attempt(method, url, *args, **kwargs)
+        return self.hedger.call(lambda: self._attempt(method, url, *args, **kwargs))
+
+    def _attempt(self, method, url, *args, **kwargs):
+        if self.rate_limiter is None:
+            return self._send_once(method, url, *args, **kwargs)
+        for attempt in count():
+            sent = self.rate_limiter.acquire()
+            try:
+                response = self._send_once(method, url, *args, **kwargs)
+            except Error as err:
+                self.rate_limiter.release(sent, err.http_err.response)
+                # With a retry policy, it retries throttled requests instead, so retries don't multiply
+                retry = self.retry_policy is None and self.rate_limiter.should_retry(err.http_err.response, attempt)
+                if retry:
+                    continue
+                raise
+            except BaseException:
+                self.rate_limiter.release(sent)
+                raise
+            self.rate_limiter.release(sent, response)
+            return response
+
+    def _send_once(self, method, url, *args, **kwargs):
+        kwargs["timeout"] = capped_timeout(kwargs.get("timeout", self.timeout))
+        probe = self.circuit_breaker.acquire() if self.circuit_breaker is not None else False
+        healthy = None
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            healthy = response.status_code < 500
+            return response
+        except Error as err:
+            healthy = err.status_code < 500
+            raise
+        except (requests.ConnectionError, requests.Timeout) as err:
+            if isinstance(err, requests.Timeout) and exceeded():
+                raise DeadlineExceeded("Deadline exceeded while waiting for the response") from err
+            healthy = False
+            raise
+        finally:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release(probe, healthy)
+
+    def _json_handler(self, response, *args, **kwargs):
+        loads = self.json_backend.loads
+        response.json = lambda **kwargs: loads(response.content)
@@ -0,0 +1,44 @@
+from dataclasses import fields
+
+
+def add_slots(cls):
+    """
+    Recreate a dataclass with __slots__ for its fields so instances don't carry a
+    __dict__, like dataclass(slots=True) which isn't available before Python 3.10.
+    Apply it directly on top of @dataclass. Frozen classes get __getstate__ and
+    __setstate__ so that instances can still be pickled and copied.
+    """
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+
+    field_names = tuple(f.name for f in fields(cls))
+    inherited_slots = {name for base in cls.__mro__[1:-1] for name in _slots(base)}
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(name for name in field_names if name not in inherited_slots)
+    # Field defaults are class attributes that would conflict with the slots
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    if cls.__dataclass_params__.frozen:
+        slotted_cls.__getstate__ = _frozen_getstate
+        slotted_cls.__setstate__ = _frozen_setstate
+    return slotted_cls
+
+
+def _slots(cls) -> tuple:
+    slots = cls.__dict__.get("__slots__", ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+
+def _frozen_getstate(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _frozen_setstate(self, state):
+    for f, value in zip(fields(self), state):
+        # Bypass the frozen __setattr__, as the generated __init__ does
+        object.__setattr__(self, f.name, value)
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional
+import json
+import re
+
+from codeocean.json_backend import JSONBackend, StdlibJSON
+
+# Bytes read from a streamed response body at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+# Bytes ending a number, true, false or null
+_SCALAR_END = re.compile(rb"[ \t\n\r,\]}]")
+# Bytes changing the nesting depth or string state within an array or object
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+# Bytes ending or escaping within a string
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    key: Optional[str] = None,
+    json_backend: Optional[JSONBackend] = None,
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array from a document read in chunks, see JSONArrayParser."""
+    parser = JSONArrayParser(key, json_backend)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    yield from parser.close()
+
+
+class JSONArrayParser:
+    """
+    Incremental parser for the elements of a JSON array in a streamed document.
+
+    Feed the document in chunks as they arrive; each call returns the array elements
+    completed so far, so only the element being received is held in memory. The array
+    is either the document itself or, when key is set, the value of that key in the
+    top-level object (e.g. the "items" of a folder listing). Parsing stops at the end
+    of the array.
+
+    The bytes of an element are held until its end is found, tracking the nesting depth
+    and strings as chunks arrive, and each element is then decoded once with the JSON
+    backend (the stdlib json module by default).
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid or ends before the array does
+    """
+
+    def __init__(self, key: Optional[str] = None, json_backend: Optional[JSONBackend] = None):
+        self.key = key
+        self._loads = (json_backend or StdlibJSON()).loads
+        self._buffer = bytearray()
+        self._pos = 0
+        self._final = False
+        self._state = self._parse_start
+        # Progress of the scan of the value at _pos: where it resumes, or None before it
+        # starts, the nesting depth and whether it is within a string
+        self._scan: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk of the document and return the newly completed array elements."""
+        self._buffer += chunk
+        return self._parse()
+
+    def close(self) -> list[Any]:
+        """Signal the end of the document and return the remaining array elements."""
+        self._final = True
+        items = self._parse()
+        if not self.done:
+            raise self._error("Unexpected end of JSON document", len(self._buffer))
+        return items
+
+    def _parse(self) -> list[Any]:
+        items: list[Any] = []
+        while not self.done and self._state(items):
+            pass
+        # Drop what has been parsed so the buffer only holds the incomplete element
+        del self._buffer[:self._pos]
+        if self._scan is not None:
+            self._scan -= self._pos
+        self._pos = 0
+        return items
+
+    # Each state consumes input and returns True, or returns False when it needs more data
+
+    def _parse_start(self, items: list) -> bool:
+        if self.key is None:
+            return self._expect(b"[", self._parse_first_item)
+        return self._expect(b"{", self._parse_key)
+
+    def _parse_key(self, items: list) -> bool:
+        char = self._peek()
+        if char is None:
+            return False
+        if char == b"}":
+            # The key isn't in the document: there are no elements
+            self.done = True
+            return True
+        if char == b",":
+            self._pos += 1
+            return True
+        key, end = self._decode_value()
+        if end is None:
+            return False
+        if not isinstance(key, str):
+            raise self._error("Expecting property name", self._pos)
+        self._pos = end
+        next_state = self._parse_array if key == self.key else self._skip_value
+        self._state = lambda items: self._expect(b":", next_state)
+        return True
+
+    def _parse_array(self, items: list) -> bool:
+        return self._expect(b"[", self._parse_first_item)
+
+    def _skip_value(self, items: list) -> bool:
+        if self._peek() is None:
+            return False
+        end = self._scan_value()
+        if end is None:
+            return False
+        self._pos = end
+        self._state = self._parse_key
+        return True
+
+    def _parse_first_item(self, items: list) -> bool:
+        char = self._peek()
+        if char is None:
+            return False
+        if char == b"]":
+            self._pos += 1
+            self.done = True
+            return True
+        self._state = self._parse_item
+        return True
+
+    def _parse_item(self, items: list) -> bool:
+        item, end = self._decode_value()
+        if end is None:
+            return False
+        items.append(item)
+        self._pos = end
+        self._state = self._parse_separator
+        return True
+
+    def _parse_separator(self, items: list) -> bool:
+        char = self._peek()
+        if char is None:
+            return False
+        if char not in (b",", b"]"):
+            raise self._error("Expecting ',' delimiter", self._pos)
+        self._pos += 1
+        self._state = self._parse_item
+        self.done = char == b"]"
+        return True
+
+    def _peek(self) -> Optional[bytes]:
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos < len(self._buffer):
+            return self._buffer[self._pos:self._pos + 1]
+        if self._final:
+            raise self._error("Unexpected end of JSON document", self._pos)
+        return None
+
+    def _expect(self, char: bytes, next_state) -> bool:
+        found = self._peek()
+        if found is None:
+            return False
+        if found != char:
+            raise self._error(f"Expecting '{char.decode()}'", self._pos)
+        self._pos += 1
+        self._state = next_state
+        return True
+
+    def _decode_value(self) -> tuple[Any, Optional[int]]:
+        """Decode the value at the current position, returning end None if it's incomplete."""
+        if self._peek() is None:
+            return None, None
+        end = self._scan_value()
+        if end is None:
+            return None, None
+        try:
+            return self._loads(bytes(self._buffer[self._pos:end])), end
+        except ValueError as err:
+            # The backends' errors (orjson's and msgspec's are ValueErrors) as json's
+            raise self._error(str(err), self._pos) from err
+
+    def _scan_value(self) -> Optional[int]:
+        """
+        Find the end of the value at the current position, resuming the scan where the
+        previous call stopped, or return None if it hasn't arrived yet.
+        """
+        buffer = self._buffer
+        if self._scan is None:
+            first = buffer[self._pos:self._pos + 1]
+            self._in_string = first == b'"'
+            self._depth = 1 if first in (b"[", b"{") else 0
+            self._scan = self._pos + 1
+            if not self._in_string and self._depth == 0:
+                # Numbers, true, false and null end at the next delimiter, which a number
+                # cut short, like '12' of '123', doesn't have yet
+                self._scan = self._pos
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, self._scan)
+                if match is None or match.end() == len(buffer) and match.group() == b"\\":
+                    # Resume at the escape, so the escaped character is skipped with it
+                    self._scan = len(buffer) if match is None else match.start()
+                    return self._incomplete()
+                if match.group() == b"\\":
+                    self._scan = match.end() + 1
+                    continue
+                self._scan = match.end()
+                self._in_string = False
+                if self._depth == 0:
+                    return self._complete()
+            elif self._depth == 0:
+                match = _SCALAR_END.search(buffer, self._scan)
+                if match is None:
+                    self._scan = len(buffer)
+                    return self._complete() if self._final else None
+                self._scan = match.start()
+                return self._complete()
+            else:
+                match = _STRUCTURAL.search(buffer, self._scan)
+                if match is None:
+                    self._scan = len(buffer)
+                    return self._incomplete()
+                self._scan = match.end()
+                char = match.group()
+                if char == b'"':
+                    self._in_string = True
+                elif char in (b"[", b"{"):
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return self._complete()
+
+    def _complete(self) -> int:
+        end, self._scan = self._scan, None
+        return end
+
+    def _incomplete(self) -> None:
+        if self._final:
+            raise self._error("Unexpected end of JSON document", len(self._buffer))
+        return None
+
+    def _error(self, message: str, pos: int) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer.decode("utf-8", "replace"), pos)
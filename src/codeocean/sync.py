@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from time import monotonic
+from typing import Callable, Iterable, Optional
+import os
+import posixpath
+import requests
+
+from codeocean.download import DEFAULT_CHUNK_SIZE, DEFAULT_TIMEOUT, download_file
+from codeocean.models.folder import FolderItem
+
+
+@dataclass(frozen=True)
+class SyncReport:
+    """Summary of a folder sync to local disk."""
+
+    files_downloaded: int
+    files_skipped: int
+    bytes_downloaded: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Average download throughput in bytes per second."""
+        return self.bytes_downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def sync_folder(
+    items: Iterable[FolderItem],
+    get_url: Callable[[str], str],
+    local_dir: str,
+    path: str = "",
+    max_workers: int = 8,
+    chunk_workers: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    timeout: Optional[float | tuple[float, float]] = DEFAULT_TIMEOUT,
+) -> SyncReport:
+    """
+    Download the files of a remote folder tree that are missing locally or whose local
+    size differs from the remote size.
+
+    Args:
+        items: Items of the remote tree, e.g. from walk_folder
+        get_url: Function generating a signed download URL for a remote file path
+        local_dir: Local directory mirroring the remote folder at path
+        path: Remote folder the items were listed from; its prefix is stripped from
+            item paths to get local paths
+        max_workers: Maximum number of files downloaded concurrently
+        chunk_workers: Maximum number of concurrent Range requests per file
+        chunk_size: Size of each Range request in bytes
+        timeout: Seconds to wait for the object store to accept a connection and
+            between bytes of its responses, or a (connect, read) tuple
+
+    Returns:
+        Counts of downloaded and skipped files, bytes downloaded and elapsed time
+    """
+    if max_workers < 1:
+        raise ValueError(f"Max workers {max_workers} should be greater than or equal to 1")
+
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_maxsize=max_workers * chunk_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        def download(item: FolderItem, destination: str) -> int:
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            download_file(
+                lambda: get_url(item.path),
+                destination,
+                max_workers=chunk_workers,
+                chunk_size=chunk_size,
+                session=session,
+                timeout=timeout,
+            )
+            return os.path.getsize(destination)
+
+        t0 = monotonic()
+        skipped = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for item in items:
+                destination = _local_path(local_dir, path, item.path)
+                if item.type == "folder":
+                    os.makedirs(destination, exist_ok=True)
+                elif (
+                    item.size is not None
+                    and os.path.isfile(destination)
+                    and os.path.getsize(destination) == item.size
+                ):
+                    skipped += 1
+                else:
+                    futures.append(executor.submit(download, item, destination))
+            downloaded = [f.result() for f in futures]
+
+    return SyncReport(
+        files_downloaded=len(downloaded),
+        files_skipped=skipped,
+        bytes_downloaded=sum(downloaded),
+        elapsed=monotonic() - t0,
+    )
+
+
+def _local_path(local_dir: str, path: str, item_path: str) -> str:
+    relative = posixpath.relpath(item_path, path) if path else item_path
+    local = os.path.normpath(os.path.join(local_dir, *relative.split("/")))
+    root = os.path.normpath(local_dir)
+    if os.path.commonpath([root, local]) != root:
+        raise ValueError(f"Item path {item_path} is outside of {path or 'the root folder'}")
+    return local
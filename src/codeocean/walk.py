@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from fnmatch import fnmatchcase
+from typing import Callable, Iterator, Optional
+
+from codeocean.models.folder import Folder, FolderItem
+
+
+def walk_folder(
+    list_folder: Callable[[str], Folder],
+    path: str = "",
+    max_workers: int = 8,
+    max_depth: Optional[int] = None,
+    pattern: Optional[str] = None,
+) -> Iterator[FolderItem]:
+    """
+    Recursively list a folder tree, expanding subfolders concurrently.
+
+    Items are yielded as their folder listings arrive, so the order is not deterministic.
+
+    Args:
+        list_folder: Function listing the items of the folder at the given path
+        path: Folder to start from; empty string for the root folder
+        max_workers: Maximum number of concurrent folder listings
+        max_depth: Number of subfolder levels below path to expand, or None for no limit.
+            0 lists only the items directly in path
+        pattern: Optional glob pattern (fnmatch syntax, where '*' also matches '/')
+            items' paths must match to be yielded. Subfolders are expanded regardless
+
+    Raises:
+        ValueError: If max_workers < 1 or max_depth < 0
+    """
+    if max_workers < 1:
+        raise ValueError(f"Max workers {max_workers} should be greater than or equal to 1")
+    if max_depth is not None and max_depth < 0:
+        raise ValueError(f"Max depth {max_depth} should be greater than or equal to 0, or None")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Listings run in copies of the caller's context, to inherit its deadline
+        pending: dict[Future, int] = {executor.submit(copy_context().run, list_folder, path): 0}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth = pending.pop(future)
+                    for item in future.result().items:
+                        if item.type == "folder" and (max_depth is None or depth < max_depth):
+                            pending[executor.submit(copy_context().run, list_folder, item.path)] = depth + 1
+                        if pattern is None or fnmatchcase(item.path, pattern):
+                            yield item
+        finally:
+            for future in pending:
+                future.cancel()
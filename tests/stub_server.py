@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import parse_qs, quote, unquote, urlparse
+import json
+import re
+import threading
+
+
+@dataclass
+class StubRequest:
+    """A request received by the stub server."""
+
+    method: str
+    path: str
+    headers: dict
+    body: bytes
+    client_address: tuple
+
+
+@dataclass
+class StubResponse:
+    """A response returned by a stub server handler."""
+
+    status: int = 200
+    body: object = None
+    headers: dict = field(default_factory=dict)
+
+
+class StubServer:
+    """
+    Local threaded HTTP/1.1 server for tests.
+
+    Every request is passed to `handler`, which returns a StubResponse. Dict and list
+    bodies are sent as JSON. Use as a context manager; `url` is the server's base URL.
+    """
+
+    def __init__(self, handler: Callable[[StubRequest], StubResponse]):
+        self.handler = handler
+        self.requests: list[StubRequest] = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                request = StubRequest(
+                    method=self.command,
+                    path=self.path,
+                    headers=dict(self.headers),
+                    body=self.rfile.read(length) if length else b"",
+                    client_address=self.client_address,
+                )
+                with stub._lock:
+                    stub.requests.append(request)
+                response = stub.handler(request)
+                body = response.body
+                if isinstance(body, (dict, list)):
+                    body = json.dumps(body).encode()
+                elif isinstance(body, str):
+                    body = body.encode()
+                elif body is None:
+                    body = b""
+                self.send_response(response.status)
+                headers = {"Content-Type": "application/json", **response.headers}
+                for key, value in headers.items():
+                    self.send_header(key, str(value))
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> StubServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FileTreeHandler:
+    """
+    Stub server handler serving folder listings and signed URLs of computation results
+    and data asset files, and the files themselves with Range support.
+    """
+
+    def __init__(self, files):
+        self.files = files
+        self.downloaded = []
+        self.ranges = []
+        self.server = None
+
+    def _listing(self, path):
+        prefix = f"{path}/" if path else ""
+        items = {}
+        for file_path, content in self.files.items():
+            if not file_path.startswith(prefix):
+                continue
+            name = file_path[len(prefix):].split("/")[0]
+            if "/" in file_path[len(prefix):]:
+                items[name] = {"name": name, "path": prefix + name, "type": "folder"}
+            else:
+                items[name] = {"name": name, "path": file_path, "type": "file", "size": len(content)}
+        return {"items": list(items.values())}
+
+    def __call__(self, request):
+        url = urlparse(request.path)
+        if re.search(r"/(results|files)$", url.path):
+            return StubResponse(body=self._listing(json.loads(request.body)["path"]))
+        if url.path.endswith("/urls"):
+            file_url = f"{self.server.url}/blob/{quote(parse_qs(url.query)['path'][0])}"
+            return StubResponse(body={"download_url": file_url, "view_url": file_url})
+
+        path = unquote(url.path[len("/blob/"):])
+        content = self.files[path]
+        start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", request.headers["Range"]).groups())
+        self.ranges.append((path, start, end))
+        if (start, end) != (0, 0):
+            self.downloaded.append(path)
+        return StubResponse(
+            status=206,
+            body=content[start:end + 1],
+            headers={"Content-Range": f"bytes {start}-{min(end, len(content) - 1)}/{len(content)}"},
+        )
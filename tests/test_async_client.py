@@ -0,0 +1,118 @@
+import json
+import unittest
+from unittest.mock import patch
+import httpx
+
+from codeocean.aio import AsyncCodeOcean
+from codeocean.aio.capsule import AsyncCapsules
+from codeocean.aio.data_asset import AsyncDataAssets
+from codeocean.aio.pipeline import AsyncPipelines
+from codeocean.client import CodeOcean
+from codeocean.error import Error
+from codeocean.models.capsule import CapsuleSearchParams, GitSyncResults
+from codeocean.models.data_asset import DataAssetSearchParams
+
+
+def _data_asset(id):
+    return {
+        "id": id,
+        "created": 0,
+        "name": id,
+        "mount": id,
+        "last_used": 0,
+        "owner": "owner",
+        "state": "ready",
+        "type": "dataset",
+    }
+
+
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the AsyncCodeOcean client class."""
+
+    def _session(self, handler):
+        """Build an async session that routes requests to the given handler."""
+        return httpx.AsyncClient(
+            base_url="https://codeocean.acme.com/api/v1/",
+            transport=httpx.MockTransport(handler),
+        )
+
+    async def test_basic_init(self):
+        """Test a basic async client initialization."""
+        async with AsyncCodeOcean(domain="https://codeocean.acme.com", token="token", agent_id="agent") as client:
+            self.assertEqual(client.session.base_url, "https://codeocean.acme.com/api/v1/")
+            headers = client.session.headers
+            self.assertEqual(headers["Content-Type"], "application/json")
+            self.assertEqual(headers["Min-Server-Version"], CodeOcean.MIN_SERVER_VERSION)
+            self.assertEqual(headers["Agent-Id"], "agent")
+            self.assertIs(client.capsules.client, client.session)
+            self.assertIs(client.data_assets.client, client.session)
+
+    async def test_error_handler_raises_error(self):
+        """HTTP errors are raised as codeocean.Error with the parsed body."""
+        def handler(request):
+            return httpx.Response(404, json={"message": "Not found"})
+
+        with patch("codeocean.aio.client.httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncCodeOcean(domain="https://codeocean.acme.com", token="token")
+
+        with self.assertRaises(Error) as ctx:
+            await client.capsules.get_capsule("missing")
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(ctx.exception.message, "Not found")
+        await client.aclose()
+
+    async def test_sync_pipeline(self):
+        """sync_pipeline posts to the pipeline sync route and parses the results."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"pushed": 1, "pulled": 2, "new_branch": True})
+
+        async with self._session(handler) as session:
+            result = await AsyncPipelines(client=session).sync_pipeline("pipe-456")
+
+        self.assertEqual(requests[0].method, "POST")
+        self.assertEqual(requests[0].url.path, "/api/v1/pipelines/pipe-456/sync")
+        self.assertEqual(result, GitSyncResults(pushed=1, pulled=2, new_branch=True))
+
+    async def test_detach_data_assets_sends_body(self):
+        """detach_data_assets sends the data asset IDs as a DELETE body."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(204)
+
+        async with self._session(handler) as session:
+            await AsyncCapsules(client=session).detach_data_assets("cap-123", ["da-1", "da-2"])
+
+        self.assertEqual(requests[0].method, "DELETE")
+        self.assertEqual(json.loads(requests[0].content), ["da-1", "da-2"])
+
+    async def test_search_data_assets_iterator_paginates(self):
+        """The async iterator follows next_token until has_more is false."""
+        pages = {
+            None: {"has_more": True, "next_token": "t1", "results": [_data_asset("a"), _data_asset("b")]},
+            "t1": {"has_more": False, "results": [_data_asset("c")]},
+        }
+
+        def handler(request):
+            return httpx.Response(200, json=pages[json.loads(request.content).get("next_token")])
+
+        async with self._session(handler) as session:
+            data_assets = AsyncDataAssets(client=session)
+            ids = [da.id async for da in data_assets.search_data_assets_iterator(DataAssetSearchParams(limit=2))]
+
+        self.assertEqual(ids, ["a", "b", "c"])
+
+    async def test_search_capsules_iterator_single_page(self):
+        """The async capsule iterator stops after a page without more results."""
+        def handler(request):
+            return httpx.Response(200, json={"has_more": False, "results": []})
+
+        async with self._session(handler) as session:
+            capsules = AsyncCapsules(client=session)
+            results = [c async for c in capsules.search_capsules_iterator(CapsuleSearchParams())]
+
+        self.assertEqual(results, [])
@@ -0,0 +1,350 @@
+import unittest
+
+from codeocean.aio.client import AsyncCodeOcean
+from codeocean.cache import ResponseCache, validators
+from codeocean.client import CodeOcean
+from codeocean.error import Error
+from codeocean.models.capsule import CapsuleSearchParams
+from codeocean.models.components import Permissions
+from codeocean.models.data_asset import DataAsset
+from codeocean.models.decoder import decode_response
+from tests.stub_server import StubResponse, StubServer
+
+CAPSULE = {
+    "id": "cap-1",
+    "created": 1,
+    "name": "Capsule",
+    "status": "release",
+    "owner": "user-1",
+    "slug": "1",
+}
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _handler(request):
+    if "missing" in request.path:
+        return StubResponse(status=404, body={"message": "not found"})
+    if request.path.endswith("/app_panel") or request.path.endswith("/app_panel?version=2"):
+        return StubResponse(body={"general": {"title": request.path}})
+    if request.path.endswith("/permissions"):
+        return StubResponse(body={"everyone": "viewer"} if request.method == "GET" else None)
+    if request.path.endswith("/custom_metadata"):
+        return StubResponse(body={})
+    if request.method in ("GET", "PATCH"):
+        return StubResponse(body=CAPSULE)
+    return StubResponse(body={"has_more": False, "results": []})
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the TTL/LRU response cache."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache({"capsules/*": 10, "capsules/*/app_panel": 60}, maxsize=2, clock=self.clock)
+
+    def test_key(self):
+        self.assertEqual(self.cache.key("GET", "capsules/cap-1"), ("capsules/cap-1", ""))
+        self.assertEqual(
+            self.cache.key("get", "capsules/cap-1/app_panel", {"version": 2, "other": None}),
+            ("capsules/cap-1/app_panel", "version=2"),
+        )
+        # '*' matches a single path segment
+        self.assertIsNone(self.cache.key("GET", "capsules/cap-1/computations"))
+        self.assertIsNone(self.cache.key("POST", "capsules/cap-1"))
+        self.assertIsNone(self.cache.key("GET", "https://example.com/capsules/cap-1"))
+
+    def test_ttl(self):
+        key = self.cache.key("GET", "capsules/cap-1")
+        self.cache.put(key, "response")
+
+        self.clock.now = 9.9
+        self.assertEqual(self.cache.get(key), "response")
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual((self.cache.stats.hits, self.cache.stats.misses, self.cache.stats.size), (1, 1, 0))
+
+    def test_lru_eviction(self):
+        keys = [self.cache.key("GET", f"capsules/cap-{i}") for i in range(3)]
+        self.cache.put(keys[0], 0)
+        self.cache.put(keys[1], 1)
+        self.cache.get(keys[0])
+        self.cache.put(keys[2], 2)
+
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(self.cache.get(keys[0]), 0)
+        self.assertEqual(self.cache.stats.evictions, 1)
+
+    def test_invalidate(self):
+        capsule = self.cache.key("GET", "capsules/cap-1")
+        app_panel = self.cache.key("GET", "capsules/cap-1/app_panel")
+
+        for method, url in [("POST", "capsules/search"), ("GET", "capsules/cap-1"), ("POST", "capsules"),
+                            ("PATCH", "capsules/cap-2/archive")]:
+            self.cache.put(capsule, "capsule")
+            self.cache.put(app_panel, "app panel")
+            self.cache.invalidate(method, url)
+            self.assertEqual(len(self.cache), 2, (method, url))
+
+        self.cache.invalidate("POST", "capsules/cap-1/permissions")
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats.invalidations, 2)
+
+    def test_hit_rate(self):
+        self.assertEqual(self.cache.stats.hit_rate, 0.0)
+        key = self.cache.key("GET", "capsules/cap-1")
+        self.cache.get(key)
+        self.cache.put(key, "response")
+        self.cache.get(key)
+
+        self.assertEqual(self.cache.stats.hit_rate, 0.5)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ResponseCache(maxsize=0)
+
+
+class TestClientCache(unittest.TestCase):
+    """Test cases for caching responses in the client."""
+
+    def setUp(self):
+        self.server = StubServer(_handler)
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.client = CodeOcean(domain=self.server.url, token="token", cache=True)
+
+    def _requests(self, method="GET"):
+        return [r.path for r in self.server.requests if r.method == method]
+
+    def test_disabled_by_default(self):
+        client = CodeOcean(domain=self.server.url, token="token")
+        client.capsules.get_capsule("cap-1")
+        client.capsules.get_capsule("cap-1")
+
+        self.assertIsNone(client.session.cache)
+        self.assertEqual(len(self._requests()), 2)
+
+    def test_cached_reads(self):
+        for _ in range(3):
+            self.assertEqual(self.client.capsules.get_capsule("cap-1").id, "cap-1")
+            self.client.capsules.get_capsule_app_panel("cap-1")
+            self.client.capsules.get_capsule_app_panel("cap-1", version=2)
+            self.client.capsules.get_permissions("cap-1")
+            self.client.custom_metadata.get_custom_metadata()
+
+        self.assertEqual(len(self._requests()), 5)
+        self.assertEqual(self.client.session.cache.stats.hits, 10)
+        self.assertEqual(self.client.session.cache.stats.misses, 5)
+
+    def test_mutation_invalidates(self):
+        self.client.capsules.get_capsule("cap-1")
+        self.client.capsules.get_permissions("cap-1")
+        self.client.capsules.search_capsules(CapsuleSearchParams())
+        self.client.capsules.get_capsule("cap-1")
+        self.client.capsules.update_permissions("cap-1", Permissions(everyone="viewer"))
+        self.client.capsules.get_capsule("cap-1")
+        self.client.capsules.get_permissions("cap-1")
+
+        self.assertEqual(len(self._requests()), 4)
+
+    def test_errors_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(Error):
+                self.client.capsules.get_capsule("missing")
+
+        self.assertEqual(len(self._requests()), 2)
+
+    def test_uncached_endpoints(self):
+        self.client.data_assets.get_data_asset("da-1", raw=True)
+        self.client.data_assets.get_data_asset("da-1", raw=True)
+
+        self.assertEqual(len(self._requests()), 2)
+
+
+class TestAsyncClientCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for caching responses in the asynchronous client."""
+
+    async def test_cached_reads(self):
+        with StubServer(_handler) as server:
+            cache = ResponseCache()
+            async with AsyncCodeOcean(domain=server.url, token="token", cache=cache) as client:
+                await client.capsules.get_capsule("cap-1")
+                await client.capsules.get_capsule("cap-1")
+                await client.capsules.archive_capsule("cap-1", True)
+                capsule = await client.capsules.get_capsule("cap-1")
+
+        self.assertEqual(capsule.id, "cap-1")
+        self.assertEqual([r.method for r in server.requests], ["GET", "PATCH", "GET"])
+        self.assertEqual((cache.stats.hits, cache.stats.invalidations), (1, 1))
+
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1,
+    "name": "Data",
+    "mount": "data",
+    "state": "ready",
+    "type": "dataset",
+    "last_used": 0,
+    "owner": "user-1",
+}
+
+ETAG = {"If-None-Match": '"v1"'}
+
+
+class FakeResponse:
+
+    def __init__(self, body=None, **headers):
+        self.body = body
+        self.headers = headers
+
+    def json(self):
+        return dict(self.body)
+
+
+class ETagHandler:
+    """Serves versioned data assets with ETags, answering matching conditional requests with 304."""
+
+    def __init__(self):
+        self.version = 1
+
+    def __call__(self, request):
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return StubResponse(status=304, headers={"ETag": etag})
+        return StubResponse(body={**DATA_ASSET, "name": f"Data v{self.version}"}, headers={"ETag": etag})
+
+
+class TestRevalidation(unittest.TestCase):
+    """Test cases for keeping and revalidating responses with validators."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache({"data_assets/*": 10, "computations/*": 0}, maxsize=2, clock=self.clock)
+        self.key = self.cache.key("GET", "data_assets/da-1")
+
+    def test_validators(self):
+        self.assertIsNone(validators(FakeResponse()))
+        self.assertEqual(
+            validators(FakeResponse(ETag='"v1"', **{"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})),
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+    def test_expired_responses_kept(self):
+        response = FakeResponse(DATA_ASSET)
+        self.cache.put_validated(self.key, response, ETAG)
+        self.clock.now = 10
+
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertEqual(self.cache.revalidation_headers(self.key), ETAG)
+        self.assertIs(self.cache.revalidated(self.key), response)
+        self.assertIs(self.cache.get(self.key), response)
+        self.assertEqual(self.cache.stats.revalidations, 1)
+
+    def test_revalidated_models_reused(self):
+        response = FakeResponse(DATA_ASSET)
+        self.cache.put_validated(self.key, response, ETAG)
+        self.assertIsNot(decode_response(DataAsset, response), decode_response(DataAsset, response))
+
+        self.cache.revalidated(self.key)
+
+        self.assertIs(decode_response(DataAsset, response), decode_response(DataAsset, response))
+        self.assertIsNot(decode_response(DataAsset, response, lazy=True), decode_response(DataAsset, response))
+        # Raw bodies are still parsed anew for each caller
+        self.assertIsNot(response.json(), response.json())
+
+    def test_zero_ttl(self):
+        key = self.cache.key("GET", "computations/c-1")
+        self.cache.put(key, FakeResponse())
+        self.assertEqual(len(self.cache), 0)
+
+        self.cache.put_validated(key, FakeResponse(), ETAG)
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(self.cache.revalidation_headers(key), ETAG)
+
+    def test_dropped(self):
+        self.cache.put_validated(self.key, FakeResponse(DATA_ASSET), ETAG)
+        self.cache.invalidate("DELETE", "data_assets/da-1")
+
+        self.assertIsNone(self.cache.revalidation_headers(self.key))
+        self.assertIsNone(self.cache.revalidated(self.key))
+
+
+class TestConditionalRequests(unittest.TestCase):
+    """Test cases for revalidating cached responses with ETags."""
+
+    def setUp(self):
+        self.handler = ETagHandler()
+        self.server = StubServer(self.handler)
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.cache = ResponseCache({"data_assets/*": 0})
+        self.client = CodeOcean(domain=self.server.url, token="token", cache=self.cache)
+
+    def test_not_modified(self):
+        first = self.client.data_assets.get_data_asset("da-1")
+        second = self.client.data_assets.get_data_asset("da-1")
+        third = self.client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(second, first)
+        # The model decoded after the first revalidation is reused
+        self.assertIs(third, second)
+        self.assertNotIn("If-None-Match", self.server.requests[0].headers)
+        self.assertEqual(self.server.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(self.cache.stats.revalidations, 2)
+
+    def test_not_modified_raw_bodies_not_shared(self):
+        self.client.data_assets.get_data_asset("da-1")
+        self.client.data_assets.get_data_asset("da-1")
+        first = self.client.data_assets.get_data_asset("da-1", raw=True)
+        first["name"] = "Changed"
+
+        second = self.client.data_assets.get_data_asset("da-1", raw=True)
+
+        self.assertEqual(second["name"], "Data v1")
+        self.assertEqual(self.client.data_assets.get_data_asset("da-1").name, "Data v1")
+
+    def test_modified(self):
+        self.client.data_assets.get_data_asset("da-1")
+        self.handler.version = 2
+
+        data_asset = self.client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(data_asset.name, "Data v2")
+        self.assertEqual(self.cache.stats.revalidations, 0)
+        self.assertEqual(self.client.data_assets.get_data_asset("da-1"), data_asset)
+        self.assertEqual(self.server.requests[2].headers["If-None-Match"], '"v2"')
+
+    def test_default_ttls_not_revalidated(self):
+        client = CodeOcean(domain=self.server.url, token="token", cache=True)
+        client.data_assets.get_data_asset("da-1")
+        client.data_assets.get_data_asset("da-1")
+
+        self.assertNotIn("If-None-Match", self.server.requests[1].headers)
+
+
+class TestAsyncConditionalRequests(unittest.IsolatedAsyncioTestCase):
+    """Test cases for revalidating cached responses with ETags in the asynchronous client."""
+
+    async def test_not_modified(self):
+        cache = ResponseCache({"data_assets/*": 0})
+        with StubServer(ETagHandler()) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token", cache=cache) as client:
+                first = await client.data_assets.get_data_asset("da-1")
+                second = await client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(second, first)
+        self.assertEqual(server.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(cache.stats.revalidations, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
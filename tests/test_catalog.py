@@ -0,0 +1,184 @@
+import os
+import tempfile
+import unittest
+from threading import Thread
+from unittest.mock import patch
+
+from codeocean.catalog import CAPSULES, DATA_ASSETS, PIPELINES, Catalog
+from codeocean.client import CodeOcean
+from codeocean.models.capsule import Capsule, CapsuleStatus
+from codeocean.models.components import SortOrder
+from codeocean.models.data_asset import DataAsset, DataAssetSortBy, DataAssetState
+
+TB = 2**40
+
+
+def _data_asset(i, **kwargs):
+    return {
+        "id": f"da-{i}",
+        "created": 100 + i,
+        "name": f"Data {i}",
+        "mount": "data",
+        "state": "ready",
+        "type": "dataset",
+        "last_used": 0,
+        "owner": f"user-{i % 2}",
+        "size": i * TB,
+        "tags": ["genomics"] if i % 3 == 0 else ["imaging"],
+        **kwargs,
+    }
+
+
+def _capsule(i, **kwargs):
+    return {
+        "id": f"cap-{i}",
+        "created": 100 + i,
+        "name": f"Capsule {i}",
+        "status": "release" if i % 2 else "non_release",
+        "owner": "user-1",
+        "slug": f"{i}",
+        "tags": ["rna"],
+        **kwargs,
+    }
+
+
+class FakeCatalog:
+    """Serves search results newest first, counting the results read."""
+
+    def __init__(self, items):
+        self.items = items
+        self.read = 0
+        self.params = None
+
+    def search(self, search_params, prefetch=0, raw=False, lazy=False):
+        self.params = search_params
+        for item in sorted(self.items, key=lambda item: item["created"], reverse=True):
+            self.read += 1
+            yield item
+
+
+class TestCatalog(unittest.TestCase):
+    """Test cases for the local SQLite metadata mirror."""
+
+    def setUp(self):
+        self.client = CodeOcean(domain="https://example.com", token="token", json_backend="json")
+        self.data_assets = FakeCatalog([_data_asset(i) for i in range(6)])
+        self.capsules = FakeCatalog([_capsule(i) for i in range(3)])
+        self.pipelines = FakeCatalog([_capsule(10, tags=None)])
+        for target, name, fake in [
+            (self.client.data_assets, "search_data_assets_iterator", self.data_assets),
+            (self.client.capsules, "search_capsules_iterator", self.capsules),
+            (self.client.pipelines, "search_pipelines_iterator", self.pipelines),
+        ]:
+            patcher = patch.object(target, name, side_effect=fake.search)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.catalog = Catalog(self.client)
+        self.addCleanup(self.catalog.close)
+
+    def test_refresh(self):
+        reports = self.catalog.refresh()
+
+        self.assertEqual([(r.kind, r.upserted, r.watermark) for r in reports], [
+            (CAPSULES, 3, 102), (PIPELINES, 1, 110), (DATA_ASSETS, 6, 105),
+        ])
+        self.assertEqual(self.data_assets.params.sort_field, DataAssetSortBy.Created)
+        self.assertEqual(self.data_assets.params.sort_order, SortOrder.Descending)
+        self.assertEqual(self.catalog.get_data_asset("da-2"), DataAsset.from_dict(_data_asset(2)))
+        self.assertEqual(self.catalog.get_pipeline("cap-10").id, "cap-10")
+        self.assertIsNone(self.catalog.get_capsule("cap-10"))
+
+    def test_incremental_refresh(self):
+        self.catalog.refresh([DATA_ASSETS])
+        self.data_assets.items += [_data_asset(6), _data_asset(7)]
+        self.data_assets.read = 0
+
+        report, = self.catalog.refresh([DATA_ASSETS])
+
+        # The two new data assets, the one at the watermark and the first older one
+        self.assertEqual(self.data_assets.read, 4)
+        self.assertEqual((report.upserted, report.deleted, report.watermark), (3, 0, 107))
+        self.assertEqual(len(self.catalog.query_data_assets()), 8)
+
+    def test_full_refresh(self):
+        self.catalog.refresh([DATA_ASSETS])
+        self.data_assets.items = [_data_asset(i, state="failed") for i in range(1, 6)]
+
+        report, = self.catalog.refresh([DATA_ASSETS], full=True)
+
+        self.assertEqual((report.upserted, report.deleted), (5, 1))
+        self.assertIsNone(self.catalog.get_data_asset("da-0"))
+        self.assertEqual(self.catalog.get_data_asset("da-1").state, DataAssetState.Failed)
+        self.assertEqual(self.catalog.query_data_assets(tags=["genomics"], raw=True)[0]["id"], "da-3")
+
+    def test_queries_during_refresh(self):
+        counts = []
+
+        def search(search_params, prefetch=0, raw=False, lazy=False):
+            for i, item in enumerate(self.data_assets.search(search_params)):
+                if i == 4:
+                    # Two pages are written: query them from another thread mid-crawl
+                    thread = Thread(target=lambda: counts.append(
+                        (len(self.catalog.query_data_assets()), self.catalog.watermark(DATA_ASSETS))
+                    ))
+                    thread.start()
+                    thread.join(5)
+                yield item
+
+        self.client.data_assets.search_data_assets_iterator.side_effect = search
+        with patch("codeocean.catalog.PAGE_SIZE", 2):
+            report, = self.catalog.refresh([DATA_ASSETS])
+
+        # The watermark is only written after the last page
+        self.assertEqual(counts, [(4, None)])
+        self.assertEqual((report.upserted, report.watermark), (6, 105))
+        self.assertEqual(len(self.catalog.query_data_assets()), 6)
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            self.catalog.refresh(["computations"])
+
+    def test_query_data_assets(self):
+        self.catalog.refresh()
+
+        results = self.catalog.query_data_assets(tags=["genomics"], min_size=1 * TB)
+
+        self.assertEqual([da.id for da in results], ["da-3"])
+        self.assertIsInstance(results[0], DataAsset)
+        self.assertEqual(
+            [da.id for da in self.catalog.query_data_assets(owner="user-1", order_by="size", descending=False)],
+            ["da-1", "da-3", "da-5"],
+        )
+        self.assertEqual([da.id for da in self.catalog.query_data_assets(max_size=1 * TB)], ["da-1", "da-0"])
+        self.assertEqual(len(self.catalog.query_data_assets(state=DataAssetState.Ready, limit=2)), 2)
+        self.assertEqual(len(self.catalog.query_data_assets(created_after=102, created_before=104)), 2)
+        self.assertEqual(len(self.catalog.query_data_assets(tags=["genomics", "imaging"])), 0)
+        self.assertEqual([da.id for da in self.catalog.query_data_assets(name="DATA 4")], ["da-4"])
+        self.assertEqual(self.catalog.query_data_assets(name="%"), [])
+
+    def test_query_capsules(self):
+        self.catalog.refresh()
+
+        results = self.catalog.query_capsules(tags=["rna"], status=CapsuleStatus.Release)
+
+        self.assertEqual(results, [Capsule.from_dict(_capsule(1))])
+        self.assertEqual(len(self.catalog.query_pipelines(owner="user-1")), 1)
+
+    def test_invalid_order(self):
+        with self.assertRaises(ValueError):
+            self.catalog.query_data_assets(order_by="name; DROP TABLE data_assets")
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog.db")
+            with Catalog(self.client, path) as catalog:
+                catalog.refresh([DATA_ASSETS])
+
+            with Catalog(self.client, path) as catalog:
+                self.assertEqual(catalog.watermark(DATA_ASSETS), 105)
+                self.assertIsNone(catalog.watermark(CAPSULES))
+                self.assertEqual(len(catalog.query_data_assets()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import unittest
+
+from codeocean.aio.client import AsyncCodeOcean
+from codeocean.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from codeocean.client import CodeOcean
+from codeocean.error import Error
+from tests.stub_server import StubResponse, StubServer
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1,
+    "name": "Data",
+    "mount": "data",
+    "state": "ready",
+    "type": "dataset",
+    "last_used": 0,
+    "owner": "user-1",
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class StatusHandler:
+    """Answers requests with a status code that tests can change."""
+
+    def __init__(self, status=503):
+        self.status = status
+
+    def __call__(self, request):
+        if self.status >= 400:
+            return StubResponse(self.status, {"message": "unavailable"})
+        return StubResponse(200, DATA_ASSET)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the circuit breaker states."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_rate=0.5, window=4, min_requests=4, reset_timeout=10, clock=self.clock)
+
+    def _record(self, *outcomes):
+        for healthy in outcomes:
+            self.breaker.release(self.breaker.acquire(), healthy)
+
+    def test_opens_at_failure_rate(self):
+        self._record(True, False, True)
+        self.assertEqual(self.breaker.state, CircuitState.Closed)
+
+        self._record(False)
+
+        self.assertEqual(self.breaker.state, CircuitState.Open)
+        with self.assertRaises(CircuitOpenError) as cm:
+            self.breaker.acquire()
+        self.assertEqual(cm.exception.retry_after, 10)
+        stats = self.breaker.stats
+        self.assertEqual((stats.trips, stats.rejected), (1, 1))
+
+    def test_unknown_outcomes_ignored(self):
+        self._record(False, None, None, False, True)
+
+        self.assertEqual(self.breaker.state, CircuitState.Closed)
+
+    def test_half_open_probe_closes(self):
+        self._record(False, False, False, False)
+        self.clock.now = 10
+
+        self.assertEqual(self.breaker.state, CircuitState.HalfOpen)
+        self.assertTrue(self.breaker.acquire())
+        # Only one probe at a time
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.acquire()
+        self.breaker.release(True, True)
+
+        self.assertEqual(self.breaker.state, CircuitState.Closed)
+        self.assertFalse(self.breaker.acquire())
+
+    def test_half_open_probe_reopens(self):
+        self._record(False, False, False, False)
+        self.clock.now = 10
+
+        self.breaker.release(self.breaker.acquire(), False)
+
+        self.assertEqual(self.breaker.state, CircuitState.Open)
+        self.clock.now = 15
+        with self.assertRaises(CircuitOpenError) as cm:
+            self.breaker.acquire()
+        self.assertEqual(cm.exception.retry_after, 5)
+
+    def test_reset(self):
+        self._record(False, False, False, False)
+
+        self.breaker.reset()
+
+        self.assertEqual(self.breaker.state, CircuitState.Closed)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_rate=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(window=5, min_requests=10)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(half_open_probes=0)
+
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    """Test cases for the client's circuit breaker."""
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(CodeOcean(domain="https://example.com", token="token").session.circuit_breaker)
+
+    def test_fails_fast_while_server_unavailable(self):
+        handler = StatusHandler()
+        clock = FakeClock()
+        breaker = CircuitBreaker(window=4, min_requests=4, reset_timeout=30, clock=clock)
+        with StubServer(handler) as server:
+            client = CodeOcean(domain=server.url, token="token", circuit_breaker=breaker)
+            for _ in range(4):
+                with self.assertRaises(Error):
+                    client.data_assets.get_data_asset("da-1")
+
+            with self.assertRaises(CircuitOpenError):
+                client.data_assets.get_data_asset("da-1")
+            self.assertEqual(len(server.requests), 4)
+            self.assertEqual(client.session.circuit_breaker.state, CircuitState.Open)
+
+            handler.status = 200
+            clock.now = 30
+            self.assertEqual(client.data_assets.get_data_asset("da-1").id, "da-1")
+            self.assertEqual(client.session.circuit_breaker.state, CircuitState.Closed)
+
+    def test_client_errors_healthy(self):
+        with StubServer(StatusHandler(404)) as server:
+            client = CodeOcean(
+                domain=server.url, token="token", circuit_breaker=CircuitBreaker(window=4, min_requests=4),
+            )
+            for _ in range(5):
+                with self.assertRaises(Error):
+                    client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(len(server.requests), 5)
+        self.assertEqual(client.session.circuit_breaker.state, CircuitState.Closed)
+
+
+class TestAsyncClientCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the asynchronous client's circuit breaker."""
+
+    async def test_fails_fast_while_server_unavailable(self):
+        breaker = CircuitBreaker(window=2, min_requests=2)
+        with StubServer(StatusHandler()) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token", circuit_breaker=breaker) as client:
+                for _ in range(2):
+                    with self.assertRaises(Error):
+                        await client.data_assets.get_data_asset("da-1")
+                with self.assertRaises(CircuitOpenError):
+                    await client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(len(server.requests), 2)
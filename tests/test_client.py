@@ -54,8 +54,9 @@ class TestClient(unittest.TestCase):
 
         # Assert both configurations work
         self.assertEqual(mock_adapter.call_count, 2)
-        mock_adapter.assert_any_call(max_retries=5)
-        mock_adapter.assert_any_call(max_retries=retry_obj)
+        pool_kwargs = dict(pool_maxsize=10, pool_block=False, idle=60, interval=20, count=5)
+        mock_adapter.assert_any_call(max_retries=5, **pool_kwargs)
+        mock_adapter.assert_any_call(max_retries=retry_obj, **pool_kwargs)
 
     def test_agent_id_header_set_when_provided(self):
         """Test that Agent-Id header is set when agent_id is provided."""
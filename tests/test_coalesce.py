@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from codeocean.aio.client import AsyncCodeOcean
+from codeocean.client import CodeOcean
+from codeocean.coalesce import RequestCoalescer
+from codeocean.error import Error
+from codeocean.models.data_asset import DataAsset
+from tests.stub_server import StubResponse, StubServer
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1,
+    "name": "Data",
+    "mount": "data",
+    "state": "ready",
+    "type": "dataset",
+    "last_used": 0,
+    "owner": "user-1",
+}
+
+
+class BlockingHandler:
+    """Holds requests until released, so that concurrent calls overlap."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.release.wait(5)
+        if "missing" in request.path:
+            return StubResponse(404, {"message": "not found"})
+        return StubResponse(200, DATA_ASSET)
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestRequestCoalescer(unittest.TestCase):
+    """Test cases for the request coalescer."""
+
+    def setUp(self):
+        self.coalescer = RequestCoalescer()
+
+    def test_key(self):
+        key = self.coalescer.key
+
+        self.assertEqual(key("GET", "/data_assets/da-1"), key("get", "data_assets/da-1", {"version": None}))
+        self.assertNotEqual(key("GET", "capsules/cap-1/app_panel"), key("GET", "capsules/cap-1/app_panel", {"v": 2}))
+        self.assertNotEqual(key("GET", "data_assets/da-1"), key("GET", "data_assets/da-1", headers={"Range": "0-1"}))
+        self.assertIsNone(key("POST", "data_assets/search"))
+        self.assertIsNone(key("GET", "https://example.com/blob"))
+
+    def test_sequential_calls(self):
+        key = self.coalescer.key("GET", "data_assets/da-1")
+
+        self.assertEqual(self.coalescer.call(key, lambda: 1), 1)
+        self.assertEqual(self.coalescer.call(key, lambda: 2), 2)
+        self.assertEqual((self.coalescer.stats.requests, self.coalescer.stats.coalesced), (2, 0))
+        self.assertEqual(self.coalescer.stats.coalesced_rate, 0.0)
+
+
+class TestClientCoalescing(unittest.TestCase):
+    """Test cases for coalescing concurrent identical reads in the client."""
+
+    def setUp(self):
+        self.handler = BlockingHandler()
+        self.server = StubServer(self.handler)
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.addCleanup(self.handler.release.set)
+        self.client = CodeOcean(domain=self.server.url, token="token", coalesce=True)
+        self.coalescer = self.client.session.coalescer
+
+    def _concurrent(self, calls, fn, *args):
+        with ThreadPoolExecutor(max_workers=calls) as executor:
+            futures = [executor.submit(fn, *args) for _ in range(calls)]
+            _wait_for(lambda: self.coalescer.stats.coalesced == calls - 1)
+            self.handler.release.set()
+            return [f.exception() or f.result() for f in futures]
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(CodeOcean(domain=self.server.url, token="token").session.coalescer)
+
+    def test_concurrent_reads_share_request(self):
+        results = self._concurrent(8, self.client.data_assets.get_data_asset, "da-1")
+
+        self.assertEqual(results, [DataAsset.from_dict(DATA_ASSET)] * 8)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((self.coalescer.stats.requests, self.coalescer.stats.coalesced), (1, 7))
+        self.assertEqual(self.coalescer.stats.coalesced_rate, 7 / 8)
+
+    def test_errors_shared(self):
+        results = self._concurrent(4, self.client.data_assets.get_data_asset, "missing")
+
+        self.assertTrue(all(isinstance(r, Error) for r in results))
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_later_reads_not_coalesced(self):
+        self.handler.release.set()
+        self.client.data_assets.get_data_asset("da-1")
+        self.client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(len(self.server.requests), 2)
+
+
+class TestAsyncClientCoalescing(unittest.IsolatedAsyncioTestCase):
+    """Test cases for coalescing concurrent identical reads in the asynchronous client."""
+
+    async def test_concurrent_reads_share_request(self):
+        handler = BlockingHandler()
+        with StubServer(handler) as server:
+            coalescer = RequestCoalescer()
+            async with AsyncCodeOcean(domain=server.url, token="token", coalesce=coalescer) as client:
+                tasks = [asyncio.create_task(client.data_assets.get_data_asset("da-1")) for _ in range(5)]
+                while coalescer.stats.coalesced < 4:
+                    await asyncio.sleep(0.01)
+                # Cancelling the caller that sent the request doesn't cancel it for the others
+                tasks[0].cancel()
+                handler.release.set()
+                results = await asyncio.gather(*tasks[1:])
+
+        self.assertEqual(results, [DataAsset.from_dict(DATA_ASSET)] * 4)
+        self.assertEqual(len(server.requests), 1)
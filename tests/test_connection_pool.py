@@ -0,0 +1,76 @@
+import logging
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from codeocean.client import CodeOcean
+from tests.stub_server import StubServer, StubResponse
+
+
+def _computation(id):
+    return {
+        "id": id,
+        "created": 0,
+        "name": id,
+        "owner": "owner",
+        "run_time": 0,
+        "state": "completed",
+    }
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test cases for connection pool configuration and sharing a client across threads."""
+
+    def test_pool_configuration(self):
+        """Pool size, blocking and keep-alive settings are applied to the mounted adapter."""
+        client = CodeOcean(
+            domain="https://codeocean.acme.com",
+            token="token",
+            pool_maxsize=64,
+            pool_block=True,
+            keep_alive_idle=30,
+        )
+
+        adapter = client.session.get_adapter("https://codeocean.acme.com/api/v1/capsules")
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 64)
+        self.assertTrue(adapter.poolmanager.connection_pool_kw["block"])
+
+    def test_shared_client_across_threads(self):
+        """Many threads share one client without errors, mixed results, or discarded connections."""
+        threads = 64
+        calls_per_thread = 10
+        pool_maxsize = 8
+
+        def handler(request):
+            return StubResponse(body=_computation(request.path.rsplit("/", 1)[-1]))
+
+        records = []
+        log_handler = logging.Handler()
+        log_handler.emit = records.append
+        logger = logging.getLogger("urllib3.connectionpool")
+        logger.addHandler(log_handler)
+        self.addCleanup(logger.removeHandler, log_handler)
+
+        with StubServer(handler) as server:
+            client = CodeOcean(
+                domain=server.url,
+                token="token",
+                pool_maxsize=pool_maxsize,
+                pool_block=True,
+            )
+
+            def work(thread):
+                ids = [f"comp-{thread}-{i}" for i in range(calls_per_thread)]
+                return ids, [client.computations.get_computation(id).id for id in ids]
+
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                results = list(executor.map(work, range(threads)))
+
+        for expected, actual in results:
+            self.assertEqual(expected, actual)
+        self.assertEqual(len(server.requests), threads * calls_per_thread)
+
+        connections = {r.client_address for r in server.requests}
+        self.assertLessEqual(len(connections), pool_maxsize)
+        self.assertFalse([r for r in records if "pool is full" in r.getMessage()])
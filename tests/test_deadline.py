@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import httpx
+import requests
+
+from codeocean.aio.client import AsyncCodeOcean
+from codeocean.client import CodeOcean
+from codeocean.coalesce import RequestCoalescer
+from codeocean.deadline import DeadlineExceeded, capped_timeout, deadline, exceeded, remaining
+from codeocean.models.data_asset import DataAsset, DataAssetSearchParams
+from codeocean.rate_limit import RateLimiter
+from tests.stub_server import StubResponse, StubServer
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1,
+    "name": "Data",
+    "mount": "data",
+    "state": "draft",
+    "type": "dataset",
+    "last_used": 0,
+    "owner": "user-1",
+}
+
+
+class SlowHandler:
+    """
+    Answers requests whose path or body (next token, folder path) mentions 'slow' after
+    a delay, others at once. Search pages and folder listings lead to slow ones.
+    """
+
+    def __init__(self, delay=0.5):
+        self.delay = delay
+        self.released = threading.Event()
+
+    def __call__(self, request):
+        if "slow" in request.path or b"slow" in request.body:
+            self.released.wait(self.delay)
+        if request.path.endswith("/search"):
+            return StubResponse(200, {"has_more": True, "next_token": "slow", "results": [DATA_ASSET]})
+        if "/results" in request.path:
+            return StubResponse(200, {"items": [{"name": "slow", "path": "slow", "type": "folder"}]})
+        return StubResponse(200, DATA_ASSET)
+
+
+class TestDeadline(unittest.TestCase):
+    """Test cases for deadlines bounding client calls."""
+
+    def test_remaining(self):
+        self.assertIsNone(remaining())
+        with deadline(10):
+            self.assertAlmostEqual(remaining(), 10, delta=1)
+            with deadline(20):
+                # Nested deadlines can't extend the enclosing one
+                self.assertLessEqual(remaining(), 10)
+            with deadline(0):
+                self.assertTrue(exceeded())
+        self.assertIsNone(remaining())
+
+    def test_capped_timeout(self):
+        self.assertEqual(capped_timeout((5, 60)), (5, 60))
+        self.assertIsNone(capped_timeout(None))
+        with deadline(10):
+            self.assertEqual(capped_timeout(5), 5)
+            connect, read = capped_timeout((5, 60))
+            self.assertEqual(connect, 5)
+            self.assertLessEqual(read, 10)
+            self.assertLessEqual(capped_timeout(None), 10)
+        with deadline(0):
+            with self.assertRaises(DeadlineExceeded):
+                capped_timeout(5)
+
+    def test_invalid_deadline(self):
+        with self.assertRaises(ValueError):
+            with deadline(-1):
+                pass
+
+
+class TestClientDeadline(unittest.TestCase):
+    """Test cases for client timeouts and deadlines of client calls."""
+
+    def setUp(self):
+        self.handler = SlowHandler()
+        self.server = StubServer(self.handler)
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.addCleanup(self.handler.released.set)
+        self.client = CodeOcean(domain=self.server.url, token="token")
+
+    def test_default_timeout(self):
+        async_client = AsyncCodeOcean(domain=self.server.url, token="token")
+
+        self.assertIsNotNone(self.client.session.timeout)
+        self.assertEqual(self.client.session.timeout, async_client.timeout)
+
+    def test_client_timeout(self):
+        client = CodeOcean(domain=self.server.url, token="token", timeout=(5, 0.05))
+
+        with self.assertRaises(requests.Timeout):
+            client.data_assets.get_data_asset("slow")
+        self.assertEqual(client.data_assets.get_data_asset("da-1").id, "da-1")
+
+    def test_request_deadline(self):
+        t0 = time.monotonic()
+        with deadline(0.1):
+            with self.assertRaises(DeadlineExceeded):
+                self.client.data_assets.get_data_asset("slow")
+
+        self.assertLess(time.monotonic() - t0, 0.4)
+
+    def test_wait_loop_deadline(self):
+        data_asset = DataAsset.from_dict(DATA_ASSET)
+
+        t0 = time.monotonic()
+        with deadline(0.2):
+            with self.assertRaises(DeadlineExceeded):
+                self.client.data_assets.wait_until_ready(data_asset, polling_interval=5)
+
+        # The 5 second sleep between polls ends at the deadline
+        self.assertLess(time.monotonic() - t0, 1)
+
+    def test_rate_limit_wait_deadline(self):
+        limiter = RateLimiter(initial_concurrency=1)
+        limiter.acquire()
+
+        t0 = time.monotonic()
+        with deadline(0.1):
+            with self.assertRaises(DeadlineExceeded):
+                limiter.acquire()
+
+        self.assertLess(time.monotonic() - t0, 1)
+
+    def test_coalesced_wait_deadline(self):
+        coalescer = RequestCoalescer()
+        key = coalescer.key("GET", "data_assets/slow")
+        released = threading.Event()
+        self.addCleanup(released.set)
+        threading.Thread(target=coalescer.call, args=(key, lambda: released.wait(5))).start()
+        time.sleep(0.05)
+
+        t0 = time.monotonic()
+        with deadline(0.1):
+            with self.assertRaises(DeadlineExceeded):
+                coalescer.call(key, lambda: "response")
+
+        self.assertLess(time.monotonic() - t0, 1)
+
+    def test_prefetching_iterator_deadline(self):
+        with deadline(0.1):
+            iterator = self.client.data_assets.search_data_assets_iterator(DataAssetSearchParams(limit=1), prefetch=1)
+            with self.assertRaises(DeadlineExceeded):
+                list(iterator)
+
+    def test_walk_deadline(self):
+        with deadline(0.1):
+            with self.assertRaises(DeadlineExceeded):
+                list(self.client.computations.walk_computation_results("comp-1"))
+
+
+class TestAsyncClientDeadline(unittest.IsolatedAsyncioTestCase):
+    """Test cases for deadlines of asynchronous client calls."""
+
+    async def test_request_deadline(self):
+        handler = SlowHandler()
+        with StubServer(handler) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token") as client:
+                with deadline(0.1):
+                    with self.assertRaises(DeadlineExceeded):
+                        await client.data_assets.get_data_asset("slow")
+                self.assertEqual((await client.data_assets.get_data_asset("da-1")).id, "da-1")
+            handler.released.set()
+
+    async def test_rate_limit_wait_deadline(self):
+        limiter = RateLimiter(initial_concurrency=1)
+        await limiter.acquire_async()
+
+        with deadline(0.1):
+            with self.assertRaises(DeadlineExceeded):
+                await asyncio.wait_for(limiter.acquire_async(), 1)
+
+    async def test_coalesced_wait_deadline(self):
+        coalescer = RequestCoalescer()
+        key = coalescer.key("GET", "data_assets/slow")
+        released = asyncio.Event()
+        leader = asyncio.ensure_future(coalescer.acall(key, released.wait))
+        await asyncio.sleep(0)
+
+        with deadline(0.1):
+            with self.assertRaises(DeadlineExceeded):
+                await asyncio.wait_for(coalescer.acall(key, released.wait), 1)
+        # The request in flight isn't cancelled
+        released.set()
+        self.assertTrue(await leader)
+
+    async def test_client_timeout(self):
+        handler = SlowHandler()
+        with StubServer(handler) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token", timeout=(5, 0.05)) as client:
+                with self.assertRaises(httpx.ReadTimeout):
+                    await client.data_assets.get_data_asset("slow")
+            handler.released.set()
@@ -0,0 +1,189 @@
+import copy
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError, replace
+from typing import Optional
+from unittest.mock import MagicMock
+
+from codeocean.capsule import Capsules
+from codeocean.data_asset import DataAssets
+from codeocean.custom_metadata import CustomMetadata
+from codeocean.models.capsule import AppPanel, CapsuleSearchResults, GitSyncResults
+from codeocean.models.components import Permissions
+from codeocean.models.computation import Computation, ComputationEndStatus
+from codeocean.models.data_asset import DataAsset, DataAssetOrigin, DataAssetSearchParams, DataAssetSearchResults
+from codeocean.models.decoder import decode, get_decoder
+from codeocean.models.folder import Folder
+
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1700000000,
+    "name": "Result",
+    "mount": "result",
+    "state": "ready",
+    "type": "result",
+    "last_used": 0,
+    "owner": "user-1",
+    "tags": ["a", "b"],
+    "provenance": {"commit": "abc", "run_script": "code/run", "docker_image": "img", "capsule": "cap-1",
+                   "data_assets": ["da-0"], "computation": "comp-1"},
+    "source_bucket": {"origin": "aws", "bucket": "bucket", "prefix": "prefix", "external": True},
+    "contained_data_assets": [{"id": "da-2", "mount": "inner", "size": 10}],
+    "app_parameters": [{"name": "p", "value": "v"}],
+    "custom_metadata": {"key": "value"},
+    "unknown_field": "ignored",
+}
+
+COMPUTATION = {
+    "id": "comp-1",
+    "created": 1700000000,
+    "name": "Run",
+    "owner": "user-1",
+    "run_time": 12,
+    "state": "completed",
+    "end_status": "succeeded",
+    "data_assets": [{"id": "da-1", "mount": "data"}],
+    "parameters": [{"name": "n", "param_name": "p", "value": "1"}],
+    "processes": [{"name": "proc", "capsule_id": "cap-1", "parameters": [{"value": "x"}]}],
+}
+
+
+class TestDecoder(unittest.TestCase):
+
+    def assertDecodesLikeFromDict(self, cls, data):
+        self.assertEqual(decode(cls, data), cls.from_dict(data))
+
+    def test_data_asset_search_results(self):
+        data = {"has_more": True, "next_token": "t", "results": [DATA_ASSET, {**DATA_ASSET, "source_bucket": None}]}
+        results = decode(DataAssetSearchResults, data)
+
+        self.assertEqual(results, DataAssetSearchResults.from_dict(data))
+        self.assertIs(results.results[0].source_bucket.origin, DataAssetOrigin.AWS)
+        self.assertIsNone(results.results[1].source_bucket)
+
+    def test_computation(self):
+        computation = decode(Computation, COMPUTATION)
+
+        self.assertEqual(computation, Computation.from_dict(COMPUTATION))
+        self.assertIs(computation.end_status, ComputationEndStatus.Succeeded)
+        self.assertEqual(decode(list[Computation], [COMPUTATION]), [computation])
+
+    def test_other_models(self):
+        self.assertDecodesLikeFromDict(CapsuleSearchResults, {"has_more": False, "results": [{
+            "id": "cap-1", "created": 1, "name": "Capsule", "status": "release", "owner": "user-1", "slug": "1",
+            "original_capsule": {"id": "cap-0", "major_version": 1}, "versions": [{"major_version": 1}],
+        }]})
+        self.assertDecodesLikeFromDict(AppPanel, {
+            "general": {"title": "Title"},
+            "data_assets": [{"id": "da-1", "mount": "m", "name": "n", "kind": "internal", "accessible": True}],
+            "parameters": [{"name": "p", "type": "list", "value_options": ["a"], "minimum": 1}],
+            "processes": [{"name": "proc", "categories": {"id": "c", "name": "c"}}],
+        })
+        self.assertDecodesLikeFromDict(Permissions, {
+            "users": [{"email": "a@b.c", "role": "owner"}],
+            "groups": [{"group": "g", "role": "discoverable"}],
+            "everyone": "none",
+        })
+        self.assertDecodesLikeFromDict(Folder, {"items": [{"name": "f", "path": "f", "type": "file", "size": 1}]})
+        self.assertDecodesLikeFromDict(GitSyncResults, {"pushed": 1, "pulled": 2, "new_branch": False})
+        self.assertDecodesLikeFromDict(CustomMetadata, {"fields": [
+            {"name": "f", "type": "number", "allowed_values": [1.5, 2], "range": {"min": 0, "max": 3}},
+        ]})
+
+    def test_missing_required_field(self):
+        data = dict(COMPUTATION)
+        del data["state"]
+
+        with self.assertRaises(KeyError):
+            decode(Computation, data)
+
+    def test_unknown_enum_value(self):
+        with self.assertRaises(ValueError):
+            decode(Computation, {**COMPUTATION, "state": "unknown"})
+
+    def test_decoder_is_built_once(self):
+        self.assertIs(get_decoder(Computation), get_decoder(Computation))
+        self.assertIs(get_decoder(Optional[Computation]), get_decoder(Computation))
+        self.assertIsNone(get_decoder(Optional[list[str]]))
+
+    def test_client_uses_decoder(self):
+        session = MagicMock()
+        session.get.return_value.json.return_value = [COMPUTATION]
+
+        computations = Capsules(client=session).list_computations("cap-1")
+
+        self.assertEqual(computations, [Computation.from_dict(COMPUTATION)])
+
+
+class TestLazyDecoder(unittest.TestCase):
+
+    def setUp(self):
+        self.data = {"has_more": False, "results": [DATA_ASSET, {**DATA_ASSET, "id": "da-2", "provenance": None}]}
+        self.lazy = decode(DataAssetSearchResults, self.data, lazy=True)
+        self.eager = decode(DataAssetSearchResults, self.data)
+
+    def test_behaves_like_eager_model(self):
+        asset = self.lazy.results[0]
+
+        self.assertIsInstance(asset, DataAsset)
+        self.assertEqual(self.lazy, self.eager)
+        self.assertEqual(self.eager, self.lazy)
+        self.assertEqual(asset, self.eager.results[0])
+        self.assertNotEqual(asset, self.lazy.results[1])
+        self.assertEqual(self.lazy.to_dict(), self.eager.to_dict())
+        self.assertEqual(asset.to_json(), self.eager.results[0].to_json())
+        self.assertIs(asset.source_bucket.origin, DataAssetOrigin.AWS)
+        self.assertIsNone(self.lazy.results[1].provenance)
+        self.assertIsNone(asset.description)
+
+    def test_nested_fields_are_decoded_once(self):
+        asset = self.lazy.results[0]
+
+        self.assertIs(asset.provenance, asset.provenance)
+        self.assertIs(asset.contained_data_assets, asset.contained_data_assets)
+
+    def test_frozen(self):
+        asset = self.lazy.results[0]
+
+        with self.assertRaises(FrozenInstanceError):
+            asset.provenance = None
+        with self.assertRaises(FrozenInstanceError):
+            asset.name = "Other"
+        self.assertEqual(replace(asset, name="Other").name, "Other")
+
+    def test_hash(self):
+        data = {"everyone": "viewer"}
+
+        self.assertEqual(hash(decode(Permissions, data, lazy=True)), hash(decode(Permissions, data)))
+
+    def test_pickle_and_copy_as_eager_model(self):
+        asset = self.lazy.results[0]
+
+        for copied in (pickle.loads(pickle.dumps(asset)), copy.copy(asset), copy.deepcopy(asset)):
+            self.assertIs(type(copied), DataAsset)
+            self.assertEqual(copied, asset)
+
+    def test_errors(self):
+        data = dict(DATA_ASSET)
+        del data["state"]
+        with self.assertRaises(KeyError):
+            decode(DataAsset, data, lazy=True)
+
+        asset = decode(DataAsset, {**DATA_ASSET, "state": "unknown"}, lazy=True)
+        self.assertEqual(asset.id, "da-1")
+        with self.assertRaises(ValueError):
+            asset.state
+
+    def test_search_iterator(self):
+        session = MagicMock()
+        session.post.return_value.json.return_value = self.data
+
+        assets = list(DataAssets(client=session).search_data_assets_iterator(DataAssetSearchParams(), lazy=True))
+
+        self.assertEqual(assets, self.eager.results)
+        self.assertEqual(type(assets[0]).__name__, "LazyDataAsset")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import os
+import random
+import re
+import tempfile
+import unittest
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from codeocean.client import CodeOcean
+from codeocean.download import _DownloadState, download_file
+from codeocean.error import Error
+from tests.stub_server import StubServer, StubResponse
+
+
+class _BlobHandler:
+    """Stub server handler serving a signed URLs endpoint and a blob supporting Range requests."""
+
+    def __init__(self, blob, ranges=True, valid_versions=None, fail_ranges=(), short_ranges=(), content_range=True):
+        self.blob = blob
+        self.ranges = ranges
+        self.valid_versions = valid_versions
+        self.fail_ranges = fail_ranges
+        self.short_ranges = short_ranges
+        self.content_range = content_range
+        self.url_requests = 0
+        self.blob_ranges = []
+        self.server = None
+
+    def __call__(self, request):
+        url = urlparse(request.path)
+        if url.path.endswith("/urls"):
+            version = self.url_requests
+            self.url_requests += 1
+            blob_url = f"{self.server.url}/blob?v={version}"
+            return StubResponse(body={"download_url": blob_url, "view_url": blob_url})
+
+        version = int(parse_qs(url.query)["v"][0])
+        if self.valid_versions is not None and version not in self.valid_versions(len(self.blob_ranges)):
+            return StubResponse(status=403, body="Request has expired")
+
+        match = re.match(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if not self.ranges or not match:
+            return StubResponse(body=self.blob, headers={"Content-Type": "application/octet-stream"})
+        start, end = int(match.group(1)), int(match.group(2))
+        self.blob_ranges.append((start, end))
+        if start in self.fail_ranges:
+            return StubResponse(status=500, body={"message": "Internal error"})
+        if start >= len(self.blob):
+            return StubResponse(status=416, headers={"Content-Range": f"bytes */{len(self.blob)}"})
+        headers = {"Content-Type": "application/octet-stream"}
+        if self.content_range:
+            headers["Content-Range"] = f"bytes {start}-{min(end, len(self.blob) - 1)}/{len(self.blob)}"
+        body = self.blob[start:end + 1]
+        if start in self.short_ranges:
+            body = body[:len(body) // 2]
+        return StubResponse(status=206, body=body, headers=headers)
+
+
+class TestDownload(unittest.TestCase):
+    """Test cases for parallel ranged downloads of result and data asset files."""
+
+    def setUp(self):
+        self.blob = random.Random(0).randbytes(1_000_003)
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.destination = os.path.join(self.dir.name, "output.bin")
+
+    def _serve(self, handler):
+        server = StubServer(handler)
+        handler.server = server
+        return server
+
+    def _read(self):
+        with open(self.destination, "rb") as f:
+            return f.read()
+
+    def test_download_result_file(self):
+        """A result file is downloaded with concurrent Range requests and reassembled in place."""
+        handler = _BlobHandler(self.blob)
+        with self._serve(handler) as server:
+            client = CodeOcean(domain=server.url, token="token")
+            path = client.computations.download_result_file(
+                "comp-1", "output.bin", self.destination, max_workers=4, chunk_size=100_000,
+            )
+
+        self.assertEqual(path, self.destination)
+        self.assertEqual(self._read(), self.blob)
+        # Size probe plus one request per chunk
+        self.assertEqual(len(handler.blob_ranges), 1 + 11)
+        self.assertEqual(os.listdir(self.dir.name), ["output.bin"])
+
+    def test_download_data_asset_file(self):
+        """Data asset files use the same download engine."""
+        handler = _BlobHandler(self.blob)
+        with self._serve(handler) as server:
+            client = CodeOcean(domain=server.url, token="token")
+            client.data_assets.download_data_asset_file("da-1", "output.bin", self.destination, chunk_size=300_000)
+
+        self.assertEqual(self._read(), self.blob)
+
+    def test_resume_partial_download(self):
+        """Chunks recorded as complete by a previous attempt aren't downloaded again."""
+        chunk_size = 100_000
+        part_path = f"{self.destination}.part"
+        with open(part_path, "wb") as f:
+            f.truncate(len(self.blob))
+            f.write(self.blob[:3 * chunk_size])
+        _DownloadState(size=len(self.blob), chunk_size=chunk_size, completed={0, 1, 2}).save(f"{part_path}.state")
+
+        handler = _BlobHandler(self.blob)
+        with self._serve(handler) as server:
+            download_file(lambda: f"{server.url}/blob?v=0", self.destination, chunk_size=chunk_size)
+
+        self.assertEqual(self._read(), self.blob)
+        fetched = {start for start, _ in handler.blob_ranges[1:]}
+        self.assertFalse(fetched & {0, chunk_size, 2 * chunk_size})
+        self.assertEqual(len(fetched), 8)
+
+    def test_failed_download_can_resume(self):
+        """A failed chunk leaves the partial download in place for the next attempt."""
+        handler = _BlobHandler(self.blob, fail_ranges=(500_000,))
+        with self._serve(handler) as server:
+            with self.assertRaises(Error):
+                download_file(lambda: f"{server.url}/blob?v=0", self.destination, max_workers=1, chunk_size=100_000)
+            state = _DownloadState.load(f"{self.destination}.part.state")
+            self.assertIn(0, state.completed)
+            self.assertNotIn(5, state.completed)
+
+            handler.fail_ranges = ()
+            download_file(lambda: f"{server.url}/blob?v=0", self.destination, max_workers=1, chunk_size=100_000)
+
+        self.assertEqual(self._read(), self.blob)
+
+    def test_short_chunk_isnt_completed(self):
+        """A chunk whose body is shorter than requested isn't recorded as complete."""
+        handler = _BlobHandler(self.blob, short_ranges=(500_000,))
+        with self._serve(handler) as server:
+            with self.assertRaises(ValueError):
+                download_file(lambda: f"{server.url}/blob?v=0", self.destination, max_workers=1, chunk_size=100_000)
+            self.assertNotIn(5, _DownloadState.load(f"{self.destination}.part.state").completed)
+
+            handler.short_ranges = ()
+            download_file(lambda: f"{server.url}/blob?v=0", self.destination, max_workers=1, chunk_size=100_000)
+
+        self.assertEqual(self._read(), self.blob)
+
+    def test_partial_response_without_size(self):
+        """A partial response without a readable Content-Range isn't written as the whole file."""
+        handler = _BlobHandler(self.blob, content_range=False)
+        with self._serve(handler) as server:
+            with self.assertRaises(ValueError):
+                download_file(lambda: f"{server.url}/blob?v=0", self.destination)
+
+        self.assertFalse(os.path.exists(self.destination))
+
+    def test_expired_url_is_refreshed(self):
+        """Signed URLs rejected as expired are regenerated and the request retried."""
+        # The first URL expires after the size probe
+        handler = _BlobHandler(self.blob, valid_versions=lambda requests: {0} if requests == 0 else {1})
+        with self._serve(handler) as server:
+            client = CodeOcean(domain=server.url, token="token")
+            client.computations.download_result_file("comp-1", "output.bin", self.destination, chunk_size=250_000)
+
+        self.assertEqual(self._read(), self.blob)
+        self.assertEqual(handler.url_requests, 2)
+
+    def test_server_without_range_support(self):
+        """Servers ignoring Range requests are downloaded in a single stream."""
+        handler = _BlobHandler(self.blob, ranges=False)
+        with self._serve(handler) as server:
+            download_file(lambda: f"{server.url}/blob?v=0", self.destination, chunk_size=100_000)
+
+        self.assertEqual(self._read(), self.blob)
+
+    def test_empty_file(self):
+        """Empty files are created without chunk requests."""
+        handler = _BlobHandler(b"")
+        with self._serve(handler) as server:
+            download_file(lambda: f"{server.url}/blob?v=0", self.destination)
+
+        self.assertEqual(self._read(), b"")
+
+    def test_own_session_is_closed(self):
+        """The session created when none is given is closed once the download is done."""
+        handler = _BlobHandler(self.blob)
+        closing = patch.object(requests.Session, "close", autospec=True, side_effect=requests.Session.close)
+        with self._serve(handler) as server, closing as close:
+            download_file(lambda: f"{server.url}/blob?v=0", self.destination, chunk_size=300_000)
+
+        self.assertEqual(self._read(), self.blob)
+        close.assert_called_once()
+
+    def test_requests_timeout(self):
+        """Range requests are sent with the download timeout."""
+        handler = _BlobHandler(self.blob)
+        getting = patch.object(requests.Session, "get", autospec=True, side_effect=requests.Session.get)
+        with self._serve(handler) as server, getting as get:
+            download_file(lambda: f"{server.url}/blob?v=0", self.destination, chunk_size=300_000, timeout=(1, 2))
+
+        self.assertEqual({call.kwargs["timeout"] for call in get.call_args_list}, {(1, 2)})
@@ -0,0 +1,131 @@
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from codeocean.export import DICTIONARY_TYPE, arrow_schema, iter_record_batches, to_arrow, to_pandas
+from codeocean.models.computation import Computation
+from codeocean.models.data_asset import DataAsset, DataAssetSearchResults
+from codeocean.models.decoder import decode
+from codeocean.models.folder import FolderItem
+
+
+def _data_asset(i, **kwargs):
+    return {
+        "id": f"da-{i}",
+        "created": i,
+        "name": f"Data {i}",
+        "mount": "data",
+        "state": "ready" if i % 2 else "failed",
+        "type": "dataset",
+        "last_used": 0,
+        "owner": f"user-{i % 3}",
+        "tags": ["a", "b"],
+        "provenance": {"commit": "abc", "run_script": "run", "capsule": "cap-1", "data_assets": ["da-0"]},
+        **kwargs,
+    }
+
+
+DATA_ASSETS = [_data_asset(i) for i in range(10)]
+
+
+class TestArrowSchema(unittest.TestCase):
+    """Test cases for mapping model fields to Arrow types."""
+
+    def test_field_types(self):
+        schema = arrow_schema(DataAsset)
+
+        self.assertEqual(schema.field("id").type, pa.string())
+        self.assertEqual(schema.field("created").type, pa.int64())
+        self.assertEqual(schema.field("state").type, DICTIONARY_TYPE)
+        self.assertEqual(schema.field("tags").type, pa.list_(pa.string()))
+        self.assertEqual(schema.field("provenance").type.field("data_assets").type, pa.list_(pa.string()))
+        # Nested enums are plain strings
+        self.assertEqual(schema.field("source_bucket").type.field("origin").type, pa.string())
+        self.assertEqual(schema.names, [f for f in DataAsset.__dataclass_fields__])
+
+    def test_dictionary_fields(self):
+        schema = arrow_schema(DataAsset, dictionary_fields=["owner", "created"])
+
+        self.assertEqual(schema.field("owner").type, DICTIONARY_TYPE)
+        # Only string fields are dictionary-encoded
+        self.assertEqual(schema.field("created").type, pa.int64())
+
+    def test_not_a_model(self):
+        with self.assertRaises(TypeError):
+            arrow_schema(dict)
+
+
+class TestToArrow(unittest.TestCase):
+    """Test cases for converting API objects to Arrow tables."""
+
+    def test_models(self):
+        table = to_arrow(decode(list[DataAsset], DATA_ASSETS))
+
+        self.assertEqual(table.num_rows, 10)
+        self.assertEqual(table.column("id").to_pylist(), [f"da-{i}" for i in range(10)])
+        self.assertEqual(table.column("state").to_pylist()[:2], ["failed", "ready"])
+        self.assertEqual(table.column("provenance").to_pylist()[0]["capsule"], "cap-1")
+        self.assertEqual(table.column("tags").to_pylist()[0], ["a", "b"])
+        self.assertIsNone(table.column("description").to_pylist()[0])
+
+    def test_raw_dicts_match_models(self):
+        self.assertEqual(to_arrow(DATA_ASSETS, DataAsset), to_arrow(decode(list[DataAsset], DATA_ASSETS)))
+
+    def test_lazy_models_match_models(self):
+        lazy = decode(DataAssetSearchResults, {"has_more": False, "results": DATA_ASSETS}, lazy=True).results
+
+        self.assertEqual(to_arrow(lazy), to_arrow(decode(list[DataAsset], DATA_ASSETS)))
+
+    def test_free_form_fields_as_json(self):
+        item = _data_asset(0, custom_metadata={"key": "value"})
+
+        table = to_arrow([item], DataAsset)
+
+        self.assertEqual(table.column("custom_metadata").to_pylist(), ['{"key": "value"}'])
+
+    def test_batches(self):
+        batches = list(iter_record_batches(iter(DATA_ASSETS), DataAsset, batch_size=4))
+
+        self.assertEqual([b.num_rows for b in batches], [4, 4, 2])
+        self.assertEqual(to_arrow(DATA_ASSETS, DataAsset, batch_size=4).num_rows, 10)
+
+    def test_empty(self):
+        table = to_arrow([], DataAsset)
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema, arrow_schema(DataAsset))
+
+    def test_model_required(self):
+        with self.assertRaises(ValueError):
+            to_arrow([])
+        with self.assertRaises(ValueError):
+            to_arrow(DATA_ASSETS)
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            list(iter_record_batches(DATA_ASSETS, DataAsset, batch_size=0))
+
+    def test_other_models(self):
+        computation = {"id": "c-1", "created": 1, "name": "Run", "owner": "user-1", "run_time": 5,
+                       "state": "completed", "parameters": [{"name": "p", "value": "1"}]}
+        folder_item = {"name": "a.txt", "path": "a.txt", "type": "file", "size": 3}
+
+        self.assertEqual(to_arrow([computation], Computation).column("parameters").to_pylist(),
+                         [[{"name": "p", "value": "1", "param_name": None}]])
+        self.assertEqual(to_arrow([folder_item], FolderItem).column("size").to_pylist(), [3])
+
+
+class TestToPandas(unittest.TestCase):
+    """Test cases for converting API objects to pandas DataFrames."""
+
+    def test_categorical_columns(self):
+        df = to_pandas(DATA_ASSETS, DataAsset, batch_size=3, dictionary_fields=["owner"])
+
+        self.assertIsInstance(df["state"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["owner"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df.groupby("owner", observed=True).size().to_dict(), {"user-0": 4, "user-1": 3, "user-2": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import patch
+
+import fsspec
+import requests
+
+from codeocean.client import CodeOcean
+from codeocean.filesystem import CodeOceanFileSystem
+from tests.stub_server import FileTreeHandler, StubServer
+
+FILES = {
+    "summary.txt": b"done\n",
+    "tables/large.bin": bytes(range(256)) * 4096,
+}
+
+
+class TestFileSystem(unittest.TestCase):
+    """Test cases for the fsspec file system over results and data asset files."""
+
+    def setUp(self):
+        self.handler = FileTreeHandler(FILES)
+        self.server = StubServer(self.handler)
+        self.handler.server = self.server
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.client = CodeOcean(domain=self.server.url, token="token")
+        self.fs = CodeOceanFileSystem(client=self.client, skip_instance_cache=True)
+        self.addCleanup(self.fs.close)
+
+    def test_ls(self):
+        """Listings map folder items to fsspec entries."""
+        entries = self.fs.ls("codeocean://computations/comp-1")
+        self.assertEqual(entries, [
+            {"name": "computations/comp-1/summary.txt", "size": 5, "type": "file"},
+            {"name": "computations/comp-1/tables", "size": 0, "type": "directory"},
+        ])
+        self.assertEqual(self.fs.ls("data_assets/da-1/tables", detail=False), ["data_assets/da-1/tables/large.bin"])
+
+    def test_info(self):
+        """info reports files, folders and resource roots."""
+        self.assertEqual(self.fs.info("computations/comp-1/tables/large.bin")["size"], len(FILES["tables/large.bin"]))
+        self.assertEqual(self.fs.info("computations/comp-1/tables")["type"], "directory")
+        self.assertEqual(self.fs.info("computations/comp-1")["type"], "directory")
+        with self.assertRaises(FileNotFoundError):
+            self.fs.info("computations/comp-1/missing.txt")
+        with self.assertRaises(FileNotFoundError):
+            self.fs.ls("capsules/cap-1")
+
+    def test_open_reads_only_requested_ranges(self):
+        """Reading part of a file only fetches the blocks around the requested bytes."""
+        content = FILES["tables/large.bin"]
+        with self.fs.open("computations/comp-1/tables/large.bin", block_size=64 * 1024) as f:
+            f.seek(500_000)
+            self.assertEqual(f.read(1000), content[500_000:501_000])
+
+        fetched = sum(end - start + 1 for _, start, end in self.handler.ranges)
+        self.assertLess(fetched, len(content) // 4)
+
+    def test_cat_file(self):
+        """Whole files can be read through the standard fsspec API."""
+        self.assertEqual(self.fs.cat_file("data_assets/da-1/summary.txt"), FILES["summary.txt"])
+        with self.fs.open("data_assets/da-1/tables/large.bin", cache_type="blockcache", block_size=100_000) as f:
+            self.assertEqual(f.read(), FILES["tables/large.bin"])
+
+    def test_file_requests_timeout(self):
+        """Range requests are sent with the file system's timeout, and close() closes its session."""
+        fs = CodeOceanFileSystem(client=self.client, timeout=(1, 2), skip_instance_cache=True)
+        with patch.object(fs.session, "get", wraps=fs.session.get) as get:
+            self.assertEqual(fs.cat_file("data_assets/da-1/summary.txt"), FILES["summary.txt"])
+        self.assertEqual(get.call_args.kwargs["timeout"], (1, 2))
+
+        with patch.object(requests.Session, "close", autospec=True, side_effect=requests.Session.close) as close:
+            fs.close()
+        close.assert_called_once_with(fs.session)
+
+    def test_read_only(self):
+        """Opening files for writing is not supported."""
+        with self.assertRaises(NotImplementedError):
+            self.fs.open("computations/comp-1/new.txt", "wb")
+
+    def test_protocol_registration(self):
+        """The codeocean protocol resolves to CodeOceanFileSystem."""
+        self.assertIs(fsspec.get_filesystem_class("codeocean"), CodeOceanFileSystem)
@@ -0,0 +1,181 @@
+import threading
+import time
+import unittest
+
+from codeocean.aio.client import AsyncCodeOcean
+from codeocean.client import CodeOcean
+from codeocean.error import Error
+from codeocean.hedge import Hedger
+from codeocean.models.data_asset import DataAssetUpdateParams
+from tests.stub_server import StubResponse, StubServer
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1,
+    "name": "Data",
+    "mount": "data",
+    "state": "ready",
+    "type": "dataset",
+    "last_used": 0,
+    "owner": "user-1",
+}
+
+
+class SlowFirstHandler:
+    """Answers the first `slow` requests after a delay, the others at once."""
+
+    def __init__(self, slow=1, delay=2, status=200):
+        self.slow = slow
+        self.delay = delay
+        self.status = status
+        self.released = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.slow -= 1
+            slow = self.slow >= 0
+        if slow:
+            self.released.wait(self.delay)
+        if self.status >= 400:
+            return StubResponse(self.status, {"message": "unavailable"})
+        return StubResponse(200, DATA_ASSET)
+
+
+class TestHedger(unittest.TestCase):
+    """Test cases for the hedge delay and budget."""
+
+    def test_delay_percentile(self):
+        hedger = Hedger(percentile=0.9, window=10, min_samples=5, initial_delay=1)
+        self.assertEqual(hedger.delay, 1)
+
+        for latency in range(10):
+            hedger._record(latency / 10)
+
+        self.assertAlmostEqual(hedger.delay, 0.8)
+
+    def test_min_delay(self):
+        hedger = Hedger(min_samples=1, min_delay=0.05)
+        hedger._record(0.001)
+
+        self.assertEqual(hedger.delay, 0.05)
+
+    def test_hedged(self):
+        hedger = Hedger(paths=["computations/*"])
+
+        self.assertTrue(hedger.hedged("GET", "computations/comp-1"))
+        self.assertFalse(hedger.hedged("GET", "data_assets/da-1"))
+        self.assertFalse(hedger.hedged("POST", "computations/comp-1"))
+        self.assertTrue(Hedger().hedged("get", "data_assets/da-1"))
+        self.assertFalse(Hedger().hedged("GET", "data_assets/da-1/permissions"))
+        self.assertTrue(Hedger(paths=None).hedged("GET", "data_assets/da-1/permissions"))
+
+    def test_budget(self):
+        hedger = Hedger(initial_delay=0, min_delay=0, budget=0.5)
+
+        def slow():
+            time.sleep(0.02)
+            return "response"
+
+        for _ in range(4):
+            self.assertEqual(hedger.call(slow), "response")
+
+        self.assertEqual(hedger.stats.requests, 4)
+        self.assertEqual(hedger.stats.hedged, 2)
+
+    def test_sent_on_calling_thread_without_budget(self):
+        hedger = Hedger(budget=0)
+
+        self.assertIs(hedger.call(threading.current_thread), threading.current_thread())
+        self.assertEqual(len(hedger._latencies), 1)
+
+    def test_winner_latency_recorded(self):
+        hedger = Hedger(initial_delay=0.01, budget=1)
+        released = threading.Event()
+        self.addCleanup(released.set)
+        attempts = iter([lambda: released.wait(5) and "first", lambda: "hedge"])
+
+        self.assertEqual(hedger.call(lambda: next(attempts)()), "hedge")
+
+        released.set()
+        time.sleep(0.05)
+        self.assertEqual(len(hedger._latencies), 1)
+        self.assertLess(hedger._latencies[0], 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Hedger(percentile=0)
+        with self.assertRaises(ValueError):
+            Hedger(window=5, min_samples=10)
+        with self.assertRaises(ValueError):
+            Hedger(budget=2)
+
+
+class TestClientHedging(unittest.TestCase):
+    """Test cases for hedging the client's slow GET requests."""
+
+    def _client(self, server, **kwargs):
+        return CodeOcean(domain=server.url, token="token", hedge=Hedger(initial_delay=0.05, budget=1, **kwargs))
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(CodeOcean(domain="https://example.com", token="token").session.hedger)
+
+    def test_hedge_wins(self):
+        handler = SlowFirstHandler()
+        with StubServer(handler) as server:
+            client = self._client(server)
+            t0 = time.monotonic()
+            data_asset = client.data_assets.get_data_asset("da-1")
+            elapsed = time.monotonic() - t0
+            handler.released.set()
+
+        self.assertEqual(data_asset.id, "da-1")
+        self.assertLess(elapsed, 1)
+        self.assertEqual(len(server.requests), 2)
+        stats = client.session.hedger.stats
+        self.assertEqual((stats.requests, stats.hedged, stats.hedge_wins), (1, 1, 1))
+        self.assertEqual(stats.win_rate, 1)
+
+    def test_fast_requests_not_hedged(self):
+        with StubServer(SlowFirstHandler(slow=0)) as server:
+            client = self._client(server)
+            client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(client.session.hedger.stats.hedged, 0)
+
+    def test_errors_raised(self):
+        handler = SlowFirstHandler(slow=0, status=404)
+        with StubServer(handler) as server:
+            client = self._client(server)
+            with self.assertRaises(Error):
+                client.data_assets.get_data_asset("da-1")
+
+    def test_mutations_not_hedged(self):
+        handler = SlowFirstHandler(delay=0.2)
+        with StubServer(handler) as server:
+            client = self._client(server)
+            client.data_assets.update_metadata("da-1", DataAssetUpdateParams(name="Data"))
+
+        self.assertEqual(len(server.requests), 1)
+
+
+class TestAsyncClientHedging(unittest.IsolatedAsyncioTestCase):
+    """Test cases for hedging the asynchronous client's slow GET requests."""
+
+    async def test_hedge_wins(self):
+        handler = SlowFirstHandler()
+        hedger = Hedger(initial_delay=0.05, budget=1)
+        with StubServer(handler) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token", hedge=hedger) as client:
+                t0 = time.monotonic()
+                data_asset = await client.data_assets.get_data_asset("da-1")
+                elapsed = time.monotonic() - t0
+            handler.released.set()
+
+        self.assertEqual(data_asset.id, "da-1")
+        self.assertLess(elapsed, 1)
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(hedger.stats.hedge_wins, 1)
+        # The cancelled request's latency isn't recorded
+        self.assertEqual(len(hedger._latencies), 1)
@@ -0,0 +1,114 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from codeocean import CodeOcean
+from codeocean.aio import AsyncCodeOcean
+from codeocean.data_asset import DataAssetSearchParams
+from codeocean.error import Error
+from codeocean.json_backend import MsgspecJSON, OrjsonJSON, StdlibJSON, get_json_backend
+from tests.stub_server import StubResponse, StubServer
+
+
+class _RecordingJSON(StdlibJSON):
+    """Stdlib backend recording what it encodes and decodes."""
+
+    def __init__(self):
+        self.loaded = []
+        self.dumped = []
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+
+def _search_handler(request):
+    if request.path.endswith("/data_assets/search"):
+        params = json.loads(request.body)
+        return StubResponse(body={"has_more": False, "results": [], "next_token": params.get("query")})
+    return StubResponse(status=400, body={"message": "bad request", "field": "id"})
+
+
+class TestGetJSONBackend(unittest.TestCase):
+
+    def test_auto_prefers_fastest_installed(self):
+        self.assertIsInstance(get_json_backend(), OrjsonJSON)
+        with patch("codeocean.json_backend.orjson", None):
+            self.assertIsInstance(get_json_backend(), MsgspecJSON)
+            with patch("codeocean.json_backend.msgspec", None):
+                self.assertIsInstance(get_json_backend("auto"), StdlibJSON)
+
+    def test_named_backend(self):
+        self.assertIsInstance(get_json_backend("json"), StdlibJSON)
+        self.assertIsInstance(get_json_backend("msgspec"), MsgspecJSON)
+        backend = _RecordingJSON()
+        self.assertIs(get_json_backend(backend), backend)
+
+    def test_missing_or_unknown_backend(self):
+        with patch("codeocean.json_backend.orjson", None):
+            with self.assertRaises(ImportError):
+                get_json_backend("orjson")
+        with self.assertRaises(ValueError):
+            get_json_backend("simplejson")
+
+    def test_round_trip(self):
+        document = {"name": "ünïcode", "size": 12, "ratio": 0.5, "tags": ["a"], "nested": {"ok": True, "none": None}}
+        for name in ("json", "orjson", "msgspec"):
+            with self.subTest(backend=name):
+                backend = get_json_backend(name)
+                encoded = backend.dumps(document)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json.loads(encoded), document)
+                self.assertEqual(backend.loads(encoded), document)
+
+
+class TestClientJSONBackend(unittest.TestCase):
+
+    def test_backends_encode_requests_and_decode_responses(self):
+        with StubServer(_search_handler) as server:
+            for name in ("json", "orjson", "msgspec"):
+                with self.subTest(backend=name):
+                    client = CodeOcean(domain=server.url, token="token", json_backend=name)
+                    self.assertEqual(client.session.json_backend.name, name)
+
+                    results = client.data_assets.search_data_assets(DataAssetSearchParams(query="ünï", limit=1))
+                    self.assertEqual(results.next_token, "ünï")
+
+                    with self.assertRaises(Error) as cm:
+                        client.data_assets.get_data_asset("missing")
+                    self.assertEqual(cm.exception.message, "bad request")
+                    self.assertEqual(cm.exception.data, {"message": "bad request", "field": "id"})
+
+    def test_custom_backend_is_used(self):
+        backend = _RecordingJSON()
+        with StubServer(_search_handler) as server:
+            client = CodeOcean(domain=server.url, token="token", json_backend=backend)
+            client.data_assets.search_data_assets(DataAssetSearchParams(query="q"))
+
+        self.assertEqual([body["query"] for body in backend.dumped], ["q"])
+        self.assertEqual(len(backend.loaded), 1)
+        self.assertIsInstance(backend.loaded[0], bytes)
+
+
+class TestAsyncClientJSONBackend(unittest.IsolatedAsyncioTestCase):
+
+    async def test_custom_backend_is_used(self):
+        backend = _RecordingJSON()
+        with StubServer(_search_handler) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token", json_backend=backend) as client:
+                results = await client.data_assets.search_data_assets(DataAssetSearchParams(query="q"))
+                with self.assertRaises(Error) as cm:
+                    await client.data_assets.get_data_asset("missing")
+
+        self.assertEqual(results.next_token, "q")
+        self.assertEqual(cm.exception.message, "bad request")
+        self.assertEqual([body["query"] for body in backend.dumped], ["q"])
+        self.assertEqual(len(backend.loaded), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
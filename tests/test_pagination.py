@@ -0,0 +1,148 @@
+import threading
+import time
+import unittest
+from dataclasses import dataclass
+from typing import Optional
+from unittest.mock import MagicMock
+
+from codeocean.aio.data_asset import AsyncDataAssets
+from codeocean.aio.pagination import iterate_pages as aiterate_pages
+from codeocean.data_asset import DataAssets, DataAssetSearchParams
+from codeocean.pagination import iterate_pages
+
+
+@dataclass
+class _Page:
+    number: int
+    has_more: bool
+    next_token: Optional[str]
+
+
+class _Search:
+    """Fake search function serving `count` pages and recording how far ahead it was called."""
+
+    def __init__(self, count, fail_at=None):
+        self.count = count
+        self.fail_at = fail_at
+        self.fetched = 0
+        self.consumed = 0
+        self.max_ahead = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, params):
+        number = int(params.get("next_token") or 0)
+        if number == self.fail_at:
+            raise RuntimeError(f"page {number} failed")
+        with self.lock:
+            self.fetched += 1
+            self.max_ahead = max(self.max_ahead, self.fetched - self.consumed)
+        more = number + 1 < self.count
+        return _Page(number=number, has_more=more, next_token=str(number + 1) if more else None)
+
+
+class TestPagination(unittest.TestCase):
+    """Test cases for paginated search iteration with optional prefetching."""
+
+    def test_iterate_pages_without_prefetch(self):
+        """Pages are fetched in order following next_token."""
+        search = _Search(count=3)
+        pages = [p.number for p in iterate_pages(search, {"next_token": None})]
+        self.assertEqual(pages, [0, 1, 2])
+
+    def test_iterate_pages_with_prefetch(self):
+        """Prefetching yields the same pages and keeps at most `prefetch` pages ahead."""
+        search = _Search(count=10)
+        pages = []
+        for page in iterate_pages(search, {}, prefetch=2):
+            time.sleep(0.01)
+            with search.lock:
+                search.consumed += 1
+            pages.append(page.number)
+
+        self.assertEqual(pages, list(range(10)))
+        # The page being consumed plus at most two pages ahead of it
+        self.assertLessEqual(search.max_ahead, 3)
+
+    def test_prefetch_propagates_errors(self):
+        """Errors raised on the prefetch thread are raised to the consumer in order."""
+        search = _Search(count=5, fail_at=2)
+        pages = []
+        with self.assertRaisesRegex(RuntimeError, "page 2 failed"):
+            for page in iterate_pages(search, {}, prefetch=3):
+                pages.append(page.number)
+        self.assertEqual(pages, [0, 1])
+
+    def test_prefetch_stops_when_consumer_closes(self):
+        """Closing the iterator early stops the prefetch thread from fetching further pages."""
+        search = _Search(count=1000)
+        pages = iterate_pages(search, {}, prefetch=2)
+        next(pages)
+        pages.close()
+        time.sleep(0.3)
+        self.assertLessEqual(search.fetched, 3)
+
+    def test_invalid_prefetch(self):
+        """A negative prefetch depth is rejected."""
+        with self.assertRaises(ValueError):
+            list(iterate_pages(_Search(count=1), {}, prefetch=-1))
+
+    def test_invalid_prefetch_raised_when_called(self):
+        """Search iterators reject a negative prefetch depth before any iteration."""
+        data_assets = DataAssets(client=MagicMock())
+        with self.assertRaises(ValueError):
+            data_assets.search_data_assets_iterator(DataAssetSearchParams(), prefetch=-1)
+        with self.assertRaises(ValueError):
+            AsyncDataAssets(client=MagicMock()).search_data_assets_iterator(DataAssetSearchParams(), prefetch=-1)
+
+    def test_search_data_assets_iterator_prefetch(self):
+        """search_data_assets_iterator yields all results across pages when prefetching."""
+        def post(route, json):
+            page = int(json.get("next_token") or 0)
+            response = MagicMock()
+            response.json.return_value = {
+                "has_more": page < 2,
+                "next_token": str(page + 1),
+                "results": [{
+                    "id": f"da-{page}",
+                    "created": 0,
+                    "name": "name",
+                    "mount": "mount",
+                    "last_used": 0,
+                    "owner": "owner",
+                    "state": "ready",
+                    "type": "dataset",
+                }],
+            }
+            return response
+
+        session = MagicMock()
+        session.post.side_effect = post
+        data_assets = DataAssets(client=session)
+
+        ids = [da.id for da in data_assets.search_data_assets_iterator(DataAssetSearchParams(), prefetch=2)]
+        self.assertEqual(ids, ["da-0", "da-1", "da-2"])
+
+
+class TestAsyncPagination(unittest.IsolatedAsyncioTestCase):
+    """Test cases for async paginated search iteration with optional prefetching."""
+
+    async def test_iterate_pages_with_prefetch(self):
+        """Async prefetching yields all pages in order."""
+        search = _Search(count=5)
+
+        async def fetch(params):
+            return search(params)
+
+        pages = [p.number async for p in aiterate_pages(fetch, {}, prefetch=2)]
+        self.assertEqual(pages, list(range(5)))
+
+    async def test_prefetch_propagates_errors(self):
+        """Errors raised by the prefetch task are raised to the consumer."""
+        search = _Search(count=5, fail_at=1)
+
+        async def fetch(params):
+            return search(params)
+
+        with self.assertRaisesRegex(RuntimeError, "page 1 failed"):
+            async for _ in aiterate_pages(fetch, {}, prefetch=2):
+                pass
@@ -0,0 +1,113 @@
+import unittest
+from itertools import islice
+from unittest.mock import MagicMock, patch
+
+from codeocean.computation import Computations
+from codeocean.models.computation import Computation, ComputationEndStatus, ComputationState
+from codeocean.polling import DecorrelatedJitter, ExpectedRunTime, ExponentialBackoff, FixedInterval, capped_delay
+
+
+def _computation(id, state, run_time=0, end_status=None, created=0):
+    return Computation(
+        id=id, created=created, name=id, owner="owner", run_time=run_time, state=state, end_status=end_status,
+    )
+
+
+class TestPollingStrategy(unittest.TestCase):
+    """Test cases for polling strategies used by the wait methods."""
+
+    def test_fixed_interval(self):
+        """FixedInterval always returns the same delay."""
+        self.assertEqual(list(islice(FixedInterval(7).delays(), 3)), [7, 7, 7])
+
+    def test_exponential_backoff(self):
+        """ExponentialBackoff multiplies the delay up to the cap."""
+        strategy = ExponentialBackoff(initial=1, multiplier=2, max_interval=10)
+        self.assertEqual(list(islice(strategy.delays(), 6)), [1, 2, 4, 8, 10, 10])
+
+    def test_decorrelated_jitter_bounds(self):
+        """DecorrelatedJitter delays stay between base and the cap."""
+        delays = list(islice(DecorrelatedJitter(base=2, max_interval=30).delays(), 200))
+        self.assertTrue(all(2 <= d <= 30 for d in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_invalid_strategies(self):
+        """Strategies reject delays below the minimum and inconsistent caps."""
+        with self.assertRaises(ValueError):
+            ExponentialBackoff(initial=0.1)
+        with self.assertRaises(ValueError):
+            ExponentialBackoff(initial=10, max_interval=5)
+        with self.assertRaises(ValueError):
+            DecorrelatedJitter(base=0)
+
+    def test_expected_run_time_from_computations(self):
+        """The expected run time is the median of successful completed computations."""
+        history = [
+            _computation("a", ComputationState.Completed, 100, ComputationEndStatus.Succeeded),
+            _computation("b", ComputationState.Completed, 300, ComputationEndStatus.Succeeded),
+            _computation("c", ComputationState.Completed, 200, ComputationEndStatus.Succeeded),
+            _computation("d", ComputationState.Completed, 5, ComputationEndStatus.Failed),
+            _computation("e", ComputationState.Running, 1000),
+        ]
+        self.assertEqual(ExpectedRunTime.from_computations(history).expected_run_time, 200)
+        self.assertEqual(ExpectedRunTime.from_computations([]).expected_run_time, 0)
+
+    @patch("codeocean.polling.time", return_value=1000)
+    def test_expected_run_time_delays(self, _):
+        """The first delay targets the expected finish, then the fallback strategy takes over."""
+        strategy = ExpectedRunTime(expected_run_time=300, fallback=ExponentialBackoff(initial=2, max_interval=8))
+        self.assertEqual(list(islice(strategy.delays(started=900), 4)), [200, 2, 4, 8])
+        # Already past the expected finish
+        self.assertEqual(list(islice(strategy.delays(started=0), 2)), [2, 4])
+
+    @patch("codeocean.computation.sleep")
+    def test_wait_until_completed_with_strategy(self, mock_sleep):
+        """wait_until_completed sleeps according to the polling strategy."""
+        states = [ComputationState.Running] * 4 + [ComputationState.Completed]
+        computations = Computations(client=MagicMock())
+        computations.get_computation = lambda id: _computation(id, states.pop(0))
+
+        result = computations.wait_until_completed(
+            _computation("a", ComputationState.Running),
+            polling_strategy=ExponentialBackoff(initial=1, max_interval=4),
+        )
+
+        self.assertEqual(result.state, ComputationState.Completed)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1, 2, 4, 4])
+
+    def test_wait_until_completed_delays_capped_at_timeout(self):
+        """Strategy delays longer than the time left are cut short at the timeout."""
+        clock = [1000.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        computations = Computations(client=MagicMock())
+        computations.get_computation = lambda id: _computation(id, ComputationState.Running, created=1000)
+
+        with patch("codeocean.computation.time", lambda: clock[0]), \
+                patch("codeocean.polling.time", lambda: clock[0]), \
+                patch("codeocean.computation.sleep", side_effect=sleep) as mock_sleep:
+            with self.assertRaises(TimeoutError):
+                computations.wait_until_completed(
+                    _computation("a", ComputationState.Running, created=1000),
+                    timeout=60,
+                    polling_strategy=ExpectedRunTime(expected_run_time=3600),
+                )
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [60])
+        self.assertEqual(clock[0], 1060)
+
+    @patch("codeocean.polling.time", return_value=1050)
+    def test_capped_delay(self, _):
+        """Delays are capped at the time left before the timeout, and never negative."""
+        self.assertEqual(capped_delay(30, t0=1000, timeout=None), 30)
+        self.assertEqual(capped_delay(30, t0=1000, timeout=60), 10)
+        self.assertEqual(capped_delay(5, t0=1000, timeout=60), 5)
+        self.assertEqual(capped_delay(5, t0=1000, timeout=20), 0)
+
+    def test_polling_interval_floor_without_strategy(self):
+        """The 5 second polling interval floor still applies without a strategy."""
+        computations = Computations(client=MagicMock())
+        with self.assertRaises(ValueError):
+            computations.wait_until_completed(_computation("a", ComputationState.Running), polling_interval=1)
@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+import unittest
+from email.utils import formatdate
+
+from codeocean.aio.client import AsyncCodeOcean
+from codeocean.client import CodeOcean
+from codeocean.error import Error
+from codeocean.rate_limit import RateLimiter, retry_after
+from codeocean.retry import RetryPolicy
+from tests.stub_server import StubResponse, StubServer
+
+CAPSULE = {
+    "id": "cap-1",
+    "created": 1,
+    "name": "Capsule",
+    "status": "release",
+    "owner": "user-1",
+    "slug": "1",
+}
+
+
+class FakeResponse:
+    def __init__(self, status_code, **headers):
+        self.status_code = status_code
+        self.headers = headers
+
+
+class ThrottlingHandler:
+    """Throttles the first `throttled` requests, then returns a capsule."""
+
+    def __init__(self, throttled, status=429, **headers):
+        self.throttled = throttled
+        self.status = status
+        self.headers = headers
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.throttled -= 1
+            if self.throttled >= 0:
+                return StubResponse(self.status, {"message": "slow down"}, self.headers)
+        return StubResponse(200, CAPSULE)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for the token bucket and AIMD concurrency limit."""
+
+    def test_token_bucket(self):
+        limiter = RateLimiter(rate=100, burst=2)
+
+        t0 = time.monotonic()
+        for _ in range(6):
+            limiter.release(limiter.acquire())
+
+        # Two requests from the burst, then one every 10 ms
+        self.assertGreaterEqual(time.monotonic() - t0, 0.035)
+        self.assertEqual(limiter.stats.requests, 6)
+
+    def test_additive_increase(self):
+        limiter = RateLimiter(initial_concurrency=2, max_concurrency=3)
+
+        # The limit grows by about one per limit successful responses
+        for _ in range(3):
+            limiter.release(limiter.acquire(), FakeResponse(200))
+        self.assertEqual(limiter.concurrency_limit, 3)
+        for _ in range(10):
+            limiter.release(limiter.acquire(), FakeResponse(200))
+        self.assertEqual(limiter.concurrency_limit, 3)
+
+    def test_multiplicative_decrease(self):
+        limiter = RateLimiter(initial_concurrency=8)
+        sent = [limiter.acquire() for _ in range(4)]
+
+        # Responses to requests sent before the decrease don't decrease the limit again
+        limiter.release(sent[0], FakeResponse(500))
+        limiter.release(sent[1], FakeResponse(502))
+        self.assertEqual(limiter.concurrency_limit, 4)
+        limiter.release(limiter.acquire(), FakeResponse(503))
+        self.assertEqual(limiter.concurrency_limit, 2)
+        self.assertEqual(limiter.stats.server_errors, 3)
+
+    def test_slow_responses(self):
+        limiter = RateLimiter(initial_concurrency=8, latency_target=1)
+        sent = limiter.acquire()
+
+        limiter.release(sent - 2, FakeResponse(200))
+
+        self.assertEqual(limiter.concurrency_limit, 4)
+
+    def test_concurrency_limit(self):
+        limiter = RateLimiter(initial_concurrency=1)
+        sent = limiter.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(sent, FakeResponse(200))
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after(FakeResponse(429, **{"Retry-After": "2"})), 2)
+        self.assertAlmostEqual(
+            retry_after(FakeResponse(429, **{"Retry-After": formatdate(time.time() + 30, usegmt=True)})), 30, delta=2,
+        )
+        self.assertIsNone(retry_after(FakeResponse(429)))
+        self.assertIsNone(retry_after(FakeResponse(429, **{"Retry-After": "soon"})))
+
+    def test_pause(self):
+        limiter = RateLimiter()
+
+        limiter.release(limiter.acquire(), FakeResponse(429, **{"Retry-After": "0.1"}))
+        t0 = time.monotonic()
+        limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - t0, 0.09)
+
+    def test_pause_capped(self):
+        limiter = RateLimiter(max_retry_after=0.05)
+
+        limiter.release(limiter.acquire(), FakeResponse(429, **{"Retry-After": "3600"}))
+        t0 = time.monotonic()
+        limiter.acquire()
+
+        self.assertLess(time.monotonic() - t0, 1)
+
+    def test_should_retry(self):
+        limiter = RateLimiter(retries=1, retry_delay=0.01)
+
+        self.assertTrue(limiter.should_retry(FakeResponse(429), 0))
+        self.assertFalse(limiter.should_retry(FakeResponse(429), 1))
+        self.assertFalse(limiter.should_retry(FakeResponse(503), 0))
+        self.assertFalse(limiter.should_retry(None, 0))
+        self.assertEqual(limiter.stats.retries, 1)
+
+    def test_invalid_arguments(self):
+        for kwargs in [{"rate": 0}, {"burst": 0}, {"initial_concurrency": 0}, {"max_concurrency": 4}, {"backoff": 1}]:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    RateLimiter(**kwargs)
+
+
+class TestClientRateLimit(unittest.TestCase):
+    """Test cases for rate limiting the client's requests."""
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(CodeOcean(domain="https://example.com", token="token").session.rate_limiter)
+
+    def test_throttled_requests_retried(self):
+        with StubServer(ThrottlingHandler(2, **{"Retry-After": "0.05"})) as server:
+            client = CodeOcean(domain=server.url, token="token", rate_limit=True)
+            t0 = time.monotonic()
+            capsule = client.capsules.get_capsule("cap-1")
+
+        self.assertEqual(capsule.id, "cap-1")
+        self.assertGreaterEqual(time.monotonic() - t0, 0.1)
+        self.assertEqual(len(server.requests), 3)
+        stats = client.session.rate_limiter.stats
+        self.assertEqual((stats.requests, stats.throttled, stats.retries, stats.in_flight), (3, 2, 2, 0))
+
+    def test_throttled_requests_retried_once_with_retry_policy(self):
+        with StubServer(ThrottlingHandler(5, **{"Retry-After": "0"})) as server:
+            client = CodeOcean(
+                domain=server.url,
+                token="token",
+                rate_limit=RateLimiter(retries=2),
+                retry=RetryPolicy(retries=2, backoff=0),
+            )
+            with self.assertRaises(Error):
+                client.capsules.get_capsule("cap-1")
+
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(client.session.rate_limiter.stats.retries, 0)
+        self.assertEqual(client.session.retry_policy.stats.retries, 2)
+
+    def test_retries_exhausted(self):
+        with StubServer(ThrottlingHandler(5)) as server:
+            client = CodeOcean(domain=server.url, token="token", rate_limit=RateLimiter(retries=2, retry_delay=0.01))
+            with self.assertRaises(Error) as cm:
+                client.capsules.get_capsule("cap-1")
+
+        self.assertEqual(cm.exception.status_code, 429)
+        self.assertEqual(len(server.requests), 3)
+
+    def test_server_errors_not_retried(self):
+        with StubServer(ThrottlingHandler(1, status=500)) as server:
+            client = CodeOcean(domain=server.url, token="token", rate_limit=True)
+            with self.assertRaises(Error):
+                client.capsules.get_capsule("cap-1")
+
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(client.session.rate_limiter.concurrency_limit, 4)
+
+
+class TestAsyncClientRateLimit(unittest.IsolatedAsyncioTestCase):
+    """Test cases for rate limiting the asynchronous client's requests."""
+
+    async def test_waiters_woken_on_release(self):
+        limiter = RateLimiter(initial_concurrency=1)
+        sent = await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0.05)
+        self.assertFalse(waiter.done())
+
+        threading.Thread(target=limiter.release, args=(sent, FakeResponse(200))).start()
+
+        await asyncio.wait_for(waiter, 5)
+        self.assertEqual(limiter._async_waiters, [])
+
+    async def test_throttled_requests_retried(self):
+        with StubServer(ThrottlingHandler(1, **{"Retry-After": "0"})) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token", rate_limit=True) as client:
+                capsule = await client.capsules.get_capsule("cap-1")
+
+        self.assertEqual(capsule.id, "cap-1")
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(client.session.rate_limiter.stats.throttled, 1)
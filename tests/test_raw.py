@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import MagicMock
+
+from codeocean.aio.data_asset import AsyncDataAssets
+from codeocean.capsule import Capsules
+from codeocean.computation import Computations
+from codeocean.data_asset import DataAssets, DataAssetSearchParams
+from codeocean.models.capsule import CapsuleSearchParams
+from codeocean.pipeline import Pipelines
+
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1,
+    "name": "Data",
+    "mount": "data",
+    "state": "ready",
+    "type": "dataset",
+    "last_used": 0,
+    "owner": "user-1",
+}
+
+
+def _page(ids, next_token=None):
+    return {
+        "has_more": next_token is not None,
+        "next_token": next_token,
+        "results": [{**DATA_ASSET, "id": id} for id in ids],
+    }
+
+
+class TestRawResponses(unittest.TestCase):
+
+    def test_get_returns_parsed_json(self):
+        session = MagicMock()
+        session.get.return_value.json.return_value = DATA_ASSET
+
+        self.assertIs(DataAssets(client=session).get_data_asset("da-1", raw=True), DATA_ASSET)
+        self.assertEqual(DataAssets(client=session).get_data_asset("da-1").id, "da-1")
+
+    def test_list_returns_parsed_json(self):
+        session = MagicMock()
+        folder = {"items": [{"name": "a", "path": "a", "type": "file", "size": 1}]}
+        session.post.return_value.json.return_value = folder
+
+        self.assertIs(Computations(client=session).list_computation_results("c-1", raw=True), folder)
+        self.assertIs(DataAssets(client=session).list_data_asset_files("da-1", raw=True), folder)
+
+    def test_search_iterator(self):
+        session = MagicMock()
+        session.post.return_value.json.side_effect = [_page(["a", "b"], next_token="t"), _page(["c"])]
+
+        results = list(DataAssets(client=session).search_data_assets_iterator(DataAssetSearchParams(), raw=True))
+
+        self.assertEqual([r["id"] for r in results], ["a", "b", "c"])
+        self.assertIsInstance(results[0], dict)
+        self.assertEqual(session.post.call_args.kwargs["json"]["next_token"], "t")
+
+    def test_search_iterator_with_prefetch(self):
+        session = MagicMock()
+        session.post.return_value.json.side_effect = [_page(["a"], next_token="t"), _page(["b"])]
+
+        results = DataAssets(client=session).search_data_assets_iterator(DataAssetSearchParams(), prefetch=2, raw=True)
+
+        self.assertEqual([r["id"] for r in results], ["a", "b"])
+
+    def test_pipelines(self):
+        session = MagicMock()
+        session.post.return_value.json.return_value = {"has_more": False, "results": [{"id": "p-1"}]}
+
+        results = list(Pipelines(client=session).search_pipelines_iterator(CapsuleSearchParams(), raw=True))
+
+        self.assertEqual(results, [{"id": "p-1"}])
+        self.assertEqual(session.post.call_args.args[0], "pipelines/search")
+        self.assertEqual(Capsules(client=session).search_capsules(CapsuleSearchParams(), raw=True)["results"],
+                         [{"id": "p-1"}])
+
+
+class TestAsyncRawResponses(unittest.IsolatedAsyncioTestCase):
+
+    async def test_search_iterator(self):
+        session = MagicMock()
+        responses = iter([_page(["a"], next_token="t"), _page(["b"])])
+
+        async def post(*args, **kwargs):
+            response = MagicMock()
+            response.json.return_value = next(responses)
+            return response
+
+        session.post = post
+        data_assets = AsyncDataAssets(client=session)
+
+        results = [r async for r in data_assets.search_data_assets_iterator(DataAssetSearchParams(), raw=True)]
+
+        self.assertEqual([r["id"] for r in results], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+import socket
+import threading
+import unittest
+
+import requests
+
+from codeocean.aio.client import AsyncCodeOcean
+from codeocean.client import CodeOcean
+from codeocean.error import Error
+from codeocean.models.data_asset import AWSS3Source, DataAssetParams, DataAssetSearchParams, Source
+from codeocean.retry import RetryPolicy, connection_failed
+from tests.stub_server import StubResponse, StubServer
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1,
+    "name": "Data",
+    "mount": "data",
+    "state": "ready",
+    "type": "dataset",
+    "last_used": 0,
+    "owner": "user-1",
+}
+
+DATA_ASSET_PARAMS = DataAssetParams(
+    name="Data",
+    mount="data",
+    tags=[],
+    source=Source(aws=AWSS3Source(bucket="bucket")),
+)
+
+
+class FailingHandler:
+    """Fails the first `failures` requests with a status code, then succeeds."""
+
+    def __init__(self, failures, status=503):
+        self.failures = failures
+        self.status = status
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.failures -= 1
+            if self.failures >= 0:
+                return StubResponse(self.status, {"message": "unavailable"})
+        if request.path.endswith("/search"):
+            return StubResponse(200, {"has_more": False, "results": [DATA_ASSET]})
+        return StubResponse(200, DATA_ASSET)
+
+
+def _closed_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test cases for the endpoint-aware retry policy."""
+
+    def test_idempotent(self):
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.idempotent("GET", "data_assets/da-1"))
+        self.assertTrue(policy.idempotent("put", "data_assets/da-1"))
+        self.assertTrue(policy.idempotent("POST", "data_assets/search"))
+        self.assertTrue(policy.idempotent("POST", "computations/comp-1/results"))
+        self.assertFalse(policy.idempotent("POST", "computations"))
+        self.assertFalse(policy.idempotent("POST", "data_assets"))
+        self.assertFalse(policy.idempotent("PATCH", "capsules/cap-1/archive"))
+
+    def test_idempotency_headers(self):
+        policy = RetryPolicy(idempotency_key="Idempotency-Key")
+
+        headers = policy.idempotency_headers("POST", "computations")
+
+        self.assertEqual(list(headers), ["Idempotency-Key"])
+        self.assertNotEqual(headers, policy.idempotency_headers("POST", "computations"))
+        self.assertIsNone(policy.idempotency_headers("POST", "capsules/search"))
+        self.assertIsNone(RetryPolicy().idempotency_headers("POST", "computations"))
+
+    def test_delay(self):
+        policy = RetryPolicy(retries=2, backoff=1, max_backoff=3)
+        unavailable = requests.Response()
+        unavailable.status_code = 503
+        throttled = requests.Response()
+        throttled.status_code = 429
+        throttled.headers["Retry-After"] = "7"
+
+        self.assertLessEqual(policy.delay(0, True, response=unavailable), 1)
+        self.assertLessEqual(policy.delay(1, True, response=unavailable), 2)
+        self.assertIsNone(policy.delay(2, True, response=unavailable))
+        self.assertIsNone(policy.delay(0, False, response=unavailable))
+        self.assertEqual(policy.delay(0, False, response=throttled), 7)
+        self.assertIsNotNone(policy.delay(0, False, sent=False))
+        self.assertIsNone(policy.delay(0, False))
+        self.assertEqual((policy.stats.retries, policy.stats.exhausted), (4, 1))
+
+    def test_invalid_retries(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(retries=-1)
+
+    def test_connection_failed(self):
+        with self.assertRaises(requests.ConnectionError) as cm:
+            requests.get(f"http://127.0.0.1:{_closed_port()}/")
+
+        self.assertTrue(connection_failed(cm.exception))
+        self.assertFalse(connection_failed(requests.ReadTimeout()))
+
+
+class TestClientRetries(unittest.TestCase):
+    """Test cases for retrying the client's failed requests."""
+
+    def _client(self, server, **kwargs):
+        return CodeOcean(domain=server.url, token="token", retry=RetryPolicy(backoff=0, **kwargs))
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(CodeOcean(domain="https://example.com", token="token").session.retry_policy)
+
+    def test_reads_retried(self):
+        with StubServer(FailingHandler(2)) as server:
+            client = self._client(server)
+            data_asset = client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(data_asset.id, "da-1")
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(client.session.retry_policy.stats.retries, 2)
+
+    def test_searches_retried(self):
+        with StubServer(FailingHandler(1, status=502)) as server:
+            client = self._client(server)
+            results = client.data_assets.search_data_assets(DataAssetSearchParams(limit=1))
+
+        self.assertEqual(results.results[0].id, "da-1")
+        self.assertEqual(len(server.requests), 2)
+
+    def test_retries_exhausted(self):
+        with StubServer(FailingHandler(5)) as server:
+            client = self._client(server, retries=2)
+            with self.assertRaises(Error):
+                client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(client.session.retry_policy.stats.exhausted, 1)
+
+    def test_client_errors_not_retried(self):
+        with StubServer(FailingHandler(1, status=404)) as server:
+            client = self._client(server)
+            with self.assertRaises(Error):
+                client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(len(server.requests), 1)
+
+    def test_creates_not_retried(self):
+        with StubServer(FailingHandler(1)) as server:
+            client = self._client(server)
+            with self.assertRaises(Error):
+                client.data_assets.create_data_asset(DATA_ASSET_PARAMS)
+
+        self.assertEqual(len(server.requests), 1)
+
+    def test_creates_retried_with_idempotency_key(self):
+        with StubServer(FailingHandler(1)) as server:
+            client = self._client(server, idempotency_key="Idempotency-Key")
+            client.data_assets.create_data_asset(DATA_ASSET_PARAMS)
+
+        keys = [r.headers.get("Idempotency-Key") for r in server.requests]
+        self.assertEqual(len(keys), 2)
+        self.assertIsNotNone(keys[0])
+        self.assertEqual(keys[0], keys[1])
+
+    def test_creates_retried_on_connection_failure(self):
+        client = CodeOcean(
+            domain=f"http://127.0.0.1:{_closed_port()}", token="token", retry=RetryPolicy(retries=2, backoff=0),
+        )
+        with self.assertRaises(requests.ConnectionError):
+            client.data_assets.create_data_asset(DATA_ASSET_PARAMS)
+
+        self.assertEqual(client.session.retry_policy.stats.retries, 2)
+
+
+class TestAsyncClientRetries(unittest.IsolatedAsyncioTestCase):
+    """Test cases for retrying the asynchronous client's failed requests."""
+
+    async def test_reads_retried(self):
+        with StubServer(FailingHandler(1)) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token", retry=RetryPolicy(backoff=0)) as client:
+                data_asset = await client.data_assets.get_data_asset("da-1")
+
+        self.assertEqual(data_asset.id, "da-1")
+        self.assertEqual(len(server.requests), 2)
+
+    async def test_creates_not_retried(self):
+        with StubServer(FailingHandler(1)) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token", retry=RetryPolicy(backoff=0)) as client:
+                with self.assertRaises(Error):
+                    await client.data_assets.create_data_asset(DATA_ASSET_PARAMS)
+
+        self.assertEqual(len(server.requests), 1)
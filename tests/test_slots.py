@@ -0,0 +1,89 @@
+import copy
+import inspect
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError, dataclass, fields, is_dataclass, replace
+
+from codeocean.models import capsule, components, computation, data_asset, folder
+from codeocean.models.data_asset import DataAsset, DataAssetState
+from codeocean.slots import add_slots
+
+
+MODELS = [
+    obj
+    for module in (capsule, components, computation, data_asset, folder)
+    for obj in vars(module).values()
+    if is_dataclass(obj) and obj.__module__ == module.__name__
+]
+
+DATA_ASSET = {
+    "id": "da-1",
+    "created": 1,
+    "name": "Data",
+    "mount": "data",
+    "state": "ready",
+    "type": "dataset",
+    "last_used": 0,
+    "owner": "user-1",
+    "tags": ["a"],
+    "provenance": {"capsule": "cap-1"},
+}
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_models_are_slotted(self):
+        self.assertGreater(len(MODELS), 40)
+        for cls in MODELS:
+            with self.subTest(model=cls.__name__):
+                self.assertEqual(cls.__slots__, tuple(f.name for f in fields(cls)))
+                self.assertEqual(list(inspect.signature(cls).parameters), [f.name for f in fields(cls)])
+                self.assertTrue(hasattr(cls, "from_dict"))
+
+    def test_instances(self):
+        asset = DataAsset.from_dict(DATA_ASSET)
+
+        self.assertFalse(hasattr(asset, "__dict__"))
+        self.assertIs(asset.state, DataAssetState.Ready)
+        self.assertIsNone(asset.description)
+        self.assertEqual(asset.to_dict()["tags"], ["a"])
+        self.assertEqual(DataAsset.from_dict(asset.to_dict()), asset)
+        self.assertEqual(DataAsset.from_json(asset.to_json()), asset)
+        self.assertEqual(replace(asset, name="Other").name, "Other")
+        self.assertNotEqual(replace(asset, name="Other"), asset)
+
+        with self.assertRaises(FrozenInstanceError):
+            asset.name = "Other"
+        with self.assertRaises(AttributeError):
+            object.__setattr__(asset, "extra", 1)
+
+    def test_pickle_and_copy(self):
+        asset = DataAsset.from_dict(DATA_ASSET)
+
+        self.assertEqual(pickle.loads(pickle.dumps(asset)), asset)
+        self.assertEqual(copy.copy(asset), asset)
+        self.assertEqual(copy.deepcopy(asset), asset)
+
+    def test_add_slots_with_inheritance(self):
+        @add_slots
+        @dataclass(frozen=True)
+        class Base:
+            a: int
+            b: int = 2
+
+        @add_slots
+        @dataclass(frozen=True)
+        class Child(Base):
+            c: int = 3
+
+        self.assertEqual(Child.__slots__, ("c",))
+        self.assertEqual(Child(1), Child(a=1, b=2, c=3))
+        self.assertFalse(hasattr(Child(1), "__dict__"))
+        self.assertEqual(Base.__qualname__, "TestSlots.test_add_slots_with_inheritance.<locals>.Base")
+
+        with self.assertRaises(TypeError):
+            add_slots(Base)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import json
+import unittest
+
+from codeocean import CodeOcean
+from codeocean.aio import AsyncCodeOcean
+from codeocean.error import Error
+from codeocean.json_backend import StdlibJSON
+from codeocean.models.computation import Computation
+from codeocean.models.folder import FolderItem
+from codeocean.streaming import JSONArrayParser, iter_json_array
+from tests.stub_server import StubResponse, StubServer
+
+
+def _chunks(document: str, size: int):
+    data = document.encode()
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class _CountingJSON(StdlibJSON):
+    def __init__(self):
+        self.decoded = []
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+def _computation(i):
+    return {"id": f"c-{i}", "created": i, "name": f"Run {i}", "owner": "u", "run_time": 1, "state": "completed"}
+
+
+class TestJSONArrayParser(unittest.TestCase):
+
+    def test_chunk_boundaries(self):
+        document = '[ {"a": 1, "s": "ü\\"]"}, 123, -4.5e3, "x", [1, [2]], null, true, false ]'
+        for size in (1, 2, 3, 7, 1000):
+            with self.subTest(size=size):
+                self.assertEqual(list(iter_json_array(_chunks(document, size))), json.loads(document))
+
+    def test_key(self):
+        document = '{"other": {"items": [0]}, "n": 12, "items": [{"p": "a"}, {"p": "b"}], "z": 1}'
+        for size in (1, 5, 1000):
+            with self.subTest(size=size):
+                self.assertEqual(list(iter_json_array(_chunks(document, size), "items")), [{"p": "a"}, {"p": "b"}])
+        self.assertEqual(list(iter_json_array([b'{"other": 1}'], "items")), [])
+        self.assertEqual(list(iter_json_array([b'[]'])), [])
+
+    def test_yields_items_as_they_arrive(self):
+        parser = JSONArrayParser()
+
+        self.assertEqual(parser.feed(b'[{"a": 1}, {"b"'), [{"a": 1}])
+        self.assertEqual(parser.feed(b': 2}, 3'), [{"b": 2}])
+        self.assertEqual(parser.feed(b'4]'), [34])
+        self.assertTrue(parser.done)
+        self.assertEqual(parser.close(), [])
+
+    def test_buffer_holds_only_incomplete_item(self):
+        parser = JSONArrayParser()
+        parser.feed(b"[")
+        for i in range(1000):
+            parser.feed(json.dumps(_computation(i)).encode() + b", ")
+            self.assertLess(len(parser._buffer), 10)
+
+    def test_decodes_each_item_once_with_backend(self):
+        backend = _CountingJSON()
+        large = {"values": list(range(2000)), "text": "a\\\"b" * 500}
+        document = json.dumps({"items": [large, 1]})
+
+        items = list(iter_json_array(_chunks(document, 3), "items", backend))
+
+        self.assertEqual(items, [large, 1])
+        self.assertEqual(backend.decoded, [b'"items"', json.dumps(large).encode(), b"1"])
+
+    def test_invalid_documents(self):
+        for document, key in [
+            ("[1, 2", None),
+            ("[1 2]", None),
+            ("[1,]", None),
+            ("", None),
+            ("{}", None),
+            ('{"items": [1,', "items"),
+            ('{"items": 3}', "items"),
+        ]:
+            with self.subTest(document=document):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(iter_json_array(_chunks(document, 2) or [b""], key))
+
+
+def _handler(request):
+    if "missing" in request.path:
+        return StubResponse(status=404, body={"message": "not found"})
+    if request.path.endswith("/computations"):
+        return StubResponse(body=[_computation(i) for i in range(500)])
+    path = json.loads(request.body)["path"]
+    return StubResponse(body={"items": [
+        {"name": f"f{i}", "path": f"{path}/f{i}", "type": "file", "size": i} for i in range(300)
+    ]})
+
+
+class TestStreamingClient(unittest.TestCase):
+
+    def test_list_computations_iterator(self):
+        with StubServer(_handler) as server:
+            client = CodeOcean(domain=server.url, token="token")
+            computations = list(client.capsules.list_computations_iterator("cap-1"))
+            raw = list(client.pipelines.list_computations_iterator("pipe-1", raw=True))
+
+        self.assertEqual(computations, [Computation.from_dict(_computation(i)) for i in range(500)])
+        self.assertEqual(raw, [_computation(i) for i in range(500)])
+        self.assertEqual(server.requests[1].path, "/api/v1/pipelines/pipe-1/computations")
+
+    def test_list_files_iterators(self):
+        with StubServer(_handler) as server:
+            client = CodeOcean(domain=server.url, token="token")
+            files = list(client.data_assets.list_data_asset_files_iterator("da-1", "dir"))
+            results = client.computations.list_computation_results_iterator("c-1")
+            first = next(results)
+            results.close()
+
+        self.assertEqual(len(files), 300)
+        self.assertEqual(files[1], FolderItem(name="f1", path="dir/f1", type="file", size=1))
+        self.assertEqual(first.path, "/f0")
+
+    def test_error(self):
+        with StubServer(_handler) as server:
+            client = CodeOcean(domain=server.url, token="token")
+            with self.assertRaises(Error) as cm:
+                list(client.data_assets.list_data_asset_files_iterator("missing"))
+
+        self.assertEqual(cm.exception.status_code, 404)
+        self.assertEqual(cm.exception.message, "not found")
+
+
+class TestAsyncStreamingClient(unittest.IsolatedAsyncioTestCase):
+
+    async def test_iterators(self):
+        with StubServer(_handler) as server:
+            async with AsyncCodeOcean(domain=server.url, token="token") as client:
+                computations = [c async for c in client.capsules.list_computations_iterator("cap-1")]
+                files = [f async for f in client.data_assets.list_data_asset_files_iterator("da-1", raw=True)]
+                results = [f async for f in client.computations.list_computation_results_iterator("c-1")]
+
+        self.assertEqual(computations[-1], Computation.from_dict(_computation(499)))
+        self.assertEqual(files[0], {"name": "f0", "path": "/f0", "type": "file", "size": 0})
+        self.assertEqual(len(results), 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
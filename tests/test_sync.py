@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from codeocean.client import CodeOcean
+from codeocean.sync import _local_path
+from tests.stub_server import FileTreeHandler, StubServer
+
+FILES = {
+    "summary.txt": b"done\n",
+    "tables/a.csv": b"x,y\n" * 1000,
+    "tables/b.csv": b"1,2\n" * 10,
+    "tables/deep/c.bin": bytes(range(256)) * 100,
+}
+
+
+class TestSync(unittest.TestCase):
+    """Test cases for mirroring result and data asset folders to local disk."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.handler = FileTreeHandler(FILES)
+        self.server = StubServer(self.handler)
+        self.handler.server = self.server
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.client = CodeOcean(domain=self.server.url, token="token")
+
+    def _read(self, *path):
+        with open(os.path.join(self.dir.name, *path), "rb") as f:
+            return f.read()
+
+    def test_sync_results(self):
+        """All result files are downloaded into the local directory tree."""
+        report = self.client.computations.sync_results("comp-1", self.dir.name)
+
+        for path, content in FILES.items():
+            self.assertEqual(self._read(*path.split("/")), content)
+        self.assertEqual(report.files_downloaded, 4)
+        self.assertEqual(report.files_skipped, 0)
+        self.assertEqual(report.bytes_downloaded, sum(len(c) for c in FILES.values()))
+        self.assertGreater(report.throughput, 0)
+
+    def test_sync_results_skips_unchanged(self):
+        """Re-running a sync only downloads missing or changed files."""
+        self.client.computations.sync_results("comp-1", self.dir.name)
+        self.handler.downloaded.clear()
+
+        with open(os.path.join(self.dir.name, "tables", "b.csv"), "wb") as f:
+            f.write(b"truncated")
+        os.remove(os.path.join(self.dir.name, "summary.txt"))
+
+        report = self.client.computations.sync_results("comp-1", self.dir.name)
+
+        self.assertEqual(sorted(self.handler.downloaded), ["summary.txt", "tables/b.csv"])
+        self.assertEqual(report.files_downloaded, 2)
+        self.assertEqual(report.files_skipped, 2)
+        self.assertEqual(self._read("tables", "b.csv"), FILES["tables/b.csv"])
+
+    def test_session_is_closed(self):
+        """The session shared by the file downloads is closed once the sync is done."""
+        closing = patch.object(requests.Session, "close", autospec=True, side_effect=requests.Session.close)
+        with closing as close:
+            self.client.computations.sync_results("comp-1", self.dir.name)
+
+        close.assert_called_once()
+
+    def test_sync_data_asset_subfolder(self):
+        """Syncing a subfolder strips its prefix from local paths."""
+        report = self.client.data_assets.sync_data_asset_files("da-1", self.dir.name, path="tables")
+
+        self.assertEqual(report.files_downloaded, 3)
+        self.assertEqual(self._read("deep", "c.bin"), FILES["tables/deep/c.bin"])
+        self.assertFalse(os.path.exists(os.path.join(self.dir.name, "summary.txt")))
+
+    def test_local_path_outside_root(self):
+        """Item paths escaping the local directory are rejected."""
+        with self.assertRaises(ValueError):
+            _local_path(self.dir.name, "", "../escape.txt")
@@ -0,0 +1,157 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from codeocean.aio.computation import AsyncComputations
+from codeocean.aio.data_asset import AsyncDataAssets
+from codeocean.computation import Computations
+from codeocean.data_asset import DataAssets
+from codeocean.models.computation import Computation, ComputationState
+from codeocean.models.data_asset import DataAsset, DataAssetState, DataAssetType
+
+
+class _Clock:
+    """Fake clock advanced by sleep()."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    async def async_sleep(self, seconds):
+        self.now += seconds
+
+
+def _computation(id, state):
+    return Computation(id=id, created=0, name=id, owner="owner", run_time=0, state=state)
+
+
+def _data_asset(id, state):
+    return DataAsset(
+        id=id, created=0, name=id, mount=id, last_used=0, owner="owner", state=state, type=DataAssetType.Dataset,
+    )
+
+
+class TestWaitMany(unittest.TestCase):
+    """Test cases for waiting on many computations and data assets from one polling loop."""
+
+    def setUp(self):
+        self.clock = _Clock()
+        for name in ["monotonic", "sleep"]:
+            patcher = patch(f"codeocean.polling.{name}", getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _computations(self, polls_until_done):
+        """Build a Computations client whose computations complete after the given number of polls."""
+        computations = Computations(client=MagicMock())
+        polls = {id: 0 for id in polls_until_done}
+        self.poll_times = []
+
+        def get_computation(id):
+            self.poll_times.append(self.clock.now)
+            polls[id] += 1
+            done = polls[id] >= polls_until_done[id]
+            return _computation(id, ComputationState.Completed if done else ComputationState.Running)
+
+        computations.get_computation = get_computation
+        return computations
+
+    def test_as_completed_yields_in_completion_order(self):
+        """Computations are yielded as soon as they complete, not in input order."""
+        computations = self._computations({"a": 3, "b": 1, "c": 2})
+        inputs = [_computation(id, ComputationState.Running) for id in ["a", "b", "c"]]
+
+        done = [c.id for c in computations.as_completed(inputs)]
+
+        self.assertEqual(done, ["b", "c", "a"])
+
+    def test_polls_share_rate_budget(self):
+        """Status checks across all computations respect the shared request rate."""
+        computations = self._computations({id: 2 for id in "abcdefghij"})
+        inputs = [_computation(id, ComputationState.Running) for id in "abcdefghij"]
+
+        list(computations.as_completed(inputs, polling_interval=5, max_requests_per_second=4))
+
+        self.assertEqual(len(self.poll_times), 20)
+        gaps = [b - a for a, b in zip(self.poll_times, self.poll_times[1:])]
+        self.assertGreaterEqual(min(gaps), 0.25 - 1e-9)
+
+    def test_wait_many_preserves_input_order(self):
+        """wait_many returns the final computations in input order."""
+        computations = self._computations({"a": 3, "b": 1})
+        inputs = [_computation(id, ComputationState.Running) for id in ["a", "b"]]
+
+        results = computations.wait_many(inputs)
+
+        self.assertEqual([c.id for c in results], ["a", "b"])
+        self.assertTrue(all(c.state == ComputationState.Completed for c in results))
+
+    def test_timeout_lists_pending(self):
+        """A timeout reports the computations that didn't complete."""
+        computations = self._computations({"a": 1, "b": 100})
+        inputs = [_computation(id, ComputationState.Running) for id in ["a", "b"]]
+
+        with self.assertRaisesRegex(TimeoutError, "Computations b did not finish within 30 seconds"):
+            computations.wait_many(inputs, timeout=30)
+
+    def test_invalid_polling_interval(self):
+        """Polling intervals below the minimum are rejected."""
+        computations = self._computations({"a": 1})
+        with self.assertRaises(ValueError):
+            computations.wait_many([_computation("a", ComputationState.Running)], polling_interval=1)
+
+    def test_as_completed_validates_eagerly(self):
+        """as_completed rejects invalid arguments when called, before iteration starts."""
+        computations = self._computations({"a": 1})
+        with self.assertRaises(ValueError):
+            computations.as_completed([_computation("a", ComputationState.Running)], polling_interval=1)
+        with self.assertRaises(ValueError):
+            DataAssets(client=MagicMock()).as_completed([_data_asset("x", DataAssetState.Draft)], timeout=-1)
+        with self.assertRaises(ValueError):
+            AsyncComputations(client=MagicMock()).as_completed(
+                [_computation("a", ComputationState.Running)], polling_interval=1,
+            )
+        with self.assertRaises(ValueError):
+            computations.as_completed([], max_requests_per_second=0)
+        with self.assertRaises(ValueError):
+            AsyncDataAssets(client=MagicMock()).as_completed([], max_requests_per_second=0)
+
+    def test_data_assets_as_completed(self):
+        """Data assets are yielded once they are ready or failed."""
+        states = {"x": [DataAssetState.Draft, DataAssetState.Ready], "y": [DataAssetState.Failed]}
+        data_assets = DataAssets(client=MagicMock())
+        data_assets.get_data_asset = lambda id: _data_asset(id, states[id].pop(0))
+        inputs = [_data_asset(id, DataAssetState.Draft) for id in ["x", "y"]]
+
+        done = [(da.id, da.state) for da in data_assets.as_completed(inputs)]
+
+        self.assertEqual(done, [("y", DataAssetState.Failed), ("x", DataAssetState.Ready)])
+
+
+class TestAsyncWaitMany(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async multi-computation waiter."""
+
+    async def test_wait_many(self):
+        """The async waiter polls from one task and returns results in input order."""
+        clock = _Clock()
+        polls = {"a": 0, "b": 0}
+
+        async def get_computation(id):
+            polls[id] += 1
+            done = polls[id] >= {"a": 2, "b": 1}[id]
+            return _computation(id, ComputationState.Completed if done else ComputationState.Running)
+
+        computations = AsyncComputations(client=MagicMock())
+        computations.get_computation = get_computation
+        inputs = [_computation(id, ComputationState.Running) for id in ["a", "b"]]
+
+        with patch("codeocean.polling.monotonic", clock.monotonic), \
+                patch("codeocean.aio.polling.sleep", clock.async_sleep):
+            results = await computations.wait_many(inputs)
+
+        self.assertEqual([c.id for c in results], ["a", "b"])
+        self.assertEqual(polls, {"a": 2, "b": 1})
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from codeocean.aio.walk import walk_folder as awalk_folder
+from codeocean.computation import Computations
+from codeocean.models.folder import Folder, FolderItem
+from codeocean.walk import walk_folder
+
+# Folder path -> (subfolders, files)
+TREE = {
+    "": (["a", "b"], ["root.txt"]),
+    "a": (["a/x", "a/y"], ["a/1.csv", "a/2.txt"]),
+    "b": ([], ["b/3.csv"]),
+    "a/x": ([], ["a/x/4.csv"]),
+    "a/y": (["a/y/z"], []),
+    "a/y/z": ([], ["a/y/z/5.csv"]),
+}
+
+
+def _folder(path):
+    folders, files = TREE[path]
+    return Folder(items=[
+        *(FolderItem(name=p.rsplit("/", 1)[-1], path=p, type="folder") for p in folders),
+        *(FolderItem(name=p.rsplit("/", 1)[-1], path=p, type="file", size=1) for p in files),
+    ])
+
+
+class _Lister:
+    """Fake folder listing that records the maximum number of concurrent calls."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, path):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return _folder(path)
+
+
+class TestWalk(unittest.TestCase):
+    """Test cases for concurrent recursive folder walks."""
+
+    def test_walk_all_items(self):
+        """All files and folders in the tree are yielded."""
+        paths = {item.path for item in walk_folder(_Lister())}
+        expected = {p for folders, files in TREE.values() for p in folders + files}
+        self.assertEqual(paths, expected)
+
+    def test_walk_bounded_parallelism(self):
+        """No more than max_workers listings run at the same time."""
+        lister = _Lister()
+        list(walk_folder(lister, max_workers=2))
+        self.assertLessEqual(lister.max_active, 2)
+        self.assertGreater(lister.max_active, 1)
+
+    def test_walk_max_depth(self):
+        """max_depth limits how many subfolder levels are expanded."""
+        self.assertEqual({i.path for i in walk_folder(_Lister(), max_depth=0)}, {"a", "b", "root.txt"})
+        self.assertEqual(
+            {i.path for i in walk_folder(_Lister(), max_depth=1)},
+            {"a", "b", "root.txt", "a/x", "a/y", "a/1.csv", "a/2.txt", "b/3.csv"},
+        )
+
+    def test_walk_pattern(self):
+        """Only items matching the glob pattern are yielded, at any depth."""
+        paths = {i.path for i in walk_folder(_Lister(), pattern="*.csv")}
+        self.assertEqual(paths, {"a/1.csv", "b/3.csv", "a/x/4.csv", "a/y/z/5.csv"})
+
+    def test_walk_computation_results(self):
+        """walk_computation_results lists folders through the computation results API."""
+        session = MagicMock()
+
+        def post(route, json):
+            response = MagicMock()
+            response.json.return_value = _folder(json["path"]).to_dict()
+            return response
+
+        session.post.side_effect = post
+        computations = Computations(client=session)
+
+        paths = {i.path for i in computations.walk_computation_results("comp-1", path="a", pattern="*.csv")}
+
+        self.assertEqual(paths, {"a/1.csv", "a/x/4.csv", "a/y/z/5.csv"})
+        self.assertEqual(session.post.call_args_list[0].args[0], "computations/comp-1/results")
+
+
+class TestAsyncWalk(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async concurrent folder walk."""
+
+    async def test_walk_bounded_parallelism(self):
+        """All items are yielded with at most max_workers listings in flight."""
+        active = 0
+        max_active = 0
+
+        async def list_folder(path):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _folder(path)
+
+        paths = {item.path async for item in awalk_folder(list_folder, max_workers=2)}
+
+        self.assertEqual(paths, {p for folders, files in TREE.values() for p in folders + files})
+        self.assertLessEqual(max_active, 2)